@@ -0,0 +1,323 @@
+import os
+import json
+import time
+import uuid
+import queue
+import sqlite3
+import logging
+import threading
+from collections import deque
+
+# Job states
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+# Finished jobs are kept for a week, and purged at most every ten minutes
+DEFAULT_RETENTION_SECONDS = 7 * 24 * 3600
+PURGE_INTERVAL_SECONDS = 600
+
+
+class QueueFullError(Exception):
+    """Raised when the analysis queue cannot accept more jobs"""
+
+
+def _read_boot_id():
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+BOOT_ID = _read_boot_id()
+
+
+def _process_start_time(pid):
+    """Start time of a process in clock ticks since boot, or None if it is gone or unknown"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # Fields after the parenthesised command name; starttime is field 22
+    return stat.rsplit(")", 1)[1].split()[19]
+
+
+def process_token(pid=None):
+    """
+    Identify a process across restarts as "boot id/pid/start time": a pid
+    alone is reused after a container restart, the start time is not.
+    """
+    pid = pid or os.getpid()
+    return f"{BOOT_ID}/{pid}/{_process_start_time(pid) or ''}"
+
+
+def is_owner_alive(owner):
+    """True if the process identified by a process_token is still running"""
+    try:
+        boot_id, pid, start_time = owner.split("/")
+        pid = int(pid)
+    except (AttributeError, ValueError):
+        return False
+    if boot_id != BOOT_ID:
+        return False
+    if start_time:
+        return _process_start_time(pid) == start_time
+    # No /proc: fall back to checking that the pid exists
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class AnalysisQueue:
+    """
+    Local job queue for resume analysis, persisted in SQLite.
+
+    Uploads are stored on disk and their job ids pushed onto a bounded
+    in-memory queue served by a pool of worker threads. Job state (status,
+    per-stage progress, result) lives in SQLite so it survives restarts;
+    jobs that were queued or running when the process stopped are picked
+    up again on start. Several processes may share one database: every job
+    records the process that owns it (see process_token) and only the jobs
+    of processes that are gone are taken over. Finished jobs are deleted
+    once they are older than the retention period.
+    """
+
+    def __init__(self, db_path, upload_dir, task, workers=2, max_queued=32,
+                 retention=DEFAULT_RETENTION_SECONDS):
+        """
+        Args:
+            db_path (str): SQLite database file
+            upload_dir (str): Directory where queued uploads are kept until processed
+            task (callable): task(file_path, progress) -> result dict, where
+                             progress(stage, state) records per-stage progress
+            workers (int): Number of worker threads
+            max_queued (int): Maximum number of jobs waiting to run
+            retention (float): Seconds finished jobs and their results are
+                               kept (0 keeps them forever)
+        """
+        self.db_path = db_path
+        self.upload_dir = upload_dir
+        self.task = task
+        self.workers = workers
+        self.retention = retention
+        self._last_purge = 0.0
+        self._queue = queue.Queue(maxsize=max_queued)
+        # Recovered jobs that did not fit in the queue, fed in as it drains
+        self._backlog = deque()
+        self._lock = threading.Lock()
+        self._threads = []
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        os.makedirs(upload_dir, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS analysis_jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    stage TEXT,
+                    progress TEXT NOT NULL DEFAULT '{}',
+                    result TEXT,
+                    error TEXT,
+                    filename TEXT,
+                    upload_path TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    owner TEXT
+                )
+            """)
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(analysis_jobs)")}
+            if "owner" not in columns:
+                self._conn.execute("ALTER TABLE analysis_jobs ADD COLUMN owner TEXT")
+
+    def start(self):
+        """Start the worker threads and re-enqueue unfinished jobs"""
+        if self._threads:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"analysis-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self.purge()
+        self._recover()
+
+    def _recover(self):
+        # Several server processes may share the database (e.g. gunicorn
+        # workers): unfinished jobs are only taken over when their owning
+        # process is gone, and the conditional update makes sure a single
+        # process takes each of them
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, status, owner FROM analysis_jobs WHERE status IN (?, ?) ORDER BY created_at",
+                (STATUS_QUEUED, STATUS_RUNNING)
+            ).fetchall()
+        owner = process_token()
+        for row in rows:
+            if is_owner_alive(row["owner"]):
+                continue
+            with self._lock, self._conn:
+                taken = self._conn.execute(
+                    "UPDATE analysis_jobs SET status = ?, owner = ?, updated_at = ? "
+                    "WHERE id = ? AND status = ? AND owner IS ?",
+                    (STATUS_QUEUED, owner, time.time(), row["id"], row["status"], row["owner"])
+                ).rowcount
+            if not taken:
+                continue
+            try:
+                self._queue.put_nowait(row["id"])
+            except queue.Full:
+                # Stays queued (and owned by this process) until there is room
+                self._backlog.append(row["id"])
+
+    def _refill(self):
+        """Move recovered jobs waiting in the backlog into the queue while it has room"""
+        while self._backlog:
+            try:
+                job_id = self._backlog.popleft()
+            except IndexError:
+                return
+            try:
+                self._queue.put_nowait(job_id)
+            except queue.Full:
+                self._backlog.appendleft(job_id)
+                return
+
+    def purge(self, now=None):
+        """Delete finished jobs (and any upload left behind) older than the retention period"""
+        if not self.retention:
+            return 0
+        cutoff = (now or time.time()) - self.retention
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT id, upload_path FROM analysis_jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (STATUS_COMPLETED, STATUS_FAILED, cutoff)
+            ).fetchall()
+            self._conn.executemany("DELETE FROM analysis_jobs WHERE id = ?", [(row["id"],) for row in rows])
+        for row in rows:
+            if row["upload_path"]:
+                self._remove_upload(row["upload_path"])
+        self._last_purge = time.monotonic()
+        return len(rows)
+
+    def submit(self, file_bytes, filename):
+        """Store an upload and enqueue it; returns the new job id"""
+        if self.retention and time.monotonic() - self._last_purge > PURGE_INTERVAL_SECONDS:
+            self.purge()
+        job_id = uuid.uuid4().hex
+        upload_path = os.path.join(self.upload_dir, f"{job_id}.pdf")
+        with open(upload_path, "wb") as f:
+            f.write(file_bytes)
+
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO analysis_jobs (id, status, filename, upload_path, created_at, updated_at, owner) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, STATUS_QUEUED, filename, upload_path, now, now, process_token())
+            )
+
+        try:
+            self._queue.put_nowait(job_id)
+        except queue.Full:
+            self._update(job_id, status=STATUS_FAILED, error="Analysis queue is full")
+            self._remove_upload(upload_path)
+            raise QueueFullError("Analysis queue is full, try again later")
+        return job_id
+
+    def get(self, job_id):
+        """Return the job's status, progress and result, or None if unknown"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM analysis_jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = {
+            "job_id": row["id"],
+            "status": row["status"],
+            "stage": row["stage"],
+            "progress": json.loads(row["progress"]),
+            "filename": row["filename"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+        if row["result"] is not None:
+            job["result"] = json.loads(row["result"])
+        if row["error"]:
+            job["error"] = row["error"]
+        return job
+
+    def stats(self):
+        """Return the number of jobs per status and the current queue depth"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) AS n FROM analysis_jobs GROUP BY status").fetchall()
+        return {
+            "queued_in_memory": self._queue.qsize(),
+            "recovery_backlog": len(self._backlog),
+            "max_queued": self._queue.maxsize,
+            "workers": self.workers,
+            "jobs": {row["status"]: row["n"] for row in rows},
+        }
+
+    def _update(self, job_id, **fields):
+        fields["updated_at"] = time.time()
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock, self._conn:
+            self._conn.execute(f"UPDATE analysis_jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+
+    @staticmethod
+    def _remove_upload(upload_path):
+        try:
+            os.remove(upload_path)
+        except OSError:
+            pass
+
+    def _work(self):
+        while True:
+            job_id = self._queue.get()
+            try:
+                self._run(job_id)
+            except Exception as e:
+                logging.error(f"Unexpected error in analysis job {job_id}: {str(e)}")
+            finally:
+                self._queue.task_done()
+                self._refill()
+
+    def _run(self, job_id):
+        with self._lock:
+            row = self._conn.execute("SELECT upload_path FROM analysis_jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return
+        upload_path = row["upload_path"]
+
+        progress = {}
+        with self._lock, self._conn:
+            claimed = self._conn.execute(
+                "UPDATE analysis_jobs SET status = ?, progress = ?, owner = ?, updated_at = ? "
+                "WHERE id = ? AND status = ?",
+                (STATUS_RUNNING, json.dumps(progress), process_token(), time.time(), job_id, STATUS_QUEUED)
+            ).rowcount
+        if not claimed:
+            return  # Already taken by another process
+
+        def report(stage, state):
+            progress[stage] = state
+            self._update(job_id, stage=stage, progress=json.dumps(progress))
+
+        try:
+            result = self.task(upload_path, report)
+            if isinstance(result, dict) and result.get("error"):
+                self._update(job_id, status=STATUS_FAILED, result=json.dumps(result), error=result["error"])
+            else:
+                self._update(job_id, status=STATUS_COMPLETED, result=json.dumps(result))
+        except Exception as e:
+            logging.error(f"Analysis job {job_id} failed: {str(e)}")
+            self._update(job_id, status=STATUS_FAILED, error=str(e))
+        finally:
+            self._remove_upload(upload_path)
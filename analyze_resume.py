@@ -3,14 +3,17 @@ import os
 import json
 import re
 import numpy as np
-import joblib
 import logging
 from datetime import datetime
 from collections import Counter
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from processing.skill_extractor import extract_text_from_pdf, get_skills
+from processing.skill_extractor import extract_text_with_sources, get_skills
+from processing.model_registry import get_model
+from processing.metrics import time_stage, timed_stage, stage_errors
+from processing.skill_matcher import SkillMatcher, get_skill_matcher
+import processing.job_skill_index  # registers the "job_skill_index" model
 # Create logs directory if it doesn't exist
 logs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
 os.makedirs(logs_dir, exist_ok=True)
@@ -22,31 +25,52 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-def analyze_resume(resume_path):
+def describe_resume(resume):
+    """Short label for a resume argument, for logging"""
+    if resume is None:
+        return "<text only>"
+    if isinstance(resume, (str, os.PathLike)):
+        return os.fspath(resume)
+    if isinstance(resume, (bytes, bytearray, memoryview)):
+        return f"<{len(resume)} bytes in memory>"
+    return getattr(resume, "filename", None) or getattr(resume, "name", None) or "<file object>"
+
+@timed_stage("analyze_resume")
+def analyze_resume(resume, resume_text=None, extracted_skills=None):
     """
     Analyze a resume and return extracted skills and job recommendations
+
+    resume is the PDF as a path, bytes or a binary file object; uploads can
+    be passed straight through without being written to disk.
+    resume_text and extracted_skills can be passed in when an earlier stage
+    has already been computed (e.g. from the result cache) to skip it.
     """
     start_time = datetime.now()
-    logging.info(f"Starting analysis for resume: {resume_path}")
+    logging.info(f"Starting analysis for resume: {describe_resume(resume)}")
     
     try:
-        # Extract text from PDF
-        resume_text = extract_text_from_pdf(resume_path)
+        # Extract text from PDF (embedded text layer first, OCR only where needed)
+        text_extraction = None
+        if resume_text is None:
+            resume_text, text_extraction = extract_text_with_sources(resume)
         
         # Extract skills
-        extracted_skills = get_skills(resume_text)
+        if extracted_skills is None:
+            extracted_skills = get_skills(resume_text)
         logging.info(f"Extracted {len(extracted_skills)} skills")
         
         # Categorize skills
-        skill_categories = categorize_skills(extracted_skills)
+        with time_stage("categorize_skills"):
+            skill_categories = categorize_skills(extracted_skills)
         
         # Calculate resume score
-        resume_score = calculate_resume_score(extracted_skills, resume_text)
+        with time_stage("resume_score"):
+            resume_score = calculate_resume_score(extracted_skills, resume_text)
         
-        # Load the trained model
+        # Get the trained model (loaded once per process)
         try:
-            model_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "job_recommender.pkl")
-            model = joblib.load(model_path)
+            with time_stage("model_load"):
+                model = get_model("job_recommender")
         except Exception as model_error:
             logging.error(f"Error loading model: {str(model_error)}")
             return {
@@ -61,42 +85,29 @@ def analyze_resume(resume_path):
         skills_text = ", ".join(extracted_skills)
         
         # Get job titles and probability scores
-        job_titles = model.classes_
-        proba_scores = model.predict_proba([skills_text])[0]
-        
-        # Get top 15 job matches first (to allow for better filtering)
-        top_indices = np.argsort(proba_scores)[-15:][::-1]
-        top_jobs = [job_titles[i] for i in top_indices]
-        top_scores = [proba_scores[i] for i in top_indices]
-        
-        # Enhanced diversity filtering
-        filtered_jobs, filtered_scores = get_diverse_job_recommendations(top_jobs, top_scores)
-        
-        # Format results
-        job_recommendations = []
-        for job, score in zip(filtered_jobs, filtered_scores):
-            confidence = score * 100
-            job_recommendations.append({
-                'title': job,
-                'confidence': f"{confidence:.1f}%",
-                'match_score': int(confidence),
-                'skills_matched': get_matching_skills_for_job(job, extracted_skills)
-            })
+        with time_stage("predict_proba"):
+            proba_scores = model.predict_proba([skills_text])[0]
+        with time_stage("recommend_jobs"):
+            job_recommendations = recommend_jobs(model.classes_, proba_scores, extracted_skills)
         
         # Calculate processing time
         processing_time = (datetime.now() - start_time).total_seconds()
         logging.info(f"Analysis completed in {processing_time:.2f} seconds")
         
-        return {
+        results = {
             'skills': extracted_skills,
             'skill_categories': skill_categories,
             'resume_score': resume_score,
             'job_recommendations': job_recommendations,
             'processing_time': f"{processing_time:.2f} seconds"
         }
+        if text_extraction is not None:
+            results['text_extraction'] = text_extraction
+        return results
         
     except Exception as e:
         logging.error(f"Error analyzing resume: {str(e)}")
+        stage_errors.inc(stage="analyze_resume")
         return {
             'skills': [],
             'skill_categories': {},
@@ -105,21 +116,82 @@ def analyze_resume(resume_path):
             'error': str(e)
         }
 
+def recommend_jobs(job_titles, proba_scores, extracted_skills):
+    """Turn one row of classifier probabilities into diverse, formatted job recommendations"""
+    # Get top 15 job matches first (to allow for better filtering)
+    top_indices = np.argsort(proba_scores)[-15:][::-1]
+    top_jobs = [job_titles[i] for i in top_indices]
+    top_scores = [proba_scores[i] for i in top_indices]
+    
+    # Enhanced diversity filtering
+    filtered_jobs, filtered_scores = get_diverse_job_recommendations(top_jobs, top_scores)
+    
+    # Format results
+    job_recommendations = []
+    for job, score in zip(filtered_jobs, filtered_scores):
+        confidence = score * 100
+        job_recommendations.append({
+            'title': job,
+            'confidence': f"{confidence:.1f}%",
+            'match_score': int(confidence),
+            'skills_matched': get_matching_skills_for_job(job, extracted_skills)
+        })
+    return job_recommendations
+
+def analyze_resume_batch(resume_texts, skills_lists):
+    """
+    Analyze many resumes whose text and skills are already extracted.
+    All rows are scored with a single predict_proba call.
+    
+    Returns:
+        list: One result dict per resume, shaped like analyze_resume's
+    """
+    if not resume_texts:
+        return []
+    
+    start_time = datetime.now()
+    model = get_model("job_recommender")
+    with time_stage("predict_proba_batch"):
+        proba_matrix = model.predict_proba([", ".join(skills) for skills in skills_lists])
+    
+    results = []
+    for resume_text, extracted_skills, proba_scores in zip(resume_texts, skills_lists, proba_matrix):
+        result = {
+            'skills': extracted_skills,
+            'skill_categories': categorize_skills(extracted_skills),
+            'resume_score': calculate_resume_score(extracted_skills, resume_text),
+            'job_recommendations': recommend_jobs(model.classes_, proba_scores, extracted_skills)
+        }
+        # Time from the start of the batch until this row was ready
+        processing_time = (datetime.now() - start_time).total_seconds()
+        result['processing_time'] = f"{processing_time:.2f} seconds"
+        results.append(result)
+    return results
+
+# Keyword lists used to categorize skills
+TECHNICAL_SKILL_KEYWORDS = ['python', 'java', 'javascript', 'react', 'node', 'sql', 'mongodb', 'aws', 'docker', 
+                            'kubernetes', 'machine learning', 'data science', 'tensorflow', 'pytorch']
+SOFT_SKILL_KEYWORDS = ['communication', 'leadership', 'teamwork', 'problem solving', 'critical thinking', 
+                       'time management', 'creativity', 'adaptability', 'collaboration']
+
+# Keywords count anywhere inside a skill ("sql" in "PostgreSQL", "node" in "NodeJS")
+technical_skill_matcher = SkillMatcher(TECHNICAL_SKILL_KEYWORDS, word_bounded=False)
+soft_skill_matcher = SkillMatcher(SOFT_SKILL_KEYWORDS, word_bounded=False)
+
 def categorize_skills(skills):
     """Categorize skills into technical, soft, and domain-specific categories"""
     # This is a simplified implementation - in a real system, you'd have a more comprehensive categorization
-    technical_skills = ['python', 'java', 'javascript', 'react', 'node', 'sql', 'mongodb', 'aws', 'docker', 
-                        'kubernetes', 'machine learning', 'data science', 'tensorflow', 'pytorch']
-    soft_skills = ['communication', 'leadership', 'teamwork', 'problem solving', 'critical thinking', 
-                  'time management', 'creativity', 'adaptability', 'collaboration']
-    
-    categories = {
-        'technical': [skill for skill in skills if any(tech.lower() in skill.lower() for tech in technical_skills)],
-        'soft': [skill for skill in skills if any(soft.lower() in skill.lower() for soft in soft_skills)],
-        'domain': [skill for skill in skills if skill not in 
-                  [s for s in skills if any(tech.lower() in s.lower() for tech in technical_skills)] and
-                  skill not in [s for s in skills if any(soft.lower() in s.lower() for soft in soft_skills)]]
-    }
+    categories = {'technical': [], 'soft': [], 'domain': []}
+    
+    for skill in skills:
+        is_technical = technical_skill_matcher.contains_any(skill)
+        is_soft = soft_skill_matcher.contains_any(skill)
+        if is_technical:
+            categories['technical'].append(skill)
+        if is_soft:
+            categories['soft'].append(skill)
+        if not is_technical and not is_soft:
+            categories['domain'].append(skill)
     
     return categories
 
@@ -184,33 +256,41 @@ def get_diverse_job_recommendations(jobs, scores, max_jobs=5):
     
     return filtered_jobs, filtered_scores
 
+# Define some common job-skill mappings
+JOB_SKILL_MAPPINGS = {
+    'data scientist': ['python', 'r', 'statistics', 'machine learning', 'data analysis', 'sql'],
+    'software engineer': ['java', 'python', 'javascript', 'algorithms', 'data structures'],
+    'web developer': ['html', 'css', 'javascript', 'react', 'node', 'angular'],
+    'product manager': ['product development', 'agile', 'scrum', 'user research', 'roadmap'],
+    'designer': ['ui', 'ux', 'figma', 'sketch', 'adobe', 'design thinking']
+}
+
+job_skill_matchers = {job: SkillMatcher(relevant, word_bounded=False) for job, relevant in JOB_SKILL_MAPPINGS.items()}
+
 def get_matching_skills_for_job(job_title, skills):
     """Get skills that match with a specific job title"""
-    # This is a simplified implementation - in a real system, you'd have a job-skill mapping database
-    job_title_lower = job_title.lower()
+    # Use the job title -> weighted skills index built at training time
+    job_skill_index = get_model("job_skill_index")
+    if job_skill_index.skills_for_title(job_title) is not None:
+        return job_skill_index.match_skills(job_title, skills)
     
-    # Define some common job-skill mappings
-    job_skill_mappings = {
-        'data scientist': ['python', 'r', 'statistics', 'machine learning', 'data analysis', 'sql'],
-        'software engineer': ['java', 'python', 'javascript', 'algorithms', 'data structures'],
-        'web developer': ['html', 'css', 'javascript', 'react', 'node', 'angular'],
-        'product manager': ['product development', 'agile', 'scrum', 'user research', 'roadmap'],
-        'designer': ['ui', 'ux', 'figma', 'sketch', 'adobe', 'design thinking']
-    }
+    # Fallback for titles missing from the index: the hand-written mappings below
+    job_title_lower = job_title.lower()
     
     # Find the closest job title in our mappings
     matching_job = None
-    for known_job in job_skill_mappings.keys():
+    for known_job in JOB_SKILL_MAPPINGS.keys():
         if known_job in job_title_lower or job_title_lower in known_job:
             matching_job = known_job
             break
     
     if matching_job:
-        relevant_skills = job_skill_mappings[matching_job]
-        return [skill for skill in skills if any(relevant.lower() in skill.lower() for relevant in relevant_skills)]
+        relevant_matcher = job_skill_matchers[matching_job]
+        return [skill for skill in skills if relevant_matcher.contains_any(skill)]
     
-    # Fallback: return skills that appear in the job title
-    return [skill for skill in skills if skill.lower() in job_title_lower or any(word.lower() in skill.lower() for word in job_title_lower.split())]
+    # Fallback: return skills that appear in the job title or contain one of its words
+    title_matcher = get_skill_matcher(job_title_lower.split(), word_bounded=False)
+    return [skill for skill in skills if skill.lower() in job_title_lower or title_matcher.contains_any(skill)]
 
 if __name__ == "__main__":
     try:
@@ -1,23 +1,8 @@
 import re
-import pytesseract
-from PIL import Image
-import pdf2image
 from transformers import pipeline
 
-# Update the path below to the location of tesseract.exe on your system
-pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-
-def extract_text_from_image(image_path):
-    image = Image.open(image_path)
-    text = pytesseract.image_to_string(image)
-    return text
-
-def extract_text_from_pdf(pdf_path):
-    images = pdf2image.convert_from_path(pdf_path)
-    text = ""
-    for img in images:
-        text += pytesseract.image_to_string(img) + "\n"
-    return text
+# Text-layer extraction with OCR fallback (the tesseract.exe path is configured in processing/pdf_text.py)
+from processing.pdf_text import extract_text_from_image, extract_text_from_pdf
 
 # Initialize Hugging Face's text2text-generation pipeline using a Flan-T5 model.
 generator = pipeline("text2text-generation", model="google/flan-t5-small")
@@ -0,0 +1,117 @@
+"""
+Compare the pickled job recommender with the compact serving format.
+
+Each format is loaded in a fresh process to measure load time and the RSS it
+adds; the parent then checks that both rank the same top-k jobs for a set of
+skill queries and times predict_proba on each.
+
+Usage:
+    python benchmarks/bench_compact_model.py
+    python benchmarks/bench_compact_model.py --serving-dir models/job_recommender_serving --k 5
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import numpy as np
+import joblib
+from processing.compact_model import load_compact_model
+from processing.model_registry import _current_rss_bytes
+
+QUERIES = [
+    "python, sql, machine learning, pandas",
+    "java, spring boot, microservices, docker, kubernetes",
+    "javascript, react, node.js, html, css",
+    "aws, terraform, ci/cd, linux, monitoring",
+    "excel, financial modeling, accounting, budgeting",
+    "communication, leadership, project management, agile, scrum",
+    "tensorflow, pytorch, deep learning, computer vision",
+    "sales, customer relationship management, negotiation",
+]
+
+
+def load(kind, pickle_path, serving_dir):
+    if kind == "pickle":
+        return joblib.load(pickle_path)
+    return load_compact_model(serving_dir)
+
+
+def child(kind, pickle_path, serving_dir):
+    """Runs in a fresh interpreter: report load time and RSS added by loading"""
+    rss_before = _current_rss_bytes()
+    start = time.perf_counter()
+    model = load(kind, pickle_path, serving_dir)
+    model.predict_proba([QUERIES[0]])  # touch the pages a first request would
+    load_seconds = time.perf_counter() - start
+    print(json.dumps({
+        "load_seconds": round(load_seconds, 4),
+        "rss_added_mb": round((_current_rss_bytes() - rss_before) / (1024 * 1024), 1),
+    }))
+
+
+def measure_load(kind, args):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", kind,
+         "--pickle", args.pickle, "--serving-dir", args.serving_dir],
+        capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def time_predict(model, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for query in QUERIES:
+            model.predict_proba([query])
+    return (time.perf_counter() - start) / (repeats * len(QUERIES)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pickle", default=os.path.join(BASE_DIR, "models", "job_recommender.pkl"))
+    parser.add_argument("--serving-dir", default=os.path.join(BASE_DIR, "models", "job_recommender_serving"))
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--child", choices=["pickle", "compact"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.pickle, args.serving_dir)
+        return
+
+    results = {}
+    models = {}
+    for kind in ("pickle", "compact"):
+        results[kind] = measure_load(kind, args)
+        models[kind] = load(kind, args.pickle, args.serving_dir)
+        results[kind]["predict_ms"] = round(time_predict(models[kind], args.repeats), 3)
+
+    # Agreement: same top-k titles in the same order, and max probability gap
+    same_top_k = 0
+    max_gap = 0.0
+    for query in QUERIES:
+        reference = models["pickle"].predict_proba([query])[0]
+        compact = models["compact"].predict_proba([query])[0]
+        top_reference = np.argsort(-reference, kind="stable")[:args.k]
+        top_compact = np.argsort(-compact, kind="stable")[:args.k]
+        same_top_k += int(np.array_equal(top_reference, top_compact))
+        max_gap = max(max_gap, float(np.abs(reference - compact).max()))
+    results["agreement"] = {"queries": len(QUERIES), "same_top_k": same_top_k, "k": args.k,
+                            "max_probability_gap": max_gap}
+
+    print(f"{'format':<10} {'load s':>8} {'RSS MB':>8} {'predict ms':>11}")
+    for kind in ("pickle", "compact"):
+        stats = results[kind]
+        print(f"{kind:<10} {stats['load_seconds']:>8.3f} {stats['rss_added_mb']:>8.1f} {stats['predict_ms']:>11.3f}")
+    print(f"Top-{args.k} identical for {same_top_k}/{len(QUERIES)} queries "
+          f"(max probability gap {max_gap:.2e})")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark serial vs parallel per-page OCR.
+
+Generates image-only (scanned-style) PDFs with 1..N pages, then times
+ocr_pages() serially and on process pools of increasing size.
+
+Usage:
+    python benchmarks/bench_parallel_ocr.py --pages 1 2 4 8 --workers 2 4
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from PIL import Image, ImageDraw
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.pdf_text import ocr_page, ocr_pages, create_ocr_pool
+
+SAMPLE_LINES = [
+    "Jane Doe - Software Engineer",
+    "Skills: Python, Java, SQL, Docker, Kubernetes, AWS",
+    "Built REST APIs with Flask and Django for 2M daily users",
+    "Machine Learning: TensorFlow, PyTorch, Scikit-learn, Pandas",
+    "Education: Bachelor of Technology in Computer Science",
+]
+
+
+def make_scanned_pdf(path, page_count):
+    """Write a PDF whose pages are images of text (no text layer)"""
+    pages = []
+    for page_number in range(page_count):
+        image = Image.new("L", (1275, 1650), color=255)  # US letter at 150 DPI
+        draw = ImageDraw.Draw(image)
+        y = 80
+        for repeat in range(12):
+            for line in SAMPLE_LINES:
+                draw.text((80, y), f"{line} ({page_number + 1}.{repeat})", fill=0)
+                y += 20
+        pages.append(image)
+    pages[0].save(path, save_all=True, append_images=pages[1:])
+
+
+def time_ocr(pdf_path, page_count, executor, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        if executor is None:
+            for page_number in range(1, page_count + 1):
+                ocr_page(pdf_path, page_number)
+        else:
+            ocr_pages(pdf_path, range(1, page_count + 1), executor=executor)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--repeats", type=int, default=2)
+    parser.add_argument("--output", help="Optional JSON file for the results")
+    args = parser.parse_args()
+
+    pools = {workers: create_ocr_pool(workers) for workers in args.workers}
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        print(f"{'pages':>5} {'workers':>7} {'seconds':>8} {'speedup':>7}")
+        for page_count in args.pages:
+            pdf_path = os.path.join(tmp_dir, f"scanned_{page_count}.pdf")
+            make_scanned_pdf(pdf_path, page_count)
+
+            serial = time_ocr(pdf_path, page_count, None, args.repeats)
+            print(f"{page_count:>5} {'serial':>7} {serial:>8.2f} {1.0:>7.2f}")
+            results.append({"pages": page_count, "workers": 1, "seconds": serial, "speedup": 1.0})
+
+            for workers, pool in pools.items():
+                # Warm the pool so process start-up is not counted
+                ocr_pages(pdf_path, [1, 1], executor=pool)
+                parallel = time_ocr(pdf_path, page_count, pool, args.repeats)
+                speedup = serial / parallel if parallel else 0.0
+                print(f"{page_count:>5} {workers:>7} {parallel:>8.2f} {speedup:>7.2f}")
+                results.append({"pages": page_count, "workers": workers,
+                                "seconds": parallel, "speedup": speedup})
+
+    for pool in pools.values():
+        pool.shutdown()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
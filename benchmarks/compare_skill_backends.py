@@ -0,0 +1,144 @@
+"""
+Side-by-side check of the skill model backends (pytorch, int8, onnx).
+
+Runs the same reference corpus through each backend and reports latency and
+how far each backend's final skill sets drift from the full-precision
+PyTorch reference (Jaccard similarity per resume, and the skills gained or
+lost overall). Exits non-zero when any backend's mean Jaccard falls below
+--min-jaccard.
+
+The corpus is the sample PDFs in the repo plus generated resumes, or the .txt
+/ .pdf files of --corpus-dir.
+
+Usage:
+    python benchmarks/compare_skill_backends.py
+    python benchmarks/compare_skill_backends.py --backends pytorch int8 --threads 4
+    python benchmarks/compare_skill_backends.py --corpus-dir data/reference_resumes --output backends.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+from processing import skill_extractor
+from processing.pdf_text import extract_text_from_pdf
+
+SAMPLE_PDFS = [
+    os.path.join(BASE_DIR, "data", "DHairyash_s_Resume.pdf"),
+    os.path.join(BASE_DIR, "processing", "resume.pdf"),
+]
+
+
+def load_corpus(corpus_dir, generated, seed):
+    """Return [(name, text)] for the reference corpus"""
+    corpus = []
+    if corpus_dir:
+        for name in sorted(os.listdir(corpus_dir)):
+            path = os.path.join(corpus_dir, name)
+            if name.lower().endswith(".txt"):
+                with open(path, encoding="utf-8") as f:
+                    corpus.append((name, f.read()))
+            elif name.lower().endswith(".pdf"):
+                corpus.append((name, extract_text_from_pdf(path)))
+        return corpus
+
+    for path in SAMPLE_PDFS:
+        if os.path.exists(path):
+            corpus.append((os.path.basename(path), extract_text_from_pdf(path)))
+    rng = random.Random(seed)
+    for i in range(generated):
+        skills = rng.sample(skill_extractor.TECH_SKILL_DICTIONARY, 10)
+        text = (f"Candidate {i}\nSoftware engineer building data products.\nSkills: {', '.join(skills)}\n"
+                f"Built services with {skills[0]} and {skills[1]}, deployed on {skills[2]}.\n")
+        corpus.append((f"generated_{i}", text))
+    return corpus
+
+
+def jaccard(a, b):
+    a, b = {s.lower() for s in a}, {s.lower() for s in b}
+    return len(a & b) / len(a | b) if a | b else 1.0
+
+
+def run_backend(backend, texts, args):
+    start = time.perf_counter()
+    generator = skill_extractor.load_skill_generator(backend, args.model_dir, args.threads)
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    outputs = skill_extractor.extract_skills_batch(texts, generator=generator)
+    skills = [skill_extractor.combine_skills(output, text) for output, text in zip(outputs, texts)]
+    infer_seconds = time.perf_counter() - start
+    return skills, {"load_seconds": round(load_seconds, 3), "inference_seconds": round(infer_seconds, 3),
+                    "per_resume_ms": round(infer_seconds / len(texts) * 1000, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", default=list(skill_extractor.SKILL_MODEL_BACKENDS),
+                        choices=skill_extractor.SKILL_MODEL_BACKENDS)
+    parser.add_argument("--model-dir", default=skill_extractor.SKILL_MODEL_DIR)
+    parser.add_argument("--threads", type=int, default=skill_extractor.SKILL_MODEL_THREADS)
+    parser.add_argument("--corpus-dir", help="Directory of reference resumes (.txt or .pdf)")
+    parser.add_argument("--generated", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--min-jaccard", type=float, default=0.9)
+    parser.add_argument("--output", help="Write the JSON report here")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus_dir, args.generated, args.seed)
+    if not corpus:
+        print("❌ Error: empty reference corpus")
+        sys.exit(1)
+    names = [name for name, _ in corpus]
+    texts = [text for _, text in corpus]
+
+    # The full-precision backend is always the reference
+    backends = ["pytorch"] + [b for b in args.backends if b != "pytorch"]
+    results = {}
+    skill_sets = {}
+    for backend in backends:
+        try:
+            skill_sets[backend], results[backend] = run_backend(backend, texts, args)
+        except Exception as e:
+            print(f"Skipping backend {backend}: {str(e)}")
+
+    reference = skill_sets.get("pytorch")
+    if reference is None:
+        print("❌ Error: the pytorch reference backend failed")
+        sys.exit(1)
+
+    failed = False
+    for backend, skills in skill_sets.items():
+        scores = [jaccard(ref, got) for ref, got in zip(reference, skills)]
+        gained = sorted({s for ref, got in zip(reference, skills) for s in set(got) - set(ref)})
+        lost = sorted({s for ref, got in zip(reference, skills) for s in set(ref) - set(got)})
+        results[backend].update({
+            "mean_jaccard": round(sum(scores) / len(scores), 4),
+            "min_jaccard": round(min(scores), 4),
+            "worst_resume": names[scores.index(min(scores))],
+            "skills_gained": gained,
+            "skills_lost": lost,
+        })
+        failed = failed or results[backend]["mean_jaccard"] < args.min_jaccard
+
+    print(f"{'backend':<8} {'load s':>8} {'ms/resume':>10} {'mean J':>8} {'min J':>8}")
+    for backend, stats in results.items():
+        print(f"{backend:<8} {stats['load_seconds']:>8.2f} {stats['per_resume_ms']:>10.1f} "
+              f"{stats['mean_jaccard']:>8.3f} {stats['min_jaccard']:>8.3f}")
+        if stats["skills_gained"] or stats["skills_lost"]:
+            print(f"  gained: {stats['skills_gained']}\n  lost:   {stats['skills_lost']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"corpus_size": len(corpus), "threads": args.threads, "backends": results}, f, indent=2)
+        print(f"Report written to {args.output}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
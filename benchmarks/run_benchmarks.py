@@ -0,0 +1,298 @@
+"""
+Per-stage latency benchmark for the resume analysis pipeline.
+
+Runs a fixed corpus (the sample PDFs in the repo plus generated text-layer and
+scanned resumes) through each stage on its own and reports p50/p95 latency,
+throughput and peak RSS per stage as JSON, so runs can be compared across
+commits.
+
+Stages: text_layer, rasterise, ocr, chunking, llm, clean_skills,
+regex_extraction, predict_proba, diversity_filter.
+
+The text_layer stage needs poppler's pdfinfo and pdftotext, and the full
+run also needs Tesseract. With --stub-ocr neither is required: page counts
+are read from the PDF structure, and without pdftotext the text_layer stage
+is skipped and the sample PDFs (which have no ground truth) are left out.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --stub-models --stub-ocr --output bench.json
+    python benchmarks/run_benchmarks.py --stub-models --compare old.json
+"""
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import shutil
+import subprocess
+import tempfile
+import zlib
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import numpy as np
+from PIL import Image, ImageDraw
+from processing import pdf_text
+from processing import skill_extractor
+from processing.model_registry import get_model, _current_rss_bytes
+from analyze_resume import get_diverse_job_recommendations
+
+SAMPLE_PDFS = [
+    os.path.join(BASE_DIR, "data", "DHairyash_s_Resume.pdf"),
+    os.path.join(BASE_DIR, "processing", "resume.pdf"),
+]
+
+STAGES = ["text_layer", "rasterise", "ocr", "chunking", "llm", "clean_skills",
+          "regex_extraction", "predict_proba", "diversity_filter"]
+
+
+# 📌 Corpus generation
+
+def make_resume_lines(rng, index):
+    skills = rng.sample(skill_extractor.TECH_SKILL_DICTIONARY, 12)
+    lines = [f"Candidate {index} - Software Engineer", "Summary",
+             "Engineer with experience building data products and web services.", "Skills",
+             ", ".join(skills), "Experience"]
+    for job in range(4):
+        used = rng.sample(skills, 3)
+        lines.append(f"Company {job}: built services with {used[0]} and {used[1]}, deployed on {used[2]}.")
+    lines += ["Education", "Bachelor of Technology in Computer Science, State University"]
+    return lines
+
+
+def _pdf_escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_text_pdf(path, lines):
+    """Write a one-page PDF with an embedded text layer (no extra dependencies)"""
+    content = "BT /F1 10 Tf 50 760 Td 14 TL " + " ".join(f"({_pdf_escape(line)}) '" for line in lines) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        "/Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(content)} >>\nstream\n{content}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    data = "%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += f"{number} 0 obj\n{body}\nendobj\n"
+    xref = len(data)
+    data += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    data += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    data += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    with open(path, "w", encoding="latin-1") as f:
+        f.write(data)
+
+
+def make_scanned_pdf(path, lines):
+    """Write a one-page image-only PDF (forces the OCR path)"""
+    image = Image.new("L", (1275, 1650), color=255)
+    draw = ImageDraw.Draw(image)
+    for i, line in enumerate(lines):
+        draw.text((80, 80 + 24 * i), line, fill=0)
+    image.save(path)
+
+
+def build_corpus(tmp_dir, generated, seed):
+    """Return [{"name", "path", "text"}]; text is the ground truth for generated resumes"""
+    rng = random.Random(seed)
+    corpus = [{"name": os.path.basename(p), "path": p, "text": None} for p in SAMPLE_PDFS if os.path.exists(p)]
+    for i in range(generated):
+        lines = make_resume_lines(rng, i)
+        kind = "scanned" if i % 2 else "text"
+        path = os.path.join(tmp_dir, f"generated_{kind}_{i}.pdf")
+        (make_scanned_pdf if kind == "scanned" else make_text_pdf)(path, lines)
+        corpus.append({"name": os.path.basename(path), "path": path, "text": "\n".join(lines) + "\n"})
+    return corpus
+
+
+# 📌 Stubs for offline runs
+
+def count_pdf_pages(path):
+    """Page count from the PDF's page objects, without pdfinfo (pages in compressed object streams are missed)"""
+    with open(path, "rb") as f:
+        return len(re.findall(rb"/Type\s*/Page\b", f.read())) or 1
+
+
+def stub_generate_batched(prompts, *args, **kwargs):
+    """Stand-in for the Flan-T5 batch: dictionary matches of each prompt"""
+    outputs = []
+    for prompt in prompts:
+        chunk = prompt.split("Resume text:", 1)[-1]
+        found = skill_extractor.tech_skill_matcher.matched_skills(chunk)
+        outputs.append("Technical Skills: " + ", ".join(found))
+    return outputs
+
+
+class StubJobModel:
+    """Stand-in for the job recommender with a deterministic predict_proba"""
+
+    def __init__(self, n_classes=500, n_features=4096, seed=0):
+        rng = np.random.default_rng(seed)
+        self.classes_ = np.array([f"Job Title {i} Engineer" for i in range(n_classes)], dtype=object)
+        self._weights = rng.standard_normal((n_features, n_classes)).astype(np.float32)
+
+    def predict_proba(self, texts):
+        features = np.zeros((len(texts), self._weights.shape[0]), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in text.lower().split(","):
+                features[row, zlib.crc32(token.strip().encode()) % self._weights.shape[0]] += 1.0
+        logits = features @ self._weights
+        logits -= logits.max(axis=1, keepdims=True)
+        proba = np.exp(logits)
+        return proba / proba.sum(axis=1, keepdims=True)
+
+
+# 📌 Measurement
+
+def summarize(latencies, peak_rss):
+    values = np.array(latencies) * 1000
+    total = float(np.sum(latencies))
+    return {
+        "runs": len(latencies),
+        "p50_ms": round(float(np.percentile(values, 50)), 3),
+        "p95_ms": round(float(np.percentile(values, 95)), 3),
+        "mean_ms": round(float(values.mean()), 3),
+        "throughput_per_s": round(len(latencies) / total, 3) if total else None,
+        "peak_rss_mb": round(peak_rss / (1024 * 1024), 1),
+    }
+
+
+def measure(fn, inputs, repeats):
+    latencies = []
+    outputs = []
+    peak_rss = _current_rss_bytes()
+    for _ in range(repeats):
+        outputs = []
+        for item in inputs:
+            start = time.perf_counter()
+            outputs.append(fn(item))
+            latencies.append(time.perf_counter() - start)
+            peak_rss = max(peak_rss, _current_rss_bytes())
+    return outputs, summarize(latencies, peak_rss)
+
+
+def run(args):
+    results = {}
+    generate = stub_generate_batched if args.stub_models else skill_extractor.generate_batched
+    model = StubJobModel() if args.stub_models else get_model("job_recommender")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        corpus = build_corpus(tmp_dir, args.generated, args.seed)
+        get_page_count = count_pdf_pages if args.stub_ocr else pdf_text.get_page_count
+        has_text_layer = not args.stub_ocr or shutil.which("pdftotext") is not None
+        if not has_text_layer:
+            print("pdftotext not found: skipping the text_layer stage and the sample PDFs")
+            corpus = [doc for doc in corpus if doc["text"] is not None]
+
+        def text_layer(doc):
+            return pdf_text.extract_text_layer(doc["path"], get_page_count(doc["path"]))
+        if has_text_layer:
+            _, results["text_layer"] = measure(text_layer, corpus, args.repeats)
+
+        if args.stub_ocr:
+            texts = [doc["text"] or "".join(text_layer(doc)) for doc in corpus]
+        else:
+            import pdf2image
+            import pytesseract
+            images, results["rasterise"] = measure(
+                lambda doc: pdf2image.convert_from_path(doc["path"], dpi=pdf_text.OCR_DPI,
+                                                        grayscale=pdf_text.OCR_GRAYSCALE),
+                corpus, args.repeats)
+            texts, results["ocr"] = measure(
+                lambda pages: "".join(pytesseract.image_to_string(img) + "\n" for img in pages),
+                images, args.repeats)
+            del images
+
+        chunk_lists, results["chunking"] = measure(skill_extractor.chunk_resume_text, texts, args.repeats)
+
+        def llm(chunks):
+            prompts = [skill_extractor.SKILL_PROMPT_TEMPLATE.format(chunk=chunk) for chunk in chunks]
+            return "\n".join(output for output in generate(prompts) if output is not None)
+        model_outputs, results["llm"] = measure(llm, chunk_lists, max(1, args.repeats // 2))
+
+        cleaned, results["clean_skills"] = measure(skill_extractor.clean_skills, model_outputs, args.repeats)
+        regex_skills, results["regex_extraction"] = measure(skill_extractor.extract_skills_with_regex,
+                                                            texts, args.repeats)
+
+        skills_texts = [", ".join(sorted(set(c["Technical Skills"]) | set(r)))
+                        for c, r in zip(cleaned, regex_skills)]
+        probas, results["predict_proba"] = measure(lambda text: model.predict_proba([text])[0],
+                                                   skills_texts, args.repeats)
+
+        def diversity(proba_scores):
+            top = np.argsort(proba_scores)[-15:][::-1]
+            return get_diverse_job_recommendations([model.classes_[i] for i in top], [proba_scores[i] for i in top])
+        _, results["diversity_filter"] = measure(diversity, probas, args.repeats)
+
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "config": {"generated": args.generated, "repeats": args.repeats, "corpus_size": len(corpus),
+                   "stub_models": args.stub_models, "stub_ocr": args.stub_ocr},
+        "stages": results,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def print_report(report, baseline=None):
+    header = f"{'stage':<18} {'p50 ms':>10} {'p95 ms':>10} {'per s':>10} {'RSS MB':>8}"
+    if baseline:
+        header += f" {'p50 vs base':>12}"
+    print(header)
+    for stage in STAGES:
+        stats = report["stages"].get(stage)
+        if not stats:
+            continue
+        line = (f"{stage:<18} {stats['p50_ms']:>10.2f} {stats['p95_ms']:>10.2f} "
+                f"{stats['throughput_per_s'] or 0:>10.2f} {stats['peak_rss_mb']:>8.1f}")
+        base = (baseline or {}).get("stages", {}).get(stage)
+        if base and base["p50_ms"]:
+            change = (stats["p50_ms"] - base["p50_ms"]) / base["p50_ms"] * 100
+            line += f" {change:>+11.1f}%"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--generated", type=int, default=8, help="Number of generated resumes")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--stub-models", action="store_true", help="Replace Flan-T5 and the classifier with stubs")
+    parser.add_argument("--stub-ocr", action="store_true", help="Skip rasterisation/OCR and use ground-truth text")
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against")
+    args = parser.parse_args()
+
+    report = run(args)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+import { proxyJobs } from '../proxy';
+
+export async function GET(request, { params }) {
+  const { id } = await params;
+  return proxyJobs(request, `http://localhost:5000/api/jobs/${encodeURIComponent(id)}`);
+}
@@ -0,0 +1,36 @@
+import { NextResponse } from 'next/server';
+
+// Forward a jobs request to the Flask backend, passing the conditional
+// request headers through so unchanged pages come back as 304.
+export async function proxyJobs(request, url) {
+  try {
+    const headers = {};
+    const ifNoneMatch = request.headers.get('if-none-match');
+    if (ifNoneMatch) {
+      headers['If-None-Match'] = ifNoneMatch;
+    }
+
+    const flaskResponse = await fetch(url, { headers, cache: 'no-store' });
+
+    const responseHeaders = {};
+    for (const name of ['etag', 'cache-control']) {
+      const value = flaskResponse.headers.get(name);
+      if (value) {
+        responseHeaders[name] = value;
+      }
+    }
+
+    if (flaskResponse.status === 304) {
+      return new NextResponse(null, { status: 304, headers: responseHeaders });
+    }
+
+    const data = await flaskResponse.json();
+    return NextResponse.json(data, { status: flaskResponse.status, headers: responseHeaders });
+  } catch (error) {
+    console.error('Error fetching jobs:', error);
+    return NextResponse.json(
+      { error: error.message || 'Failed to fetch jobs' },
+      { status: 502 }
+    );
+  }
+}
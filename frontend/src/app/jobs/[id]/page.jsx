@@ -17,21 +17,16 @@ export default function JobDetailsPage() {
   useEffect(() => {
     const fetchJobDetails = async () => {
       try {
-        const response = await fetch('/api/jobs');
+        const response = await fetch(`/api/jobs/${params.id}`);
         
-        if (!response.ok) {
-          throw new Error('Failed to fetch jobs');
-        }
-        
-        const data = await response.json();
-        const jobId = params.id;
-        const foundJob = data.jobs[jobId];
-        
-        if (!foundJob) {
+        if (response.status === 404) {
           throw new Error('Job not found');
         }
+        if (!response.ok) {
+          throw new Error('Failed to fetch job');
+        }
         
-        setJob(foundJob);
+        setJob(await response.json());
       } catch (err) {
         setError(err.message);
       } finally {
@@ -3,24 +3,38 @@
 import { useState, useEffect } from 'react';
 import Link from 'next/link';
 
+const JOBS_PAGE_SIZE = 200;
+
 export default function JobsPage() {
   const [jobs, setJobs] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [searchTerm, setSearchTerm] = useState('');
   const [filterType, setFilterType] = useState('');
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  // Jobs are fetched a page at a time; next_cursor continues where the last page ended
+  const fetchJobs = async (cursor = null) => {
+    const params = new URLSearchParams({ limit: String(JOBS_PAGE_SIZE) });
+    if (cursor) {
+      params.set('cursor', cursor);
+    }
+    const response = await fetch(`/api/jobs?${params}`);
+    
+    if (!response.ok) {
+      throw new Error('Failed to fetch jobs');
+    }
+    
+    return response.json();
+  };
 
   useEffect(() => {
-    const fetchJobs = async () => {
+    const fetchFirstPage = async () => {
       try {
-        const response = await fetch('/api/jobs');
-        
-        if (!response.ok) {
-          throw new Error('Failed to fetch jobs');
-        }
-        
-        const data = await response.json();
+        const data = await fetchJobs();
         setJobs(data.jobs || []);
+        setNextCursor(data.next_cursor || null);
       } catch (err) {
         setError(err.message);
       } finally {
@@ -28,9 +42,22 @@ export default function JobsPage() {
       }
     };
     
-    fetchJobs();
+    fetchFirstPage();
   }, []);
 
+  const loadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const data = await fetchJobs(nextCursor);
+      setJobs(current => [...current, ...(data.jobs || [])]);
+      setNextCursor(data.next_cursor || null);
+    } catch (err) {
+      setError(err.message);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // Filter jobs based on search term and filter type
   const filteredJobs = jobs.filter(job => {
     const matchesSearch = searchTerm === '' || 
@@ -102,8 +129,8 @@ export default function JobsPage() {
           <>
             <p className="mb-4 text-gray-600">{filteredJobs.length} jobs found</p>
             <div className="grid gap-6 md:grid-cols-2 lg:grid-cols-3">
-              {filteredJobs.map((job, index) => (
-                <div key={index} className="bg-white rounded-lg shadow-md overflow-hidden hover:shadow-lg transition-shadow">
+              {filteredJobs.map((job) => (
+                <div key={job.id} className="bg-white rounded-lg shadow-md overflow-hidden hover:shadow-lg transition-shadow">
                   <div className="p-6">
                     <h2 className="text-xl font-semibold text-gray-900 mb-2">{job.job_title}</h2>
                     <p className="text-blue-600 font-medium mb-2">{job.company_name}</p>
@@ -121,7 +148,7 @@ export default function JobsPage() {
                     </div>
                     
                     <div className="flex justify-between items-center">
-                      <Link href={`/jobs/${index}`} className="text-blue-600 hover:text-blue-800 font-medium">
+                      <Link href={`/jobs/${job.id}`} className="text-blue-600 hover:text-blue-800 font-medium">
                         View Details
                       </Link>
                       <a 
@@ -146,6 +173,18 @@ export default function JobsPage() {
                 <p className="text-gray-600">No jobs found matching your criteria.</p>
               </div>
             )}
+
+            {nextCursor && (
+              <div className="mt-8 text-center">
+                <button
+                  onClick={loadMore}
+                  disabled={loadingMore}
+                  className="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 disabled:opacity-50"
+                >
+                  {loadingMore ? 'Loading...' : 'Load more jobs'}
+                </button>
+              </div>
+            )}
           </>
         )}
         
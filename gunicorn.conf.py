@@ -0,0 +1,43 @@
+"""
+Gunicorn settings for production serving (see wsgi.py).
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Every setting can be overridden with the environment variables below.
+"""
+import os
+import sys
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Models are loaded once in the master and shared copy-on-write by the workers
+preload_app = True
+workers = int(os.environ.get("READUME_WORKERS", 2))
+
+# A few request threads per worker, so streaming batch responses and status
+# polling do not hold a whole process each
+worker_class = "gthread"
+threads = int(os.environ.get("READUME_HTTP_THREADS", 4))
+
+# OCR and generation on long resumes can take a while
+timeout = int(os.environ.get("READUME_WORKER_TIMEOUT", 120))
+
+# Recycle workers after a number of requests (0 disables) to bound memory
+# growth; the jitter keeps them from restarting all at once
+max_requests = int(os.environ.get("READUME_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("READUME_MAX_REQUESTS_JITTER", 100))
+
+accesslog = "-"
+
+
+def post_fork(server, worker):
+    """Pin the worker's torch intra-op threads and optionally warm its models up"""
+    threads = int(os.environ.get("READUME_WORKER_THREADS", 0))
+    torch = sys.modules.get("torch")
+    if torch is not None and threads:
+        torch.set_num_threads(threads)
+
+    if os.environ.get("READUME_WARMUP", "0") == "1":
+        # Models are already loaded by the master; only the warmup inference runs here
+        from processing.model_registry import start_background_loading
+        start_background_loading(warmup=True)
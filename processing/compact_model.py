@@ -0,0 +1,239 @@
+import os
+import re
+import json
+import time
+from collections import Counter
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVING_MODEL_DIR = os.path.join(BASE_DIR, "models", "job_recommender_serving")
+FORMAT_VERSION = 1
+
+# Exported TfidfVectorizer settings the scorer knows how to reproduce
+SUPPORTED_ANALYZER = "word"
+
+
+def _sigmoid(values):
+    return 1.0 / (1.0 + np.exp(-values))
+
+
+def _uses_ovr(classifier):
+    """Mirror LogisticRegression.predict_proba's choice between OvR and softmax"""
+    multi_class = getattr(classifier, "multi_class", None)
+    if multi_class is None:
+        # scikit-learn >= 1.8 dropped the parameter: binary models use the
+        # logistic function and multiclass ones are always multinomial
+        return len(classifier.classes_) <= 2
+    if multi_class in ("ovr", "warn"):
+        return True
+    if multi_class in ("auto", "deprecated"):
+        return len(classifier.classes_) <= 2 or getattr(classifier, "solver", None) == "liblinear"
+    return False
+
+
+def export_compact_model(pipeline, directory=SERVING_MODEL_DIR, prune_threshold=0.0):
+    """
+    Write a TF-IDF + linear classifier pipeline as flat, memory-mappable arrays:
+
+        vocabulary.npy   sorted n-grams as fixed-width UTF-8 bytes (binary search)
+        idf.npy          float32 idf weight per vocabulary entry
+        coef.npy         float32 coefficients, features x classes
+                         (or coef_indptr/coef_indices/coef_data.npy, a CSR
+                         matrix by feature, when prune_threshold > 0)
+        intercept.npy    float32 intercept per class
+        classes.npy      class names as fixed-width unicode
+        meta.json        analyzer settings and output normalisation
+    """
+    vectorizer = pipeline.steps[0][1]
+    classifier = pipeline.steps[-1][1]
+    if not hasattr(vectorizer, "vocabulary_") or getattr(vectorizer, "analyzer", None) != SUPPORTED_ANALYZER:
+        raise ValueError("Only word-level TF-IDF pipelines can be exported to the compact format")
+    if vectorizer.preprocessor is not None or vectorizer.tokenizer is not None or vectorizer.stop_words:
+        raise ValueError("Custom preprocessors, tokenizers and stop words are not supported by the compact format")
+
+    os.makedirs(directory, exist_ok=True)
+
+    # Reorder features so the vocabulary is sorted by its UTF-8 bytes
+    terms = sorted(vectorizer.vocabulary_.items(), key=lambda item: item[0].encode("utf-8"))
+    column_order = np.array([column for _, column in terms], dtype=np.int64)
+    encoded = [term.encode("utf-8") for term, _ in terms]
+    width = max(len(term) for term in encoded)
+    vocabulary = np.array(encoded, dtype=f"S{width}")
+
+    if getattr(vectorizer, "use_idf", True):
+        idf = np.asarray(vectorizer.idf_, dtype=np.float32)[column_order]
+    else:
+        idf = np.ones(len(column_order), dtype=np.float32)
+
+    coef = np.asarray(classifier.coef_, dtype=np.float32)[:, column_order].T  # features x classes
+    intercept = np.atleast_1d(np.asarray(classifier.intercept_, dtype=np.float32))
+
+    np.save(os.path.join(directory, "vocabulary.npy"), vocabulary)
+    np.save(os.path.join(directory, "idf.npy"), idf)
+    np.save(os.path.join(directory, "intercept.npy"), intercept)
+    np.save(os.path.join(directory, "classes.npy"), np.array([str(c) for c in classifier.classes_]))
+
+    pruned = prune_threshold > 0
+    if pruned:
+        keep = np.abs(coef) >= prune_threshold
+        np.save(os.path.join(directory, "coef_indptr.npy"),
+                np.concatenate([[0], np.cumsum(keep.sum(axis=1))]).astype(np.int64))
+        np.save(os.path.join(directory, "coef_indices.npy"), np.nonzero(keep)[1].astype(np.int32))
+        np.save(os.path.join(directory, "coef_data.npy"), np.ascontiguousarray(coef[keep]))
+        kept = float(keep.mean())
+    else:
+        np.save(os.path.join(directory, "coef.npy"), np.ascontiguousarray(coef))
+        kept = 1.0
+
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "exported_at": time.time(),
+        "lowercase": bool(vectorizer.lowercase),
+        "token_pattern": vectorizer.token_pattern,
+        "ngram_range": list(vectorizer.ngram_range),
+        "sublinear_tf": bool(vectorizer.sublinear_tf),
+        "norm": vectorizer.norm,
+        "binary": bool(vectorizer.binary),
+        "ovr": _uses_ovr(classifier),
+        "pruned": pruned,
+        "prune_threshold": prune_threshold,
+        "kept_coefficients": round(kept, 4),
+        "n_features": len(vocabulary),
+        "n_classes": len(classifier.classes_),
+    }
+    with open(os.path.join(directory, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+
+    print(f"✅ Exported compact model ({meta['n_features']} features x {meta['n_classes']} classes, "
+          f"{kept:.1%} of coefficients kept) to {directory}")
+    return meta
+
+
+class CompactJobScorer:
+    """
+    Scores skills text against the exported job recommender without
+    scikit-learn: the TF-IDF analyzer is reimplemented over the sorted
+    vocabulary and the linear model is a float32 matrix product.
+
+    Exposes classes_ and predict_proba so it can stand in for the pickled
+    pipeline in analyze_resume.
+    """
+
+    def __init__(self, vocabulary, idf, intercept, classes, meta, coef=None, coef_csr=None):
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.intercept = intercept
+        self.classes_ = classes
+        self.meta = meta
+        self.coef = coef
+        self.coef_csr = coef_csr
+        self._token_pattern = re.compile(meta["token_pattern"])
+        self._min_n, self._max_n = meta["ngram_range"]
+        self._term_width = vocabulary.dtype.itemsize
+
+    def _ngrams(self, text):
+        if self.meta["lowercase"]:
+            text = text.lower()
+        tokens = self._token_pattern.findall(text)
+        ngrams = []
+        for n in range(self._min_n, min(self._max_n, len(tokens)) + 1):
+            if n == 1:
+                ngrams.extend(tokens)
+            else:
+                ngrams.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return ngrams
+
+    def transform_one(self, text):
+        """Return (feature ids, L2-normalised TF-IDF values) for one document"""
+        counts = Counter(term.encode("utf-8") for term in self._ngrams(text))
+        terms = [term for term in counts if len(term) <= self._term_width]
+        if not terms:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        candidates = np.array(terms, dtype=self.vocabulary.dtype)
+        positions = np.searchsorted(self.vocabulary, candidates)
+        positions[positions == len(self.vocabulary)] = 0
+        found = self.vocabulary[positions] == candidates
+        ids = positions[found]
+        tf = np.array([counts[term] for term, hit in zip(terms, found) if hit], dtype=np.float32)
+
+        if self.meta["binary"]:
+            tf = np.ones_like(tf)
+        elif self.meta["sublinear_tf"]:
+            tf = 1.0 + np.log(tf)
+        values = tf * self.idf[ids]
+        if self.meta["norm"] == "l2":
+            norm = np.sqrt(np.dot(values, values))
+        elif self.meta["norm"] == "l1":
+            norm = np.abs(values).sum()
+        else:
+            norm = 0.0
+        if norm:
+            values = values / norm
+        return ids, values
+
+    def decision_function(self, texts):
+        scores = np.tile(self.intercept, (len(texts), 1))
+        for row, text in enumerate(texts):
+            ids, values = self.transform_one(text)
+            if not len(ids):
+                continue
+            if self.coef is not None:
+                scores[row] += values @ self.coef[ids]
+            else:
+                indptr, indices, data = self.coef_csr
+                for feature, value in zip(ids, values):
+                    start, end = indptr[feature], indptr[feature + 1]
+                    scores[row, indices[start:end]] += value * data[start:end]
+        return scores
+
+    def predict_proba(self, texts):
+        scores = self.decision_function(texts)
+        if scores.shape[1] == 1:
+            # A multinomial binary model is a softmax over (-score, score)
+            positive = _sigmoid(scores[:, 0] if self.meta["ovr"] else 2 * scores[:, 0])
+            return np.column_stack([1.0 - positive, positive])
+        if self.meta["ovr"]:
+            proba = _sigmoid(scores)
+            return proba / proba.sum(axis=1, keepdims=True)
+        scores -= scores.max(axis=1, keepdims=True)
+        proba = np.exp(scores)
+        return proba / proba.sum(axis=1, keepdims=True)
+
+    def top_k(self, text, k=10):
+        """Return [(class name, probability)] for the k most likely classes, best first"""
+        proba = self.predict_proba([text])[0]
+        k = min(k, len(proba))
+        best = np.argpartition(-proba, k - 1)[:k]
+        best = best[np.argsort(-proba[best], kind="stable")]
+        return [(str(self.classes_[i]), float(proba[i])) for i in best]
+
+
+def compact_model_exists(directory=SERVING_MODEL_DIR):
+    return os.path.exists(os.path.join(directory, "meta.json"))
+
+
+def compact_model_is_stale(pickle_path, directory=SERVING_MODEL_DIR):
+    """True if the pickled pipeline was written after the export (retrained without re-exporting)"""
+    try:
+        return os.path.getmtime(pickle_path) > os.path.getmtime(os.path.join(directory, "meta.json"))
+    except OSError:
+        return False
+
+
+def load_compact_model(directory=SERVING_MODEL_DIR, mmap_mode="r"):
+    """Load an exported model with its arrays memory-mapped"""
+    with open(os.path.join(directory, "meta.json")) as f:
+        meta = json.load(f)
+    if meta.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported compact model format {meta.get('format_version')} in {directory}")
+
+    def array(name):
+        return np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode)
+
+    if meta["pruned"]:
+        coef, coef_csr = None, (array("coef_indptr"), array("coef_indices"), array("coef_data"))
+    else:
+        coef, coef_csr = array("coef"), None
+    return CompactJobScorer(array("vocabulary"), array("idf"), array("intercept"), array("classes"),
+                            meta, coef=coef, coef_csr=coef_csr)
@@ -0,0 +1,233 @@
+import os
+import re
+import json
+import time
+import base64
+import hashlib
+import logging
+import threading
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOBS_CSV_PATH = os.path.join(BASE_DIR, "data", "linkedin_jobs_india.csv")
+
+# How often (seconds) the CSV is checked for a newer export
+RELOAD_SECONDS = float(os.environ.get("READUME_JOBS_RELOAD_SECONDS", 30))
+
+# Filter name -> (column, how values are split into index terms)
+FILTERS = {
+    "title": ("job_title", "tokens"),
+    "location": ("job_location", "tokens"),
+    "company": ("company_name", "tokens"),
+    "skill": ("job_skills", "skills"),
+}
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _terms(value, kind):
+    if kind == "skills":
+        return {" ".join(skill.lower().split()) for skill in value.split(",") if skill.strip()}
+    return set(_TOKEN.findall(value.lower()))
+
+
+def unsearchable_filters(filters):
+    """Names of the filters given a value with nothing to search for (no word characters)"""
+    return [name for name, value in filters.items()
+            if name in FILTERS and value and not _terms(value, FILTERS[name][1])]
+
+
+class CursorError(ValueError):
+    """Raised for a malformed cursor or one issued for an older catalog"""
+
+
+class JobCatalog:
+    """
+    Column-oriented, dictionary-encoded view of the scraped jobs CSV.
+
+    Every column is stored as an int32 code per row plus its list of distinct
+    values; most scraper columns are placeholders, so they cost 4 bytes a row.
+    Filterable columns also keep, per term (word, or skill for job_skills),
+    the codes of the values containing it and, per code, the sorted rows
+    holding it. A filter is answered by intersecting code sets within a
+    column, taking the union of their rows and intersecting sorted row
+    arrays across filters; rows are never scanned one by one.
+    """
+
+    def __init__(self, columns, values, codes, version):
+        self.columns = columns          # column names in CSV order
+        self.values = values            # column -> list of distinct values
+        self.codes = codes              # column -> int32 array, one code per row
+        self.version = version
+        self.size = len(next(iter(codes.values()))) if codes else 0
+        self._rows_by_code = {}
+        self._term_codes = {}
+        for name, (column, kind) in FILTERS.items():
+            if column in self.codes:
+                self._index(name, column, kind)
+
+    def _index(self, name, column, kind):
+        codes = self.codes[column]
+        order = np.argsort(codes, kind="stable").astype(np.int32)
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(self.values[column])))])
+        self._rows_by_code[name] = (order, offsets)
+        term_codes = {}
+        for code, value in enumerate(self.values[column]):
+            for term in _terms(value, kind):
+                term_codes.setdefault(term, []).append(code)
+        self._term_codes[name] = {term: np.array(c, dtype=np.int32) for term, c in term_codes.items()}
+
+    def __len__(self):
+        return self.size
+
+    def _filter_rows(self, name, query):
+        """Sorted rows whose value contains every term of query"""
+        column, kind = FILTERS[name]
+        terms = _terms(query, kind)
+        if not terms:
+            return None
+        term_codes = self._term_codes.get(name, {})
+        codes = None
+        for term in terms:
+            matched = term_codes.get(term)
+            if matched is None:
+                return np.empty(0, dtype=np.int32)
+            codes = matched if codes is None else np.intersect1d(codes, matched, assume_unique=True)
+        order, offsets = self._rows_by_code[name]
+        rows = [order[offsets[c]:offsets[c + 1]] for c in codes]
+        return np.sort(np.concatenate(rows)) if rows else np.empty(0, dtype=np.int32)
+
+    def query(self, filters=None, after=-1, limit=50):
+        """
+        Return (rows, total, has_more) for the rows matching every filter,
+        in CSV order, starting after row `after`.
+        """
+        matched = None
+        for name, value in (filters or {}).items():
+            if name not in FILTERS or not value:
+                continue
+            rows = self._filter_rows(name, value)
+            if rows is None:
+                continue
+            matched = rows if matched is None else np.intersect1d(matched, rows, assume_unique=True)
+
+        if matched is None:
+            start = after + 1
+            page = np.arange(start, min(start + limit, self.size), dtype=np.int32)
+            return page, self.size, start + limit < self.size
+
+        start = np.searchsorted(matched, after, side="right")
+        page = matched[start:start + limit]
+        return page, len(matched), start + limit < len(matched)
+
+    def row(self, row, fields=None):
+        record = {"id": int(row)}
+        for column in fields or self.columns:
+            record[column] = self.values[column][self.codes[column][row]]
+        return record
+
+    def encode_cursor(self, row):
+        payload = json.dumps({"v": self.version, "after": int(row)}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, cursor):
+        """Return the row a cursor points after, raising CursorError if it is invalid or stale"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            after = int(payload["after"])
+        except (ValueError, KeyError, TypeError):
+            raise CursorError("Invalid cursor")
+        if payload.get("v") != self.version:
+            raise CursorError("The jobs catalog changed since this cursor was issued; restart pagination")
+        return after
+
+
+def csv_version(csv_path):
+    st = os.stat(csv_path)
+    return hashlib.sha1(f"{st.st_size}:{st.st_mtime_ns}".encode()).hexdigest()[:16]
+
+
+def build_job_catalog(csv_path=JOBS_CSV_PATH, chunksize=100000):
+    """Stream the CSV in chunks into a dictionary-encoded JobCatalog"""
+    import pandas as pd
+
+    version = csv_version(csv_path)
+    columns = pd.read_csv(csv_path, nrows=0).columns.tolist()
+    lookups = {column: {} for column in columns}
+    values = {column: [] for column in columns}
+    chunks = {column: [] for column in columns}
+
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize, dtype=str, keep_default_na=False):
+        for column in columns:
+            lookup = lookups[column]
+            column_values = values[column]
+            codes = np.empty(len(chunk), dtype=np.int32)
+            for i, value in enumerate(chunk[column]):
+                code = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(column_values)
+                    column_values.append(value)
+                codes[i] = code
+            chunks[column].append(codes)
+
+    codes = {column: np.concatenate(parts) if parts else np.empty(0, dtype=np.int32)
+             for column, parts in chunks.items()}
+    return JobCatalog(columns, values, codes, version)
+
+
+_catalog = None
+_catalog_checked = 0.0
+_catalog_rebuilding = False
+_catalog_lock = threading.Lock()
+
+
+def _load_catalog(csv_path):
+    start = time.perf_counter()
+    catalog = build_job_catalog(csv_path)
+    logging.info(f"Loaded jobs catalog with {len(catalog)} rows in {time.perf_counter() - start:.2f} seconds")
+    return catalog
+
+
+def _rebuild_catalog(csv_path):
+    global _catalog, _catalog_rebuilding
+    try:
+        catalog = _load_catalog(csv_path)
+        with _catalog_lock:
+            _catalog = catalog
+    except Exception as e:
+        logging.error(f"Failed to rebuild the jobs catalog: {str(e)}")
+    finally:
+        with _catalog_lock:
+            _catalog_rebuilding = False
+
+
+def get_job_catalog(csv_path=JOBS_CSV_PATH):
+    """
+    Return the catalog for the current jobs CSV. None if there is no CSV yet.
+
+    The file is checked for a new export at most every RELOAD_SECONDS. Only
+    the first load blocks; afterwards one background thread rebuilds the
+    catalog while requests keep being served from the previous one.
+    """
+    global _catalog, _catalog_checked, _catalog_rebuilding
+    now = time.monotonic()
+    if _catalog is not None and now - _catalog_checked < RELOAD_SECONDS:
+        return _catalog
+    with _catalog_lock:
+        if _catalog is not None and now - _catalog_checked < RELOAD_SECONDS:
+            return _catalog
+        try:
+            version = csv_version(csv_path)
+        except OSError:
+            _catalog, _catalog_checked = None, now
+            return None
+        _catalog_checked = now
+        if _catalog is not None:
+            if _catalog.version != version and not _catalog_rebuilding:
+                _catalog_rebuilding = True
+                threading.Thread(target=_rebuild_catalog, args=(csv_path,),
+                                 name="jobs-catalog-rebuild", daemon=True).start()
+            return _catalog
+        _catalog = _load_catalog(csv_path)
+        return _catalog
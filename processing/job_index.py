@@ -0,0 +1,145 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+import joblib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.model_registry import register_model, MMAP_MODE
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+JOB_INDEX_PATH = os.path.join(BASE_DIR, "models", "job_index.pkl")
+
+# Posting sources and how their columns map onto the index metadata
+POSTING_SOURCES = {
+    "linkedin_jobs_india.csv": {
+        "title": "job_title", "company": "company_name", "location": "job_location",
+        "skills": "job_skills", "link": "job_link", "text": None,
+    },
+    "job_descriptions.csv": {
+        "title": "Job Title", "company": "Company", "location": "location",
+        "skills": "skills", "link": "Job Id", "text": "Role",
+    },
+}
+META_FIELDS = ("title", "company", "location", "link", "source")
+
+
+def iter_postings(csv_path, columns, chunksize=100000):
+    """
+    Stream (document text, metadata) for every posting in a CSV, reading
+    only the columns the index needs.
+    """
+    header = pd.read_csv(csv_path, nrows=0).columns
+    available = {field: col for field, col in columns.items() if col and col in header}
+    source = os.path.basename(csv_path)
+
+    for chunk in pd.read_csv(csv_path, usecols=list(available.values()), chunksize=chunksize, dtype=str):
+        chunk = chunk.fillna("")
+        for row in chunk.itertuples(index=False):
+            values = dict(zip(chunk.columns, row))
+            fields = {field: values.get(col, "") for field, col in available.items()}
+            document = " ".join(filter(None, (fields.get("title"), fields.get("skills"), fields.get("text"))))
+            if not document.strip():
+                continue
+            yield document, {
+                "title": fields.get("title", ""),
+                "company": fields.get("company", ""),
+                "location": fields.get("location", ""),
+                "link": fields.get("link", ""),
+                "source": source,
+            }
+
+
+def build_job_index(csv_paths, max_features=2 ** 18, min_df=1):
+    """
+    Fit a TF-IDF vectoriser over every posting and return the index payload:
+    the vectoriser, the L2-normalised CSR posting matrix and column-wise metadata.
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    documents = []
+    meta = {field: [] for field in META_FIELDS}
+    for csv_path in csv_paths:
+        if not os.path.exists(csv_path):
+            print(f"Warning: postings file not found at {csv_path}")
+            continue
+        columns = POSTING_SOURCES.get(os.path.basename(csv_path), POSTING_SOURCES["linkedin_jobs_india.csv"])
+        for document, fields in iter_postings(csv_path, columns):
+            documents.append(document)
+            for field in META_FIELDS:
+                meta[field].append(fields[field])
+
+    if not documents:
+        raise ValueError("No postings found to index")
+
+    vectorizer = TfidfVectorizer(
+        stop_words="english",
+        sublinear_tf=True,
+        min_df=min_df,
+        max_features=max_features,
+        dtype=np.float32,
+    )
+    matrix = vectorizer.fit_transform(documents).tocsr()  # rows are L2-normalised
+    matrix.sort_indices()
+    return {
+        "built_at": time.time(),
+        "vectorizer": vectorizer,
+        "matrix": matrix,
+        "meta": {field: np.array(values, dtype=object) for field, values in meta.items()},
+    }
+
+
+def save_job_index(index, path=JOB_INDEX_PATH):
+    joblib.dump(index, path)
+    print(f"✅ Saved job index with {index['matrix'].shape[0]} postings "
+          f"and {index['matrix'].shape[1]} terms to {path}")
+
+
+class JobIndex:
+    """Top-k cosine matching of a resume against every indexed posting"""
+
+    def __init__(self, index=None):
+        index = index or {}
+        self.vectorizer = index.get("vectorizer")
+        self.matrix = index.get("matrix")
+        self.meta = index.get("meta", {})
+        self.built_at = index.get("built_at")
+
+    def __len__(self):
+        return 0 if self.matrix is None else self.matrix.shape[0]
+
+    def vectorize(self, texts):
+        """Return L2-normalised TF-IDF rows for texts using the index vocabulary"""
+        return self.vectorizer.transform(texts)
+
+    def scores(self, query_text):
+        """Cosine similarity between the query and every posting (one CSR mat-vec)"""
+        query = self.vectorize([query_text])
+        dense_query = np.zeros(self.matrix.shape[1], dtype=np.float32)
+        dense_query[query.indices] = query.data
+        return self.matrix @ dense_query
+
+    def top_k(self, query_text, k=10):
+        """Return [(posting row, score)] for the k best postings, best first"""
+        if not len(self):
+            return []
+        scores = self.scores(query_text)
+        k = min(k, len(scores))
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(int(i), float(scores[i])) for i in candidates if scores[i] > 0]
+
+    def posting(self, row):
+        """Return the metadata of an indexed posting"""
+        return {field: values[row] for field, values in self.meta.items()}
+
+
+def load_job_index(path=JOB_INDEX_PATH):
+    """Load the saved index (empty if it has not been built yet)"""
+    if not os.path.exists(path):
+        return JobIndex()
+    return JobIndex(joblib.load(path, mmap_mode=MMAP_MODE))
+
+
+register_model("job_index", load_job_index)
@@ -0,0 +1,142 @@
+import os
+import re
+import time
+from collections import Counter, defaultdict
+import joblib
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.model_registry import register_model
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOB_SKILL_INDEX_PATH = os.path.join(BASE_DIR, "models", "job_skill_index.pkl")
+
+# Skills kept per job title
+DEFAULT_TOP_N = 50
+
+_SKILL_SPLIT = re.compile(r"[,;\n]")
+
+
+def normalize_skill(skill):
+    """Canonical lookup form of a skill: lowercase with single spaces"""
+    return " ".join(skill.lower().split())
+
+
+class JobSkillIndexBuilder:
+    """
+    Accumulates job title -> skill counts from (title, skills text) rows, so
+    it can be fed from an in-memory DataFrame or from CSV chunks.
+    """
+
+    def __init__(self):
+        self.skill_counts = defaultdict(Counter)
+        self.title_counts = Counter()
+        self.display = {}
+
+    def add(self, job_title, skills_text):
+        job_title = str(job_title).strip()
+        if not job_title:
+            return
+        self.title_counts[job_title] += 1
+        for raw in _SKILL_SPLIT.split(skills_text) if isinstance(skills_text, str) else []:
+            raw = " ".join(raw.split())
+            skill = raw.lower()
+            if not skill:
+                continue
+            self.skill_counts[job_title][skill] += 1
+            self.display.setdefault(skill, raw)
+
+    def add_many(self, job_titles, skills_texts):
+        for job_title, skills_text in zip(job_titles, skills_texts):
+            self.add(job_title, skills_text)
+
+    def build(self, top_n=DEFAULT_TOP_N):
+        """
+        Return the serialisable index: for every title the top_n skills weighted
+        by the share of that title's postings that list them.
+        """
+        titles = {}
+        for job_title, counts in self.skill_counts.items():
+            total = self.title_counts[job_title]
+            titles[job_title] = {skill: round(count / total, 4) for skill, count in counts.most_common(top_n)}
+        used = {skill for weights in titles.values() for skill in weights}
+        return {
+            "source": "dataset",
+            "built_at": time.time(),
+            "titles": titles,
+            "display": {skill: self.display[skill] for skill in used},
+        }
+
+
+def build_index_from_model(model, top_n=DEFAULT_TOP_N):
+    """
+    Build the index from a trained TF-IDF + linear classifier pipeline, using
+    each class's largest positive coefficients as its weighted skills.
+    """
+    vectorizer = model.steps[0][1]
+    classifier = model.steps[-1][1]
+    if not hasattr(vectorizer, "get_feature_names_out"):
+        raise ValueError("The model's vectorizer has no vocabulary to derive skills from")
+
+    terms = vectorizer.get_feature_names_out()
+    coef = classifier.coef_
+    titles = {}
+    for row, job_title in enumerate(classifier.classes_):
+        weights = coef[row] if coef.shape[0] > 1 else (coef[0] if row == 1 else -coef[0])
+        top = weights.argsort()[::-1][:top_n]
+        titles[str(job_title)] = {str(terms[i]): round(float(weights[i]), 4) for i in top if weights[i] > 0}
+    return {"source": "model", "built_at": time.time(), "titles": titles, "display": {}}
+
+
+def save_index(index, path=JOB_SKILL_INDEX_PATH):
+    joblib.dump(index, path)
+    print(f"✅ Saved job-skill index for {len(index['titles'])} job titles to {path}")
+
+
+class JobSkillIndex:
+    """Inverted job title -> weighted skills lookup"""
+
+    def __init__(self, index=None):
+        index = index or {}
+        self.titles = index.get("titles", {})
+        self.source = index.get("source")
+        # Titles as returned by the classifier may differ in case/spacing
+        self._normalized_titles = {normalize_skill(title): title for title in self.titles}
+
+    def __len__(self):
+        return len(self.titles)
+
+    def skills_for_title(self, job_title):
+        """Return {normalized skill: weight} for a title, or None if unknown"""
+        weights = self.titles.get(job_title)
+        if weights is None:
+            title = self._normalized_titles.get(normalize_skill(job_title))
+            weights = self.titles.get(title) if title else None
+        return weights
+
+    def match_skills(self, job_title, skills):
+        """
+        Return the resume skills relevant to job_title, most relevant first.
+        Each skill is looked up whole and word by word, so the cost grows with
+        the number of resume skills, not with the size of the index.
+        """
+        weights = self.skills_for_title(job_title) or {}
+        scored = []
+        for position, skill in enumerate(skills):
+            normalized = normalize_skill(skill)
+            weight = weights.get(normalized, 0.0)
+            if not weight:
+                weight = max((weights.get(word, 0.0) for word in normalized.split()), default=0.0)
+            if weight > 0:
+                scored.append((-weight, position, skill))
+        return [skill for _, _, skill in sorted(scored)]
+
+
+def load_job_skill_index(path=JOB_SKILL_INDEX_PATH):
+    """Load the saved index (an empty index if it has not been built yet)"""
+    if not os.path.exists(path):
+        return JobSkillIndex()
+    return JobSkillIndex(joblib.load(path))
+
+
+# Loaded once per process next to the job recommender
+register_model("job_skill_index", load_job_skill_index)
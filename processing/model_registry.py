@@ -0,0 +1,176 @@
+import os
+import time
+import logging
+import threading
+import joblib
+
+# 📌 Registry configuration
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODELS_DIR = os.path.join(BASE_DIR, "models")
+
+# Memory-map numpy arrays stored in joblib pickles ("r" = read-only, shared
+# between forked workers). Set READUME_MODEL_MMAP="" to load them into memory.
+MMAP_MODE = os.environ.get("READUME_MODEL_MMAP", "r") or None
+
+# "compact" serves the job recommender from the flat arrays written by
+# processing/compact_model.py instead of unpickling the scikit-learn pipeline
+SERVING_MODEL = os.environ.get("READUME_SERVING_MODEL", "pickle")
+
+_loaders = {}
+_warmups = {}
+_models = {}
+_stats = {}
+_errors = {}
+_locks = {}
+_registry_lock = threading.Lock()
+
+
+def _current_rss_bytes():
+    """Return the resident set size of this process in bytes (0 if unknown)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def register_model(name, loader, warmup=None):
+    """
+    Register a zero-argument loader that builds the model called name.
+    warmup, if given, is called with the loaded model to run a dummy inference.
+    """
+    with _registry_lock:
+        _loaders[name] = loader
+        _warmups[name] = warmup
+        _locks.setdefault(name, threading.Lock())
+
+
+def joblib_loader(filename, mmap_mode=MMAP_MODE):
+    """Return a loader for a joblib pickle stored in the models directory"""
+    def load():
+        return joblib.load(os.path.join(MODELS_DIR, filename), mmap_mode=mmap_mode)
+    return load
+
+
+def _load(name):
+    """Run a model's loader, recording its load time and resident size"""
+    rss_before = _current_rss_bytes()
+    start = time.perf_counter()
+    try:
+        model = _loaders[name]()
+    except Exception as e:
+        _errors[name] = str(e)
+        raise
+    load_time = time.perf_counter() - start
+    rss_after = _current_rss_bytes()
+
+    _stats[name] = {
+        "load_time_seconds": round(load_time, 4),
+        "resident_bytes": max(rss_after - rss_before, 0),
+        "loaded_at": time.time(),
+    }
+    _errors.pop(name, None)
+    logging.info(f"Loaded model '{name}' in {load_time:.2f} seconds "
+                 f"(+{_stats[name]['resident_bytes'] / (1024 * 1024):.1f} MB resident)")
+    return model
+
+
+def get_model(name="job_recommender"):
+    """Return the process-wide instance of a registered model, loading it once"""
+    if name in _models:
+        return _models[name]
+
+    if name not in _loaders:
+        raise KeyError(f"No model registered under '{name}'")
+
+    with _locks[name]:
+        # Another thread may have finished loading while we waited
+        if name in _models:
+            return _models[name]
+        model = _models[name] = _load(name)
+        return model
+
+
+def reload_model(name):
+    """
+    Load a fresh instance of a registered model and swap it in. The old
+    instance stays usable by requests already holding it; the load itself
+    runs outside the model's lock, so get_model keeps answering meanwhile.
+    """
+    if name not in _loaders:
+        raise KeyError(f"No model registered under '{name}'")
+    model = _load(name)
+    with _locks[name]:
+        _models[name] = model
+    return model
+
+
+def is_loaded(name):
+    """Return True if the model has already been loaded in this process"""
+    return name in _models
+
+
+def warmup_model(name):
+    """Load a model if needed and run its warmup inference, recording how long it took"""
+    model = get_model(name)
+    warmup = _warmups.get(name)
+    if warmup is None:
+        return
+    start = time.perf_counter()
+    warmup(model)
+    _stats[name]["warmup_seconds"] = round(time.perf_counter() - start, 4)
+
+
+def preload_models(names=None, warmup=False):
+    """Load (and optionally warm up) models, logging failures instead of raising"""
+    for name in names or list(_loaders):
+        try:
+            if warmup:
+                warmup_model(name)
+            else:
+                get_model(name)
+        except Exception as e:
+            _errors[name] = str(e)
+            logging.error(f"Error loading model '{name}': {str(e)}")
+
+
+def start_background_loading(names=None, warmup=False):
+    """Load models in a daemon thread so the server can answer requests meanwhile"""
+    thread = threading.Thread(target=preload_models, args=(names, warmup),
+                              name="model-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+def model_stats():
+    """Return load state, load time and resident size for every registered model"""
+    with _registry_lock:
+        names = list(_loaders)
+    stats = {}
+    for name in names:
+        if name in _stats:
+            stats[name] = dict(_stats[name], loaded=True)
+        else:
+            stats[name] = {"loaded": False}
+        if name in _errors:
+            stats[name]["error"] = _errors[name]
+    return stats
+
+
+def load_job_recommender():
+    """Load the job recommender in the configured serving format"""
+    if SERVING_MODEL == "compact":
+        from processing.compact_model import compact_model_exists, compact_model_is_stale, load_compact_model
+        if not compact_model_exists():
+            logging.warning("Compact job recommender not exported yet, falling back to the pickle")
+        elif compact_model_is_stale(os.path.join(MODELS_DIR, "job_recommender.pkl")):
+            logging.warning("Compact job recommender is older than job_recommender.pkl "
+                            "(run training/export_compact_model.py), falling back to the pickle")
+        else:
+            return load_compact_model(mmap_mode=MMAP_MODE)
+    return joblib_loader("job_recommender.pkl")()
+
+
+# Default models shipped with the repository
+register_model("job_recommender", load_job_recommender,
+               warmup=lambda model: model.predict_proba(["python, sql"]))
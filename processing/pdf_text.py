@@ -0,0 +1,474 @@
+import io
+import os
+import re
+import math
+import shutil
+import tempfile
+import subprocess
+import threading
+import multiprocessing
+from contextlib import contextmanager
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, the ceiling is admission control only
+    resource = None
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import pytesseract
+from PIL import Image
+import pdf2image
+from processing.metrics import registry as metrics_registry, time_stage, timed_stage
+
+# 📌 Configure OCR (Tesseract)
+pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+
+# A page's embedded text is trusted when it has at least this many visible
+# characters and most of them are letters/digits (garbled font encodings
+# produce mostly symbols).
+MIN_TEXT_LAYER_CHARS = int(os.environ.get("READUME_MIN_TEXT_LAYER_CHARS", 80))
+MIN_TEXT_LAYER_ALNUM_RATIO = float(os.environ.get("READUME_MIN_TEXT_LAYER_ALNUM_RATIO", 0.6))
+
+# Pages needing OCR are spread over a process pool shared by all requests, so
+# concurrent uploads queue for the same workers instead of oversubscribing the
+# machine. The pool is capped at the CPU count; 0 runs OCR in the calling
+# process, without the memory cap or peak measurement below.
+OCR_WORKERS = min(int(os.environ.get("READUME_OCR_WORKERS", min(4, os.cpu_count() or 1))),
+                  os.cpu_count() or 1)
+
+# Pages are rasterised one at a time per worker, in grayscale, at a DPI that
+# suits Tesseract; each image is released as soon as it has been OCR'd.
+OCR_DPI = int(os.environ.get("READUME_OCR_DPI", 300))
+OCR_GRAYSCALE = os.environ.get("READUME_OCR_GRAYSCALE", "1") == "1"
+
+# Memory ceiling for OCR (0 disables), enforced in two ways:
+# - admission: the pages of a request rasterised at once have an estimated
+#   image size (from the page dimensions) under the limit, down to one page
+#   at a time; a page whose estimate alone exceeds it is rejected with
+#   OcrMemoryLimitError before anything is rendered
+# - hard cap: each OCR worker gets RLIMIT_AS of its baseline address space
+#   plus the limit, inherited by the pdftoppm/tesseract processes it starts,
+#   so an estimate that is off fails the page instead of exhausting the host
+OCR_MEMORY_LIMIT_BYTES = int(os.environ.get("READUME_OCR_MEMORY_LIMIT_MB", 512)) * 1024 * 1024
+
+# Uploads up to this size stay in memory and are piped to poppler on stdin;
+# larger ones are spooled to a temporary file that is removed afterwards.
+SPOOL_THRESHOLD_BYTES = int(float(os.environ.get("READUME_PDF_SPOOL_MB", 8)) * 1024 * 1024)
+
+# Fallback when pdfinfo cannot report a page size (US letter, in points)
+DEFAULT_PAGE_SIZE = (612.0, 792.0)
+
+_ocr_pool = None
+_ocr_pool_lock = threading.Lock()
+
+
+def text_extraction_settings():
+    """Everything that changes the text extracted from a given PDF, for cache versioning"""
+    return {
+        "min_text_layer_chars": MIN_TEXT_LAYER_CHARS,
+        "min_text_layer_alnum_ratio": MIN_TEXT_LAYER_ALNUM_RATIO,
+        "ocr_dpi": OCR_DPI,
+        "ocr_grayscale": OCR_GRAYSCALE,
+    }
+
+ocr_peak_rss = metrics_registry.histogram(
+    "readume_ocr_peak_rss_bytes", "Peak resident memory of an OCR worker process while OCRing one page",
+    buckets=tuple(mb * 1024 * 1024 for mb in (64, 128, 256, 384, 512, 768, 1024, 1536, 2048, 4096)))
+
+
+class OcrMemoryLimitError(MemoryError):
+    """Raised when rasterising a page would exceed, or did exceed, the OCR memory ceiling"""
+
+
+# Where each page's text came from
+SOURCE_TEXT_LAYER = "text_layer"
+SOURCE_OCR = "ocr"
+
+
+def extract_text_from_image(image_path):
+    """Extract text from image using Tesseract OCR"""
+    image = Image.open(image_path)
+    text = pytesseract.image_to_string(image)
+    return text
+
+
+@contextmanager
+def open_pdf(source):
+    """
+    Normalise a PDF given as a path, bytes or a binary file-like object.
+
+    Yields either the path or the document's bytes. Bytes and file objects
+    up to SPOOL_THRESHOLD_BYTES are kept in memory; larger ones are copied
+    to a temporary file that is deleted when the block exits, even on error.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        yield os.fspath(source)
+        return
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        head, rest = bytes(source), None
+    else:
+        head = source.read(SPOOL_THRESHOLD_BYTES + 1)
+        rest = source
+    if len(head) <= SPOOL_THRESHOLD_BYTES:
+        yield head
+        return
+    with spooled_pdf(head, rest) as path:
+        yield path
+
+
+@contextmanager
+def spooled_pdf(data, rest=None):
+    """Write data (plus the remainder of the file object rest) to a temporary PDF, removed on exit"""
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as spool:
+        spool.write(data)
+        if rest is not None:
+            shutil.copyfileobj(rest, spool)
+        spool.flush()
+        yield spool.name
+
+
+def run_poppler(command, pdf, output=(), timeout=60):
+    """
+    Run a poppler utility on a path, or on in-memory bytes through stdin
+    ("-"), and return its stdout. output is appended after the input name.
+    """
+    if isinstance(pdf, bytes):
+        args, stdin = command + ["-"], pdf
+    else:
+        args, stdin = command + [pdf], None
+    result = subprocess.run(args + list(output), input=stdin, capture_output=True, timeout=timeout, check=True)
+    return result.stdout
+
+
+def get_page_count(pdf):
+    """Return the number of pages in a PDF (a path or bytes)"""
+    if not isinstance(pdf, bytes):
+        return int(pdf2image.pdfinfo_from_path(pdf)["Pages"])
+    match = re.search(rb"^Pages:\s+(\d+)", run_poppler(["pdfinfo"], pdf, timeout=30), re.MULTILINE)
+    if not match:
+        raise ValueError("Unable to get the page count of the PDF")
+    return int(match.group(1))
+
+
+def extract_text_layer(pdf, page_count):
+    """
+    Return the embedded text of every page using poppler's pdftotext
+    (already required by pdf2image). Pages without a text layer come back
+    as empty strings; if pdftotext is unavailable every page is empty.
+    """
+    try:
+        stdout = run_poppler(["pdftotext", "-enc", "UTF-8"], pdf, output=["-"])
+    except (OSError, subprocess.SubprocessError):
+        return [""] * page_count
+
+    # pdftotext ends every page with a form feed
+    pages = stdout.decode("utf-8", errors="replace").split("\f")[:page_count]
+    return pages + [""] * (page_count - len(pages))
+
+
+def is_text_layer_usable(page_text):
+    """Decide whether a page's embedded text is good enough to skip OCR"""
+    visible = "".join(page_text.split())
+    if len(visible) < MIN_TEXT_LAYER_CHARS:
+        return False
+    alnum = sum(1 for c in visible if c.isalnum())
+    return alnum / len(visible) >= MIN_TEXT_LAYER_ALNUM_RATIO
+
+
+_PAGE_SIZE_LINE = re.compile(r"Page\s+(\d+)\s+size:\s+([\d.]+)\s+x\s+([\d.]+)")
+
+
+def get_page_sizes(pdf, page_count):
+    """Return [(width, height)] in points for every page, using poppler's pdfinfo"""
+    sizes = [DEFAULT_PAGE_SIZE] * page_count
+    try:
+        stdout = run_poppler(["pdfinfo", "-f", "1", "-l", str(page_count)], pdf, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return sizes
+    for line in stdout.decode("utf-8", errors="replace").splitlines():
+        match = _PAGE_SIZE_LINE.match(line)
+        if match and 1 <= int(match.group(1)) <= page_count:
+            sizes[int(match.group(1)) - 1] = (float(match.group(2)), float(match.group(3)))
+    return sizes
+
+
+def estimate_raster_bytes(page_size, dpi=OCR_DPI, grayscale=OCR_GRAYSCALE):
+    """Bytes of the PIL image pdf2image produces for a page of page_size points"""
+    width, height = page_size
+    pixels = math.ceil(width / 72 * dpi) * math.ceil(height / 72 * dpi)
+    return pixels * (1 if grayscale else 3)
+
+
+def rasterise_page(pdf, page_number, dpi=OCR_DPI, grayscale=OCR_GRAYSCALE):
+    """
+    Return a list holding the PIL image of one page (1-based), rendered by
+    pdftoppm to stdout. In-memory PDFs are piped in, since pdf2image's
+    *_from_bytes helpers write the document to a temporary file first; a
+    failed render raises CalledProcessError instead of yielding no image.
+    """
+    command = ["pdftoppm", "-f", str(page_number), "-l", str(page_number), "-r", str(dpi), "-singlefile"]
+    if grayscale:
+        command.append("-gray")
+    stdout = run_poppler(command, pdf)
+    if not stdout:
+        return []
+    image = Image.open(io.BytesIO(stdout))
+    image.load()
+    return [image]
+
+
+# Messages of poppler, Tesseract and Leptonica when an allocation fails
+_OUT_OF_MEMORY_MESSAGE = re.compile(r"out of memory|bad_alloc|cannot allocate|malloc fail|memory allocation",
+                                    re.IGNORECASE)
+
+
+def _is_out_of_memory(error):
+    """
+    True if a pdftoppm (CalledProcessError) or Tesseract (TesseractError)
+    failure looks like the address space cap: an allocation failure message,
+    or death by a signal (a failed allocation in C++ code aborts)
+    """
+    if isinstance(error, subprocess.CalledProcessError):
+        status, message = error.returncode, error.stderr
+    else:
+        status, message = getattr(error, "status", None), getattr(error, "message", "")
+    if isinstance(message, bytes):
+        message = message.decode("utf-8", errors="replace")
+    return (isinstance(status, int) and status < 0) or bool(_OUT_OF_MEMORY_MESSAGE.search(str(message or "")))
+
+
+def _read_status_kb(field):
+    """A memory field of /proc/self/status in bytes (None where unavailable)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _reset_peak_rss():
+    """Reset this process's high-water RSS mark (VmHWM); False if the kernel does not allow it"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+# Set in OCR pool workers: only there is the process's own peak meaningful
+_in_ocr_worker = False
+# Set once the address space cap is in place in this process
+_memory_limited = False
+
+
+def ocr_page_with_stats(pdf, page_number, dpi=OCR_DPI, grayscale=OCR_GRAYSCALE):
+    """
+    Rasterise a single page (1-based), run Tesseract on it and free the image.
+
+    Returns:
+        tuple: (text, stats) with the image size and, in an OCR worker, the
+               worker's peak RSS while handling the page (its poppler and
+               tesseract subprocesses are capped by the rlimit, not measured)
+    """
+    measure = _in_ocr_worker and _reset_peak_rss()
+    try:
+        images = rasterise_page(pdf, page_number, dpi, grayscale)
+        image_bytes = 0
+        text = ""
+        if images:
+            image = images.pop()
+            try:
+                image_bytes = image.width * image.height * len(image.getbands())
+                text = pytesseract.image_to_string(image)
+            finally:
+                image.close()
+    except MemoryError:
+        raise _page_over_limit(page_number)
+    except (subprocess.CalledProcessError, pytesseract.TesseractError) as e:
+        # pdftoppm and tesseract inherit the cap and fail on their own
+        if _memory_limited and _is_out_of_memory(e):
+            raise _page_over_limit(page_number) from e
+        raise
+    stats = {"image_bytes": image_bytes}
+    if measure:
+        stats["peak_rss_bytes"] = _read_status_kb("VmHWM")
+    return text, stats
+
+
+def _page_over_limit(page_number):
+    return OcrMemoryLimitError(
+        f"Page {page_number} exceeded the {OCR_MEMORY_LIMIT_BYTES / (1024 * 1024):.0f} MB OCR memory limit")
+
+
+def ocr_page(pdf, page_number, dpi=OCR_DPI, grayscale=OCR_GRAYSCALE):
+    """Rasterise a single page (1-based) and run Tesseract on it"""
+    return ocr_page_with_stats(pdf, page_number, dpi, grayscale)[0]
+
+
+def _apply_memory_limit():
+    """Cap this process's address space at its current size plus OCR_MEMORY_LIMIT_BYTES"""
+    global _memory_limited
+    if not OCR_MEMORY_LIMIT_BYTES or resource is None:
+        return
+    baseline = _read_status_kb("VmSize")
+    if baseline is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = baseline + OCR_MEMORY_LIMIT_BYTES
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    _memory_limited = True
+
+
+def _init_ocr_worker():
+    """
+    Keep each Tesseract process single-threaded (parallelism comes from the
+    pool) and put the worker and its subprocesses under the memory cap
+    """
+    global _in_ocr_worker
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    _in_ocr_worker = True
+    _apply_memory_limit()
+
+
+def _ocr_pool_context():
+    # Workers are started from a clean forkserver (spawn where unavailable)
+    # instead of forking the server: a fork would copy its loaded models and
+    # any lock held by another request thread at that moment
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def create_ocr_pool(max_workers):
+    """Create a process pool suitable for ocr_pages"""
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=_ocr_pool_context(),
+                               initializer=_init_ocr_worker)
+
+
+def get_ocr_pool():
+    """Return the shared OCR process pool (created on first use), or None if disabled"""
+    global _ocr_pool
+    if OCR_WORKERS < 1:
+        return None
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            _ocr_pool = create_ocr_pool(OCR_WORKERS)
+        return _ocr_pool
+
+
+def ocr_pages(pdf, page_numbers, executor=None, with_stats=False, max_in_flight=None):
+    """
+    OCR several pages of pdf (a path or bytes) and return their text in the
+    order of page_numbers (or (text, stats) pairs when with_stats is True).
+    Pages run on executor (default: the shared OCR pool, so even a single
+    page is under the worker memory cap), with at most max_in_flight pages
+    rasterised at any time. An in-memory document going to the pool is sent
+    as is up to SPOOL_THRESHOLD_BYTES; a larger one is spooled to one
+    temporary file, so only its path is sent per page.
+    """
+    page_numbers = list(page_numbers)
+    if executor is None:
+        executor = get_ocr_pool()
+    if executor is None:
+        results = [ocr_page_with_stats(pdf, page_number) for page_number in page_numbers]
+    elif isinstance(pdf, bytes) and len(pdf) > SPOOL_THRESHOLD_BYTES and page_numbers:
+        # Submitting bytes pickles the whole document once per page, which is
+        # cheap for a small upload; spool a large one once and let the
+        # workers render from the file instead
+        with spooled_pdf(pdf) as path:
+            return ocr_pages(path, page_numbers, executor, with_stats, max_in_flight)
+    else:
+        # Submit a sliding window rather than the whole document, so a long
+        # scan never has more than max_in_flight page images alive at once
+        max_in_flight = max_in_flight or len(page_numbers)
+        futures = {}
+        pending = set()
+        for index, page_number in enumerate(page_numbers):
+            if len(pending) >= max_in_flight:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+            future = executor.submit(ocr_page_with_stats, pdf, page_number)
+            futures[index] = future
+            pending.add(future)
+        results = [futures[index].result() for index in range(len(page_numbers))]
+    return results if with_stats else [text for text, _ in results]
+
+
+def plan_ocr_window(page_sizes, workers, limit=OCR_MEMORY_LIMIT_BYTES):
+    """
+    Return how many pages may be rasterised at once so that the largest
+    page images held together stay under limit. Raises OcrMemoryLimitError
+    when even a single page is over it.
+    """
+    estimates = sorted((estimate_raster_bytes(size) for size in page_sizes), reverse=True)
+    if not limit or not estimates:
+        return max(workers, 1)
+    if estimates[0] > limit:
+        raise OcrMemoryLimitError(
+            f"A page needs about {estimates[0] / (1024 * 1024):.0f} MB to rasterise at {OCR_DPI} DPI, "
+            f"over the {limit / (1024 * 1024):.0f} MB per-request limit")
+    window = 1
+    while window < workers and sum(estimates[:window + 1]) <= limit:
+        window += 1
+    return window
+
+
+@timed_stage("extract_text")
+def extract_text_with_sources(source):
+    """
+    Extract text from a PDF, using the embedded text layer where it is usable
+    and OCR only for scanned or empty pages. source is a path, the PDF's
+    bytes or a binary file-like object (see open_pdf).
+
+    Returns:
+        tuple: (text, pages) where pages is a list of
+               {"page": n, "source": "text_layer" | "ocr", "chars": int};
+               OCR'd pages also report "image_bytes" and, when OCR ran in
+               a pool worker on Linux, that worker's "peak_rss_bytes"
+    """
+    with open_pdf(source) as pdf:
+        with time_stage("text_layer"):
+            page_count = get_page_count(pdf)
+            layer_pages = extract_text_layer(pdf, page_count)
+
+        # OCR every page whose text layer is missing or unusable in one go
+        ocr_numbers = [n for n, layer_text in enumerate(layer_pages, start=1)
+                       if not is_text_layer_usable(layer_text)]
+        ocr_texts = {}
+        ocr_stats = {}
+        if ocr_numbers:
+            page_sizes = get_page_sizes(pdf, page_count)
+            # Only as many pages as fit under the memory ceiling are rasterised at once
+            window = plan_ocr_window([page_sizes[n - 1] for n in ocr_numbers], OCR_WORKERS)
+            with time_stage("ocr"):
+                results = ocr_pages(pdf, ocr_numbers, with_stats=True, max_in_flight=window)
+                for page_number, (page_text, stats) in zip(ocr_numbers, results):
+                    ocr_texts[page_number] = page_text
+                    ocr_stats[page_number] = stats
+            for stats in ocr_stats.values():
+                if stats.get("peak_rss_bytes"):
+                    ocr_peak_rss.observe(stats["peak_rss_bytes"])
+
+    page_texts = []
+    pages = []
+    for page_number, layer_text in enumerate(layer_pages, start=1):
+        if page_number in ocr_texts:
+            page_text, source = ocr_texts[page_number], SOURCE_OCR
+        else:
+            page_text, source = layer_text, SOURCE_TEXT_LAYER
+        page_texts.append(page_text)
+        page = {"page": page_number, "source": source, "chars": len(page_text)}
+        if page_number in ocr_stats:
+            page.update(ocr_stats[page_number])
+        pages.append(page)
+
+    text = "".join(page_text + "\n" for page_text in page_texts)
+    return text, pages
+
+
+def extract_text_from_pdf(source):
+    """Extract text from a PDF (path, bytes or file object), falling back to Tesseract OCR for pages without a text layer"""
+    text, _ = extract_text_with_sources(source)
+    return text
@@ -0,0 +1,239 @@
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+# 📌 Cache configuration (override with environment variables)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.environ.get("READUME_CACHE_DIR", os.path.join(BASE_DIR, "cache", "results"))
+MEMORY_MAX_BYTES = int(os.environ.get("READUME_CACHE_MEMORY_MB", 64)) * 1024 * 1024
+DISK_MAX_BYTES = int(os.environ.get("READUME_CACHE_DISK_MB", 512)) * 1024 * 1024
+
+# Once the disk tier is over its limit it is trimmed to this fraction of it,
+# so the directory scan behind eviction runs once per 10% of capacity written
+DISK_LOW_WATER_RATIO = 0.9
+
+# Pipeline stages that can be cached independently
+STAGES = ("text", "skills", "analysis")
+
+
+def hash_bytes(data):
+    """Return the content hash used as cache key for uploaded bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_signature(*paths):
+    """
+    Fingerprint of files (or directories' files) by size and modification
+    time, for cache versions that must change when a model is retrained.
+    Missing paths contribute a placeholder.
+    """
+    parts = []
+    for path in paths:
+        files = [path]
+        if os.path.isdir(path):
+            files = sorted(os.path.join(root, name) for root, _, names in os.walk(path) for name in names)
+        for file in files:
+            try:
+                st = os.stat(file)
+                parts.append(f"{file}:{st.st_size}:{st.st_mtime_ns}")
+            except OSError:
+                parts.append(f"{file}:-")
+    return hash_bytes("\n".join(parts).encode("utf-8"))
+
+
+class ResultCache:
+    """
+    Two-tier (memory LRU + disk) cache for resume pipeline results.
+
+    Entries are addressed by (content hash, stage) and stored as JSON, so
+    every caller gets its own copy of the cached value. Both tiers are
+    bounded by size in bytes; the memory tier evicts least recently used
+    entries and the disk tier evicts the files with the oldest access time.
+
+    versions maps a stage to a fingerprint of the code and models producing
+    it. Disk entries live under their stage's version, so a retrained model
+    or a changed pipeline never reads results written by the previous one;
+    the orphaned entries age out through normal eviction.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, memory_max_bytes=MEMORY_MAX_BYTES,
+                 disk_max_bytes=DISK_MAX_BYTES, stages=STAGES, versions=None):
+        self.cache_dir = cache_dir
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.stages = tuple(stages)
+        self.versions = {stage: (versions or {}).get(stage) for stage in self.stages}
+
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._counters = {
+            stage: {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+            for stage in self.stages
+        }
+        self._evictions = {"memory": 0, "disk": 0}
+
+        if self.disk_max_bytes > 0:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+
+    def _disk_path(self, key, stage):
+        version = self.versions.get(stage)
+        if version:
+            return os.path.join(self.cache_dir, stage, version[:16], key[:2], f"{key}.json")
+        return os.path.join(self.cache_dir, stage, key[:2], f"{key}.json")
+
+    def _scan_disk(self):
+        """Yield (path, size, last access) for every cached file on disk"""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                yield path, st.st_size, st.st_mtime
+
+    def _check_stage(self, stage):
+        if stage not in self._counters:
+            raise ValueError(f"Unknown cache stage: {stage}")
+
+    def get(self, key, stage):
+        """Return the cached value for (key, stage), or None on a miss"""
+        self._check_stage(stage)
+        with self._lock:
+            payload = self._memory.get((key, stage))
+            if payload is not None:
+                self._memory.move_to_end((key, stage))
+                self._counters[stage]["memory_hits"] += 1
+                return json.loads(payload)
+
+        payload = None
+        if self.disk_max_bytes > 0:
+            path = self._disk_path(key, stage)
+            try:
+                with open(path, "rb") as f:
+                    payload = f.read()
+                # Touch the file so disk eviction follows access order
+                os.utime(path, None)
+            except (OSError, ValueError):
+                payload = None
+
+        with self._lock:
+            if payload is None:
+                self._counters[stage]["misses"] += 1
+                return None
+            self._counters[stage]["disk_hits"] += 1
+            self._store_memory(key, stage, payload)
+        return json.loads(payload)
+
+    def set(self, key, stage, value):
+        """Store a JSON-serialisable value for (key, stage) in both tiers"""
+        self._check_stage(stage)
+        # Kept as UTF-8 bytes, so both tiers are sized in bytes (non-ASCII
+        # text takes more bytes than characters)
+        payload = json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+        with self._lock:
+            self._store_memory(key, stage, payload)
+            self._counters[stage]["writes"] += 1
+
+        if self.disk_max_bytes > 0:
+            self._store_disk(key, stage, payload)
+
+    def _store_memory(self, key, stage, payload):
+        size = len(payload)
+        if size > self.memory_max_bytes:
+            return
+        old = self._memory.pop((key, stage), None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[(key, stage)] = payload
+        self._memory_bytes += size
+
+        while self._memory_bytes > self.memory_max_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._evictions["memory"] += 1
+
+    def _store_disk(self, key, stage, data):
+        if len(data) > self.disk_max_bytes:
+            return
+        path = self._disk_path(key, stage)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        try:
+            previous = os.path.getsize(path)
+        except OSError:
+            previous = 0
+
+        # Write to a temporary file first so readers never see partial entries
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._disk_bytes += len(data) - previous
+            over_limit = self._disk_bytes > self.disk_max_bytes
+        if over_limit:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        """Delete least recently accessed files until the disk tier is back under its low-water mark"""
+        entries = sorted(self._scan_disk(), key=lambda entry: entry[2])
+        target = self.disk_max_bytes * DISK_LOW_WATER_RATIO
+        with self._lock:
+            self._disk_bytes = sum(size for _, size, _ in entries)
+            for path, size, _ in entries:
+                if self._disk_bytes <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                self._disk_bytes -= size
+                self._evictions["disk"] += 1
+
+    def clear(self):
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        for path, _, _ in list(self._scan_disk()):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._disk_bytes = 0
+
+    def stats(self):
+        """Return hit/miss counters and current tier sizes"""
+        with self._lock:
+            stages = {}
+            for stage, counters in self._counters.items():
+                hits = counters["memory_hits"] + counters["disk_hits"]
+                lookups = hits + counters["misses"]
+                stages[stage] = dict(counters, hit_rate=round(hits / lookups, 4) if lookups else 0.0)
+            return {
+                "stages": stages,
+                "memory": {
+                    "entries": len(self._memory),
+                    "bytes": self._memory_bytes,
+                    "max_bytes": self.memory_max_bytes,
+                    "evictions": self._evictions["memory"],
+                },
+                "disk": {
+                    "path": self.cache_dir,
+                    "bytes": self._disk_bytes,
+                    "max_bytes": self.disk_max_bytes,
+                    "evictions": self._evictions["disk"],
+                },
+                "versions": dict(self.versions),
+            }
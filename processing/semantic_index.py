@@ -0,0 +1,338 @@
+import io
+import os
+import sys
+import time
+import logging
+import threading
+import numpy as np
+import joblib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.model_registry import register_model, get_model, reload_model, MMAP_MODE
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEMANTIC_INDEX_DIR = os.path.join(BASE_DIR, "models", "semantic_index")
+
+# Default build parameters
+DEFAULT_DIMENSIONS = 128
+DEFAULT_SVD_SAMPLE = 200000
+DEFAULT_NPROBE = 16
+
+# Below this many postings queries scan every embedding instead of probing lists
+EXACT_SEARCH_LIMIT = 20000
+
+# How often (seconds) a running server checks for a newer saved index
+RELOAD_SECONDS = float(os.environ.get("READUME_SEMANTIC_INDEX_RELOAD_SECONDS", 30))
+
+
+def _normalize_rows(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32, copy=False)
+
+
+def _save_array(directory, name, array):
+    """Write name.npy atomically, leaving any existing file (and maps of it) intact"""
+    path = os.path.join(directory, f"{name}.npy")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp_path, path)
+
+
+def _append_array_rows(directory, name, rows, start):
+    """
+    Write rows into name.npy from row start on, growing the file in place and
+    then updating the shape in its header. Readers (memory maps included)
+    only use the rows their metadata knows about, which all come before
+    start, so they are never disturbed. Returns False, leaving the file
+    untouched, when that is not possible (format or header size would change).
+    """
+    path = os.path.join(directory, f"{name}.npy")
+    try:
+        f = open(path, "r+b")
+    except OSError:
+        return False
+    with f:
+        if np.lib.format.read_magic(f) != (1, 0):
+            return False
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        data_offset = f.tell()
+        if fortran_order or dtype != rows.dtype or shape[1:] != rows.shape[1:] or shape[0] < start:
+            return False
+
+        header = io.BytesIO()
+        np.lib.format.write_array_header_1_0(header, {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": (start + len(rows),) + tuple(shape[1:]),
+        })
+        if header.tell() != data_offset:
+            return False
+
+        row_bytes = dtype.itemsize * int(np.prod(shape[1:], dtype=np.int64))
+        f.seek(data_offset + start * row_bytes)
+        f.write(np.ascontiguousarray(rows).tobytes())
+        # Drops rows of an earlier append that never got its metadata saved
+        f.truncate()
+        f.flush()
+        f.seek(0)
+        f.write(header.getvalue())
+    return True
+
+
+class SemanticIndex:
+    """
+    Dense job-matching index: an LSA projection of the TF-IDF space plus an
+    inverted-file (IVF) approximate nearest-neighbour structure.
+
+    Posting embeddings live in one contiguous float32 array. Each posting is
+    assigned to its nearest coarse centroid; a query only scores the postings
+    in its nprobe closest lists. New postings are embedded with the existing
+    projection and appended to their list, so no rebuild is needed.
+    """
+
+    def __init__(self, vectorizer, components, centroids, embeddings, list_offsets, list_ids, meta):
+        self.vectorizer = vectorizer
+        self.components = components          # (dimensions, terms) float32
+        self.centroids = centroids            # (lists, dimensions) float32
+        self._embeddings = embeddings         # (capacity, dimensions) float32
+        self._size = len(meta["title"]) if meta else embeddings.shape[0]
+        self.list_offsets = list_offsets      # CSR-style offsets into list_ids
+        self.list_ids = list_ids
+        self.meta = {field: list(values) for field, values in meta.items()}
+        self._appended = {}                   # list -> ids added since the last save
+        self._saved_size = self._size         # rows already in the saved embeddings file
+        self.version = None                   # see index_version, set when loaded from disk
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def embeddings(self):
+        return self._embeddings[:self._size]
+
+    def embed(self, texts):
+        """Project texts into the dense space (unit-length float32 rows)"""
+        tfidf = self.vectorizer.transform(texts)
+        return _normalize_rows(np.asarray(tfidf @ self.components.T, dtype=np.float32))
+
+    def _assign(self, vectors):
+        return np.argmax(vectors @ self.centroids.T, axis=1)
+
+    def _list_members(self, list_number):
+        members = self.list_ids[self.list_offsets[list_number]:self.list_offsets[list_number + 1]]
+        appended = self._appended.get(int(list_number))
+        if appended:
+            members = np.concatenate([members, np.asarray(appended, dtype=members.dtype)])
+        return members
+
+    def top_k(self, query_text, k=10, nprobe=DEFAULT_NPROBE):
+        """Return [(posting row, cosine score)] for the k nearest postings, best first"""
+        if not len(self):
+            return []
+        query = self.embed([query_text])[0]
+
+        if len(self) <= EXACT_SEARCH_LIMIT:
+            candidates = np.arange(len(self))
+        else:
+            nprobe = min(nprobe, len(self.centroids))
+            closest = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+            candidates = np.concatenate([self._list_members(c) for c in closest])
+            # Lists loaded while a newer index was being saved may already
+            # name postings this index's metadata does not have
+            candidates = candidates[candidates < len(self)]
+        if not len(candidates):
+            return []
+
+        scores = self._embeddings[candidates] @ query
+        k = min(k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(int(candidates[i]), float(scores[i])) for i in best]
+
+    def add_postings(self, documents, metas):
+        """Embed and append new postings without rebuilding the projection or centroids"""
+        if not documents:
+            return []
+        vectors = self.embed(documents)
+        start = self._size
+        end = start + len(vectors)
+
+        if end > self._embeddings.shape[0] or not self._embeddings.flags.writeable:
+            # Grow geometrically; this also copies a read-only memory map into RAM
+            capacity = max(end, int(self._embeddings.shape[0] * 1.5) + 1024)
+            grown = np.empty((capacity, self._embeddings.shape[1]), dtype=np.float32)
+            grown[:start] = self._embeddings[:start]
+            self._embeddings = grown
+        self._embeddings[start:end] = vectors
+
+        for row, list_number in zip(range(start, end), self._assign(vectors)):
+            self._appended.setdefault(int(list_number), []).append(row)
+        for field in self.meta:
+            self.meta[field].extend(meta.get(field, "") for meta in metas)
+        self._size = end
+        return list(range(start, end))
+
+    def posting(self, row):
+        return {field: values[row] for field, values in self.meta.items()}
+
+    def save(self, directory=SEMANTIC_INDEX_DIR):
+        """Write the whole index, merging appended postings into the inverted lists"""
+        os.makedirs(directory, exist_ok=True)
+        # Every file goes to a temporary name and is swapped in with os.replace:
+        # the arrays being saved may be memory maps of the very files being
+        # replaced (this process or a running server), which must never be
+        # truncated in place. meta.pkl goes last since it marks a complete index.
+        _save_array(directory, "embeddings", np.ascontiguousarray(self.embeddings))
+        _save_array(directory, "components", self.components)
+        _save_array(directory, "centroids", self.centroids)
+        self._save_lists_and_meta(directory)
+
+    def save_appended(self, directory=SEMANTIC_INDEX_DIR):
+        """
+        Write the postings added since this index was loaded from directory:
+        only their embedding rows are written, at the end of the existing
+        file, instead of rewriting every embedding. Falls back to save().
+        """
+        new_rows = np.ascontiguousarray(self._embeddings[self._saved_size:self._size])
+        if not _append_array_rows(directory, "embeddings", new_rows, self._saved_size):
+            self.save(directory)
+            return
+        self._save_lists_and_meta(directory)
+
+    def _save_lists_and_meta(self, directory):
+        assignments = np.empty(len(self), dtype=np.int32)
+        for list_number in range(len(self.centroids)):
+            assignments[self._list_members(list_number)] = list_number
+        list_ids = np.argsort(assignments, kind="stable").astype(np.int64)
+        list_offsets = np.concatenate([[0], np.cumsum(np.bincount(assignments, minlength=len(self.centroids)))])
+
+        _save_array(directory, "list_offsets", list_offsets.astype(np.int64))
+        _save_array(directory, "list_ids", list_ids)
+        meta_path = os.path.join(directory, "meta.pkl")
+        tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+        joblib.dump({"vectorizer": self.vectorizer, "meta": self.meta, "saved_at": time.time()}, tmp_path)
+        os.replace(tmp_path, meta_path)
+        self.list_ids, self.list_offsets, self._appended = list_ids, list_offsets, {}
+        self._saved_size = self._size
+        print(f"✅ Saved semantic index with {len(self)} postings to {directory}")
+
+
+def build_semantic_index(job_index_payload, dimensions=DEFAULT_DIMENSIONS, lists=None,
+                         svd_sample=DEFAULT_SVD_SAMPLE, random_state=42):
+    """
+    Build a SemanticIndex from the TF-IDF job index payload (see job_index.py):
+    fit an LSA projection and coarse centroids on a sample, then embed and
+    assign every posting.
+    """
+    from sklearn.decomposition import TruncatedSVD
+    from sklearn.cluster import MiniBatchKMeans
+
+    matrix = job_index_payload["matrix"]
+    rows = matrix.shape[0]
+    rng = np.random.default_rng(random_state)
+    sample = np.sort(rng.choice(rows, size=min(svd_sample, rows), replace=False))
+
+    dimensions = min(dimensions, matrix.shape[1] - 1, len(sample) - 1)
+    svd = TruncatedSVD(n_components=dimensions, random_state=random_state)
+    svd.fit(matrix[sample])
+    components = svd.components_.astype(np.float32)
+
+    # Embed in blocks to keep peak memory bounded
+    embeddings = np.empty((rows, dimensions), dtype=np.float32)
+    for start in range(0, rows, 100000):
+        block = matrix[start:start + 100000]
+        embeddings[start:start + block.shape[0]] = _normalize_rows(np.asarray(block @ components.T))
+
+    lists = lists or max(1, int(4 * np.sqrt(rows)))
+    lists = min(lists, len(sample))
+    kmeans = MiniBatchKMeans(n_clusters=lists, random_state=random_state, batch_size=4096, n_init=3)
+    kmeans.fit(embeddings[sample])
+    centroids = _normalize_rows(kmeans.cluster_centers_)
+
+    assignments = np.empty(rows, dtype=np.int32)
+    for start in range(0, rows, 100000):
+        block = embeddings[start:start + 100000]
+        assignments[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    list_ids = np.argsort(assignments, kind="stable").astype(np.int64)
+    list_offsets = np.concatenate([[0], np.cumsum(np.bincount(assignments, minlength=lists))]).astype(np.int64)
+
+    meta = {field: list(values) for field, values in job_index_payload["meta"].items()}
+    return SemanticIndex(job_index_payload["vectorizer"], components, centroids, embeddings,
+                         list_offsets, list_ids, meta)
+
+
+def index_version(directory=SEMANTIC_INDEX_DIR):
+    """Identify the saved index by its metadata file, which every save replaces last (None if not built)"""
+    try:
+        st = os.stat(os.path.join(directory, "meta.pkl"))
+    except OSError:
+        return None
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def load_semantic_index(directory=SEMANTIC_INDEX_DIR):
+    """Load a saved index with its embeddings memory-mapped (None if not built yet)"""
+    meta_path = os.path.join(directory, "meta.pkl")
+    version = index_version(directory)
+    if version is None:
+        return None
+
+    def array(name, mmap_mode=None):
+        return np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode)
+
+    # The metadata is read first: arrays saved after it only ever hold more rows
+    payload = joblib.load(meta_path)
+    index = SemanticIndex(
+        payload["vectorizer"],
+        array("components"),
+        array("centroids"),
+        array("embeddings", MMAP_MODE),
+        array("list_offsets"),
+        array("list_ids", MMAP_MODE),
+        payload["meta"],
+    )
+    index.version = version
+    return index
+
+
+register_model("semantic_index", load_semantic_index)
+
+_checked = 0.0
+_reloading = False
+_reload_lock = threading.Lock()
+
+
+def _reload():
+    global _reloading
+    try:
+        index = reload_model("semantic_index")
+        logging.info(f"Reloaded semantic index with {len(index) if index is not None else 0} postings")
+    except Exception as e:
+        logging.error(f"Failed to reload the semantic index: {str(e)}")
+    finally:
+        with _reload_lock:
+            _reloading = False
+
+
+def get_semantic_index():
+    """
+    Return the serving index (None if not built), picking up a newer saved
+    one, e.g. after build_semantic_index.py --append. The files are checked
+    at most every RELOAD_SECONDS; a reload runs in the background while
+    queries keep using the current index.
+    """
+    global _checked, _reloading
+    index = get_model("semantic_index")
+    now = time.monotonic()
+    if now - _checked < RELOAD_SECONDS:
+        return index
+    with _reload_lock:
+        if now - _checked < RELOAD_SECONDS or _reloading:
+            return index
+        _checked = now
+        version = index_version()
+        if version is not None and version != getattr(index, "version", None):
+            _reloading = True
+            threading.Thread(target=_reload, name="semantic-index-reload", daemon=True).start()
+    return index
@@ -1,46 +1,116 @@
 import re
-import pytesseract
-from PIL import Image
-import pdf2image
-from transformers import pipeline
-
-# 📌 Configure OCR (Tesseract)
-pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-
-# 📌 Load Hugging Face NLP Model
-generator = pipeline("text2text-generation", model="google/flan-t5-small")
-
-def extract_text_from_image(image_path):
-    """Extract text from image using Tesseract OCR"""
-    image = Image.open(image_path)
-    text = pytesseract.image_to_string(image)
-    return text
-
-def extract_text_from_pdf(pdf_path):
-    """Extract text from PDF using Tesseract OCR on each page"""
-    images = pdf2image.convert_from_path(pdf_path)
-    text = ""
-    for img in images:
-        text += pytesseract.image_to_string(img) + "\n"
-    return text
+import os
+import sys
+import json
+import threading
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.pdf_text import extract_text_from_image, extract_text_from_pdf, extract_text_with_sources
+from processing.skill_matcher import SkillMatcher
+from processing.model_registry import register_model, get_model
+from processing.metrics import timed_stage
+from processing.result_cache import ResultCache, hash_bytes, file_signature
+import processing.skill_vocabulary  # registers the "skill_vocabulary" model
 
-def extract_skills(resume_text):
+# 📌 Hugging Face NLP Model (loaded on first use through the model registry)
+SKILL_MODEL_NAME = "google/flan-t5-small"
+
+# Local copy of the model (see training/export_skill_model.py); the hub name is
+# used when the directory does not exist
+SKILL_MODEL_DIR = os.environ.get(
+    "READUME_SKILL_MODEL_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models", "flan-t5-small")
+)
+
+# Inference backend: "pytorch" (full precision), "int8" (PyTorch dynamic
+# quantization of the Linear layers) or "onnx" (ONNX Runtime through optimum)
+SKILL_MODEL_BACKEND = os.environ.get("READUME_SKILL_BACKEND", "pytorch")
+SKILL_MODEL_BACKENDS = ("pytorch", "int8", "onnx")
+
+# CPU threads used by the backend (0 keeps the runtime's default)
+SKILL_MODEL_THREADS = int(os.environ.get("READUME_SKILL_THREADS", 0))
+
+def skill_model_source(backend=SKILL_MODEL_BACKEND, model_dir=SKILL_MODEL_DIR):
+    """Return the local directory for the backend if it exists, otherwise the hub name"""
+    local_dir = f"{model_dir}-onnx" if backend == "onnx" else model_dir
+    return local_dir if os.path.isdir(local_dir) else SKILL_MODEL_NAME
+
+def load_skill_generator(backend=SKILL_MODEL_BACKEND, model_dir=SKILL_MODEL_DIR, threads=SKILL_MODEL_THREADS):
+    """Build a text2text-generation pipeline for the skill model on the given backend"""
+    if backend not in SKILL_MODEL_BACKENDS:
+        raise ValueError(f"Unknown skill model backend '{backend}', expected one of {SKILL_MODEL_BACKENDS}")
+
+    from transformers import pipeline, AutoTokenizer
+    source = skill_model_source(backend, model_dir)
+    tokenizer = AutoTokenizer.from_pretrained(source)
+
+    if backend == "onnx":
+        try:
+            import onnxruntime
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        except ImportError as e:
+            raise ImportError("The onnx backend needs optimum[onnxruntime] installed") from e
+        session_options = onnxruntime.SessionOptions()
+        session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            session_options.intra_op_num_threads = threads
+            session_options.inter_op_num_threads = 1
+        # Export on the fly when only the PyTorch weights are available
+        exported = os.path.exists(os.path.join(source, "encoder_model.onnx"))
+        model = ORTModelForSeq2SeqLM.from_pretrained(source, export=not exported, session_options=session_options)
+    else:
+        import torch
+        from transformers import AutoModelForSeq2SeqLM
+        if threads:
+            torch.set_num_threads(threads)
+        model = AutoModelForSeq2SeqLM.from_pretrained(source)
+        model.eval()
+        if backend == "int8":
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    return pipeline("text2text-generation", model=model, tokenizer=tokenizer)
+
+def _load_generator():
+    return load_skill_generator()
+
+def _warmup_generator(generator):
+    generator(SKILL_PROMPT_TEMPLATE.format(chunk="Python, SQL, Docker"), **GENERATION_KWARGS)
+
+register_model("skill_extractor", _load_generator, warmup=_warmup_generator)
+
+def get_generator():
+    """Return the shared text2text-generation pipeline, loading it on first use"""
+    return get_model("skill_extractor")
+
+# 📌 Batched inference settings: chunks are sorted by length and grouped so that
+# a batch holds at most SKILL_BATCH_SIZE prompts and at most SKILL_TOKEN_BUDGET
+# padded input tokens.
+SKILL_BATCH_SIZE = int(os.environ.get("READUME_SKILL_BATCH_SIZE", 8))
+SKILL_TOKEN_BUDGET = int(os.environ.get("READUME_SKILL_TOKEN_BUDGET", 2048))
+
+# Generation settings used for every chunk
+GENERATION_KWARGS = {
+    "max_length": 256,
+    "num_beams": 2,
+    "do_sample": False,
+}
+
+SKILL_PROMPT_TEMPLATE = """
+You are a resume parser that extracts technical skills.
+From the resume text below, identify ONLY technical skills like programming languages, frameworks, tools, and technologies.
+Format your response as: Technical Skills: skill1, skill2, skill3
+
+Resume text: {chunk}
+"""
+
+def chunk_resume_text(resume_text, max_chunk_length=300):
     """
-    Extracts skills from resume text using the Hugging Face model.
-    Handles long texts by chunking.
-    
-    Args:
-        resume_text (str): The raw text extracted from a resume
-        
-    Returns:
-        str: Raw output from the model containing skills
+    Remove section headings and split the resume into chunks of at most
+    max_chunk_length characters to stay within the model's token limit.
     """
     # Filter out non-relevant sections before passing to the model
     cleaned_text = re.sub(r'\b(?:education|experience|projects|work|summary|contact|phone|email|linkedin|github)\b', '', resume_text, flags=re.IGNORECASE)
     
-    # Split text into chunks to handle token limit
     chunks = []
-    max_chunk_length = 300  # Reduced to be safer with token limits
     words = cleaned_text.split()
     
     current_chunk = []
@@ -58,42 +128,212 @@ def extract_skills(resume_text):
     if current_chunk:
         chunks.append(' '.join(current_chunk))
     
-    print(f"Split resume into {len(chunks)} chunks to process")
+    return chunks
+
+def make_length_sorted_batches(lengths, batch_size=SKILL_BATCH_SIZE, token_budget=SKILL_TOKEN_BUDGET):
+    """
+    Group item indices into batches of similar length.
+
+    Items are sorted by length so padding is minimal; a batch is closed when
+    it reaches batch_size items or when padding every item to the longest one
+    would exceed token_budget tokens.
+    """
+    batches = []
+    current = []
+    for index in sorted(range(len(lengths)), key=lambda i: lengths[i]):
+        # Sorted ascending, so the new item is the longest in the batch
+        padded_tokens = lengths[index] * (len(current) + 1)
+        if current and (len(current) >= batch_size or padded_tokens > token_budget):
+            batches.append(current)
+            current = []
+        current.append(index)
+    if current:
+        batches.append(current)
+    return batches
+
+@timed_stage("llm")
+def generate_batched(prompts, batch_size=SKILL_BATCH_SIZE, token_budget=SKILL_TOKEN_BUDGET, generator=None):
+    """
+    Run the text2text model over prompts in padded, length-sorted batches,
+    using generator if given and the shared skill model otherwise.
+
+    Returns:
+        list: Generated text per prompt, in input order (None where inference failed)
+    """
+    if not prompts:
+        return []
+    
+    import torch
+    
+    if generator is None:
+        generator = get_generator()
+    tokenizer = generator.tokenizer
+    model = generator.model
     
-    # Process each chunk and combine results
-    all_outputs = []
+    lengths = [len(ids) for ids in tokenizer(prompts)["input_ids"]]
+    outputs = [None] * len(prompts)
     
+    for batch in make_length_sorted_batches(lengths, batch_size, token_budget):
+        try:
+            inputs = tokenizer([prompts[i] for i in batch], padding=True, return_tensors="pt").to(model.device)
+            with torch.no_grad():
+                generated = model.generate(**inputs, **GENERATION_KWARGS)
+            texts = tokenizer.batch_decode(generated, skip_special_tokens=True, clean_up_tokenization_spaces=False)
+            for i, text in zip(batch, texts):
+                outputs[i] = text
+        except Exception as e:
+            print(f"Error in model inference for batch of {len(batch)} chunks: {str(e)}")
+    
+    return outputs
+
+# 📌 Chunk-level memoization: templated headers, certification lines and
+# bootcamp project blurbs repeat across resumes, so model outputs are cached
+# per chunk and repeated chunks skip inference entirely.
+CHUNK_CACHE_ENABLED = os.environ.get("READUME_CHUNK_CACHE", "1") == "1"
+CHUNK_CACHE_DIR = os.environ.get(
+    "READUME_CHUNK_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "chunks")
+)
+CHUNK_CACHE_MEMORY_MB = int(os.environ.get("READUME_CHUNK_CACHE_MEMORY_MB", 16))
+CHUNK_CACHE_DISK_MB = int(os.environ.get("READUME_CHUNK_CACHE_DISK_MB", 128))
+CHUNK_CACHE_STAGE = "chunk_skills"
+
+_chunk_cache = None
+_chunk_cache_fingerprint = None
+_chunk_cache_lock = threading.Lock()
+
+def skill_model_fingerprint():
+    """
+    Identify everything that changes the model output for a given chunk:
+    the model (including the files of a local copy, so re-exported weights
+    at the same path count as a new model) and its backend, the prompt
+    template and generation settings.
+    """
+    source = skill_model_source()
+    description = json.dumps({
+        "model": SKILL_MODEL_NAME,
+        "source": source,
+        "files": file_signature(source) if os.path.isdir(source) else None,
+        "backend": SKILL_MODEL_BACKEND,
+        "prompt": SKILL_PROMPT_TEMPLATE,
+        "generation": GENERATION_KWARGS,
+    }, sort_keys=True)
+    return hash_bytes(description.encode("utf-8"))
+
+def chunk_cache_key(chunk, fingerprint):
+    return hash_bytes(f"{fingerprint}\0{chunk}".encode("utf-8"))
+
+def get_chunk_cache():
+    """
+    Return the chunk output cache (None when disabled). Keys already include
+    the model fingerprint; when the fingerprint changes the stale entries
+    are also dropped from disk straight away instead of waiting for eviction.
+    """
+    global _chunk_cache, _chunk_cache_fingerprint
+    if not CHUNK_CACHE_ENABLED:
+        return None
+    with _chunk_cache_lock:
+        if _chunk_cache is None:
+            cache = ResultCache(CHUNK_CACHE_DIR, CHUNK_CACHE_MEMORY_MB * 1024 * 1024,
+                                CHUNK_CACHE_DISK_MB * 1024 * 1024, stages=(CHUNK_CACHE_STAGE,))
+            fingerprint = skill_model_fingerprint()
+            fingerprint_path = os.path.join(CHUNK_CACHE_DIR, "fingerprint")
+            try:
+                with open(fingerprint_path) as f:
+                    previous = f.read().strip()
+            except OSError:
+                previous = None
+            if previous != fingerprint and cache.disk_max_bytes > 0:
+                if previous is not None:
+                    print("Skill model or prompt changed, clearing the chunk cache")
+                cache.clear()
+                with open(fingerprint_path, "w") as f:
+                    f.write(fingerprint)
+            _chunk_cache, _chunk_cache_fingerprint = cache, fingerprint
+        return _chunk_cache
+
+def chunk_cache_stats():
+    """Hit/miss counters of the chunk cache (None when disabled)"""
+    cache = get_chunk_cache()
+    return cache.stats() if cache is not None else None
+
+def generate_for_chunks(chunks, generator=None):
+    """
+    Return the model output for each chunk, serving repeated chunks from the
+    chunk cache and sending each distinct uncached chunk to the model once.
+    The cache is bypassed when an explicit generator is passed in.
+    """
+    cache = get_chunk_cache() if generator is None else None
+    if cache is None:
+        return generate_batched([SKILL_PROMPT_TEMPLATE.format(chunk=chunk) for chunk in chunks],
+                                generator=generator)
+
+    outputs = [None] * len(chunks)
+    pending = {}
     for i, chunk in enumerate(chunks):
-        print(f"Processing chunk {i+1}/{len(chunks)}...")
-        
-        # Improved prompt with more specific instructions
-        prompt = f"""
-You are a resume parser that extracts technical skills.
-From the resume text below, identify ONLY technical skills like programming languages, frameworks, tools, and technologies.
-Format your response as: Technical Skills: skill1, skill2, skill3
+        if chunk in pending:
+            pending[chunk].append(i)
+            continue
+        cached = cache.get(chunk_cache_key(chunk, _chunk_cache_fingerprint), CHUNK_CACHE_STAGE)
+        if cached is not None:
+            outputs[i] = cached
+        else:
+            pending[chunk] = [i]
 
-Resume text: {chunk}
-"""
+    misses = list(pending)
+    generated = generate_batched([SKILL_PROMPT_TEMPLATE.format(chunk=chunk) for chunk in misses])
+    for chunk, output in zip(misses, generated):
+        if output is None:
+            continue
+        cache.set(chunk_cache_key(chunk, _chunk_cache_fingerprint), CHUNK_CACHE_STAGE, output)
+        for i in pending[chunk]:
+            outputs[i] = output
+    return outputs
 
-        try:
-            output = generator(
-                prompt,
-                max_length=256,
-                num_beams=2,
-                do_sample=False,
-                temperature=0.3  # Lower temperature for more focused output
-            )
-            all_outputs.append(output[0]['generated_text'])
-            print(f"Chunk {i+1} processed successfully")
-        except Exception as e:
-            print(f"Error in model inference for chunk {i+1}: {str(e)}")
+def extract_skills(resume_text):
+    """
+    Extracts skills from resume text using the Hugging Face model.
+    Handles long texts by chunking and sends the chunks to the model in batches.
     
-    # Combine all outputs
-    combined_output = "\n".join(all_outputs)
+    Args:
+        resume_text (str): The raw text extracted from a resume
+        
+    Returns:
+        str: Raw output from the model containing skills
+    """
+    return extract_skills_batch([resume_text])[0]
+
+def extract_skills_batch(resume_texts, generator=None):
+    """
+    Extracts skills from several resumes at once. The chunks of all resumes
+    share the same length-sorted batches, so small resumes fill up batches
+    instead of each resume running its own partly empty ones.
     
-    # Return only the combined output (not the regex skills)
-    return combined_output
+    Args:
+        resume_texts (list): Raw texts extracted from resumes
+        generator: Pipeline to use instead of the shared skill model
+        
+    Returns:
+        list: Raw model output per resume, in input order
+    """
+    owners = []
+    chunks = []
+    for owner, resume_text in enumerate(resume_texts):
+        for chunk in chunk_resume_text(resume_text):
+            owners.append(owner)
+            chunks.append(chunk)
+    
+    per_resume = [[] for _ in resume_texts]
+    for owner, output in zip(owners, generate_for_chunks(chunks, generator=generator)):
+        if output is not None:
+            per_resume[owner].append(output)
+    print(f"Processed {sum(len(outputs) for outputs in per_resume)}/{len(chunks)} chunks "
+          f"from {len(resume_texts)} resume(s)")
+    
+    # Combine all outputs per resume (not the regex skills)
+    return ["\n".join(outputs) for outputs in per_resume]
 
+@timed_stage("clean_skills")
 def clean_skills(skills_text):
     """
     Clean the extracted skills text and extract only technical skills.
@@ -138,11 +378,16 @@ def clean_skills(skills_text):
                          'machine learning', 'ai', 'artificial intelligence', 'data science', 'linux', 'unix',
                          'bash', 'powershell', 'rest', 'api', 'graphql', 'json', 'xml', 'yaml', 'agile', 'scrum']
     
+    # Skills listed in job postings (the prebuilt skill vocabulary)
+    vocabulary = get_model("skill_vocabulary")
+    
     # Boost confidence in skills that match common technical skills
     final_skills = []
     for skill in filtered_skills:
         if any(common.lower() in skill.lower() or skill.lower() in common.lower() for common in common_tech_skills):
             final_skills.append(skill)  # It's likely a real technical skill
+        elif skill in vocabulary:
+            final_skills.append(skill)  # Known from job postings, however short
         elif len(skill) > 4 and not skill.isdigit():  # Longer terms that aren't just numbers
             final_skills.append(skill)
     
@@ -152,57 +397,49 @@ def clean_skills(skills_text):
     
     return skills_dict
 
-def extract_skills_with_regex(resume_text):
-    """
-    Use regex patterns to extract common technical skills directly from resume text.
-    This complements the model-based approach for better accuracy.
-    """
+# 📌 Dictionary of common technical skills matched directly in the resume text
+TECH_SKILL_DICTIONARY = [
     # Common programming languages
-    programming_langs = r'\b(Python|Java|JavaScript|TypeScript|C\+\+|C#|Ruby|PHP|Swift|Kotlin|Go|Rust|Scala|R|MATLAB|Perl|Shell|Bash|PowerShell|SQL|NoSQL|HTML|CSS|XML|JSON|YAML|BlockChain)\b'
-    
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Ruby", "PHP", "Swift", "Kotlin", "Go", "Rust",
+    "Scala", "R", "MATLAB", "Perl", "Shell", "Bash", "PowerShell", "SQL", "NoSQL", "HTML", "CSS", "XML", "JSON",
+    "YAML", "BlockChain",
     # Frameworks and libraries
-    frameworks = r'\b(React|Angular|Vue|Node\.js|Express|Django|Flask|Spring|ASP\.NET|Laravel|Ruby on Rails|TensorFlow|PyTorch|Keras|Pandas|NumPy|Scikit-learn|Bootstrap|jQuery|D3\.js)\b'
-    
+    "React", "Angular", "Vue", "Node.js", "Express", "Django", "Flask", "Spring", "ASP.NET", "Laravel",
+    "Ruby on Rails", "TensorFlow", "PyTorch", "Keras", "Pandas", "NumPy", "Scikit-learn", "Bootstrap", "jQuery",
+    "D3.js",
     # Databases
-    databases = r'\b(MySQL|PostgreSQL|MongoDB|SQLite|Oracle|SQL Server|Redis|Cassandra|DynamoDB|Firebase|Elasticsearch)\b'
-    
+    "MySQL", "PostgreSQL", "MongoDB", "SQLite", "Oracle", "SQL Server", "Redis", "Cassandra", "DynamoDB",
+    "Firebase", "Elasticsearch",
     # Cloud platforms and DevOps
-    cloud_devops = r'\b(AWS|Amazon Web Services|Azure|Google Cloud|GCP|Docker|Kubernetes|Jenkins|Git|GitHub|GitLab|Bitbucket|CI/CD|Terraform|Ansible|Puppet|Chef)\b'
-    
+    "AWS", "Amazon Web Services", "Azure", "Google Cloud", "GCP", "Docker", "Kubernetes", "Jenkins", "Git",
+    "GitHub", "GitLab", "Bitbucket", "CI/CD", "Terraform", "Ansible", "Puppet", "Chef",
     # Data science and ML
-    data_ml = r'\b(Machine Learning|Deep Learning|NLP|Natural Language Processing|Computer Vision|Data Mining|Data Analysis|Big Data|Hadoop|Spark|Data Visualization|Statistics|A/B Testing)\b'
-    
+    "Machine Learning", "Deep Learning", "NLP", "Natural Language Processing", "Computer Vision", "Data Mining",
+    "Data Analysis", "Big Data", "Hadoop", "Spark", "Data Visualization", "Statistics", "A/B Testing",
     # Other technical skills
-    other_tech = r'\b(RESTful API|GraphQL|Microservices|Serverless|Agile|Scrum|Kanban|UI/UX|Responsive Design|Mobile Development|Web Development|Testing|Debugging|Performance Optimization)\b'
-    
-    # Combine all patterns
-    all_patterns = [programming_langs, frameworks, databases, cloud_devops, data_ml, other_tech]
-    
-    # Extract skills using regex
-    regex_skills = []
-    for pattern in all_patterns:
-        matches = re.finditer(pattern, resume_text, re.IGNORECASE)
-        for match in matches:
-            skill = match.group(0)
-            regex_skills.append(skill)
-    
-    # Remove duplicates and sort
-    regex_skills = sorted(list(set(regex_skills)))
-    
-    return regex_skills
+    "RESTful API", "GraphQL", "Microservices", "Serverless", "Agile", "Scrum", "Kanban", "UI/UX",
+    "Responsive Design", "Mobile Development", "Web Development", "Testing", "Debugging",
+    "Performance Optimization",
+]
 
-def get_skills(resume_text):
+# Built once; finds every dictionary skill in a single pass over the text
+tech_skill_matcher = SkillMatcher(TECH_SKILL_DICTIONARY)
+
+@timed_stage("regex_extraction")
+def extract_skills_with_regex(resume_text):
     """
-    Complete skill extraction pipeline for use in main.py
-    
-    Args:
-        resume_text (str): The raw text extracted from a resume
-        
-    Returns:
-        list: List of extracted technical skills
+    Extract common technical skills directly from resume text with the
+    precompiled skill dictionary matcher.
+    This complements the model-based approach for better accuracy.
     """
-    # Extract skills using both approaches
-    model_output = extract_skills(resume_text)
+    # Keep the spelling used in the resume, as the regex-based version did
+    regex_skills = {resume_text[start:end] for start, end, _ in tech_skill_matcher.find_all(resume_text)}
+    
+    # Remove duplicates and sort
+    return sorted(regex_skills)
+
+def combine_skills(model_output, resume_text):
+    """Merge cleaned model skills with dictionary matches into a sorted skill list"""
     model_skills = clean_skills(model_output)
     
     # Also get regex-based skills
@@ -220,6 +457,35 @@ def get_skills(resume_text):
     
     return final_skills
 
+@timed_stage("get_skills")
+def get_skills(resume_text):
+    """
+    Complete skill extraction pipeline for use in main.py
+    
+    Args:
+        resume_text (str): The raw text extracted from a resume
+        
+    Returns:
+        list: List of extracted technical skills
+    """
+    # Extract skills using both approaches
+    model_output = extract_skills(resume_text)
+    return combine_skills(model_output, resume_text)
+
+@timed_stage("get_skills_batch")
+def get_skills_batch(resume_texts):
+    """
+    Batched version of get_skills for many resumes
+    
+    Args:
+        resume_texts (list): Raw texts extracted from resumes
+        
+    Returns:
+        list: List of extracted technical skills per resume
+    """
+    model_outputs = extract_skills_batch(resume_texts)
+    return [combine_skills(output, text) for output, text in zip(model_outputs, resume_texts)]
+
 def process_resume(file_path):
     """
     Process a resume file and extract skills using both model-based and regex-based approaches
@@ -0,0 +1,127 @@
+from collections import deque
+from functools import lru_cache
+
+
+def _is_word_char(c):
+    return c.isalnum() or c == "_"
+
+
+class SkillMatcher:
+    """
+    Case-insensitive multi-pattern matcher (Aho–Corasick automaton).
+
+    Built once from a skill dictionary, it finds every dictionary entry in a
+    text in a single linear pass. A match only counts when it is not glued to
+    other letters/digits on either side, so "Java" does not match inside
+    "JavaScript" while "C++" and "Node.js" still match. With
+    word_bounded=False every occurrence counts, like a substring test
+    ("sql" in "PostgreSQL").
+    """
+
+    def __init__(self, skills, word_bounded=True):
+        self.word_bounded = word_bounded
+        self.skills = []
+        self._index = {}
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+
+        for skill in skills:
+            if not isinstance(skill, str):
+                continue
+            skill = skill.strip()
+            key = skill.lower()
+            if not key or key in self._index:
+                continue
+            self._index[key] = len(self.skills)
+            self.skills.append(skill)
+            self._add_pattern(key, self._index[key])
+
+        self._build_failure_links()
+
+    def __len__(self):
+        return len(self.skills)
+
+    def _add_pattern(self, pattern, skill_id):
+        node = 0
+        for c in pattern:
+            next_node = self._goto[node].get(c)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][c] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = next_node
+        self._out[node].append((skill_id, len(pattern)))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for c, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and c not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(c, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    @staticmethod
+    def _lower(text):
+        """Lowercase text without changing its length, so offsets stay valid"""
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+    def iter_matches(self, text):
+        """Yield (start, end, skill_id) for every match (word-bounded unless disabled), overlaps included"""
+        if not text:
+            return
+        lowered = self._lower(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        word_bounded = self.word_bounded
+        text_length = len(text)
+        node = 0
+
+        for position, c in enumerate(lowered):
+            while node and c not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(c, 0)
+            if not out[node]:
+                continue
+
+            # All patterns ending here share their last character c
+            end = position + 1
+            if word_bounded and end < text_length and _is_word_char(c) and _is_word_char(text[end]):
+                continue
+
+            for skill_id, length in out[node]:
+                start = end - length
+                if word_bounded and start > 0 and _is_word_char(text[start - 1]) and _is_word_char(lowered[start]):
+                    continue
+                yield start, end, skill_id
+
+    def find_all(self, text):
+        """Return [(start, end, canonical_skill)] for every match in text"""
+        return [(start, end, self.skills[skill_id]) for start, end, skill_id in self.iter_matches(text)]
+
+    def matched_skills(self, text):
+        """Return the distinct dictionary skills found in text, in dictionary order"""
+        found = {skill_id for _, _, skill_id in self.iter_matches(text)}
+        return [self.skills[skill_id] for skill_id in sorted(found)]
+
+    def contains_any(self, text):
+        """Return True if at least one dictionary skill occurs in text"""
+        return next(self.iter_matches(text), None) is not None
+
+
+@lru_cache(maxsize=32)
+def _cached_matcher(skills, word_bounded):
+    return SkillMatcher(skills, word_bounded)
+
+
+def get_skill_matcher(skills, word_bounded=True):
+    """Return a shared matcher for a skill dictionary, building it only once per dictionary"""
+    return _cached_matcher(tuple(skills), word_bounded)
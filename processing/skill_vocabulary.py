@@ -0,0 +1,166 @@
+import os
+import re
+import json
+import time
+import logging
+import threading
+from collections import Counter, defaultdict
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.model_registry import register_model
+from processing.job_skill_index import normalize_skill
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOB_DESCRIPTIONS_CSV = os.path.join(BASE_DIR, "data", "job_descriptions.csv")
+SKILL_VOCABULARY_PATH = os.path.join(BASE_DIR, "models", "skill_vocabulary.json")
+FORMAT_VERSION = 1
+
+SKILL_COLUMNS = ['Skills', 'skills', 'Required Skills', 'required_skills', 'job_skills']
+
+_SKILL_SPLIT = re.compile(r"[,;]")
+_build_lock = threading.Lock()
+
+
+def csv_signature(csv_path):
+    """Size and modification time of the source CSV; a change triggers a rebuild"""
+    st = os.stat(csv_path)
+    return {"path": os.path.abspath(csv_path), "size": st.st_size, "mtime": st.st_mtime}
+
+
+def build_skill_vocabulary(csv_path=JOB_DESCRIPTIONS_CSV, chunksize=100000):
+    """
+    Stream only the skills column of csv_path and return the vocabulary payload:
+    canonical skill strings (the most common spelling of each case/space
+    variant), sorted by lookup form so a skill's id is its position, and the
+    number of postings listing each.
+    """
+    import pandas as pd
+
+    header = pd.read_csv(csv_path, nrows=0).columns
+    skills_column = next((col for col in SKILL_COLUMNS if col in header), None)
+    if not skills_column:
+        raise ValueError(f"No skills column found in {csv_path}")
+
+    counts = Counter()
+    spellings = defaultdict(Counter)
+    rows = 0
+    for chunk in pd.read_csv(csv_path, usecols=[skills_column], chunksize=chunksize, dtype=str):
+        for skills_text in chunk[skills_column].dropna():
+            rows += 1
+            # A posting counts once per skill however often it repeats it
+            seen = set()
+            for raw in _SKILL_SPLIT.split(skills_text):
+                raw = " ".join(raw.split())
+                if not raw:
+                    continue
+                key = normalize_skill(raw)
+                spellings[key][raw] += 1
+                seen.add(key)
+            counts.update(seen)
+
+    keys = sorted(counts)
+    return {
+        "format_version": FORMAT_VERSION,
+        "built_at": time.time(),
+        "source": csv_signature(csv_path),
+        "rows": rows,
+        "skills": [spellings[key].most_common(1)[0][0] for key in keys],
+        "frequencies": [counts[key] for key in keys],
+    }
+
+
+def save_skill_vocabulary(payload, path=SKILL_VOCABULARY_PATH):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    print(f"✅ Saved skill vocabulary with {len(payload['skills'])} skills from {payload['rows']} postings to {path}")
+
+
+class SkillVocabulary:
+    """Canonical skills with integer ids (their position) and corpus frequencies"""
+
+    def __init__(self, payload=None):
+        payload = payload or {}
+        self.skills = payload.get("skills", [])
+        self.frequencies = payload.get("frequencies", [])
+        self.source = payload.get("source")
+        self._ids = {normalize_skill(skill): i for i, skill in enumerate(self.skills)}
+
+    def __len__(self):
+        return len(self.skills)
+
+    def __contains__(self, skill):
+        return normalize_skill(skill) in self._ids
+
+    def id_of(self, skill):
+        """Integer id of a skill (any case/spacing), or None"""
+        return self._ids.get(normalize_skill(skill))
+
+    def canonical(self, skill):
+        """The vocabulary's spelling of a skill, or None if it is unknown"""
+        skill_id = self.id_of(skill)
+        return None if skill_id is None else self.skills[skill_id]
+
+    def frequency(self, skill):
+        skill_id = self.id_of(skill)
+        return 0 if skill_id is None else self.frequencies[skill_id]
+
+
+def _read_payload(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return payload if payload.get("format_version") == FORMAT_VERSION else None
+
+
+def _is_stale(payload, csv_path):
+    source = payload.get("source") or {}
+    try:
+        current = csv_signature(csv_path)
+    except OSError:
+        return False  # CSV gone: keep serving the last build
+    return (source.get("size"), source.get("mtime")) != (current["size"], current["mtime"])
+
+
+def load_skill_vocabulary(csv_path=JOB_DESCRIPTIONS_CSV, path=SKILL_VOCABULARY_PATH, rebuild=True):
+    """
+    Load the vocabulary artifact, rebuilding it first when it is missing or
+    the CSV changed since it was built (and rebuild is True). Returns an
+    empty vocabulary when neither the artifact nor the CSV exists.
+
+    Staleness is only checked here, at load time: a process holding a
+    vocabulary keeps it until it restarts, however often the CSV changes.
+    """
+    payload = _read_payload(path)
+    if rebuild and os.path.exists(csv_path) and (payload is None or _is_stale(payload, csv_path)):
+        with _build_lock:
+            payload = _read_payload(path)
+            if payload is None or _is_stale(payload, csv_path):
+                logging.info(f"Building skill vocabulary from {csv_path}")
+                try:
+                    payload = build_skill_vocabulary(csv_path)
+                    save_skill_vocabulary(payload, path)
+                except Exception as e:
+                    logging.error(f"Error building skill vocabulary: {str(e)}")
+    return SkillVocabulary(payload)
+
+
+def load_serving_skill_vocabulary():
+    """
+    Load the artifact as it is, for request-serving code: rebuilding means
+    streaming the whole job descriptions CSV, which must not happen inside
+    a request. training/build_skill_vocabulary.py and the scraper rebuild it.
+    """
+    vocabulary = load_skill_vocabulary(rebuild=False)
+    if not len(vocabulary):
+        logging.warning(f"No skill vocabulary at {SKILL_VOCABULARY_PATH}; run training/build_skill_vocabulary.py")
+    elif _is_stale({"source": vocabulary.source}, JOB_DESCRIPTIONS_CSV):
+        logging.warning("Skill vocabulary is older than job_descriptions.csv; run training/build_skill_vocabulary.py")
+    return vocabulary
+
+
+register_model("skill_vocabulary", load_serving_skill_vocabulary)
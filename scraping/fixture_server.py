@@ -0,0 +1,188 @@
+"""
+Local stand-in for LinkedIn's public job pages, for running the scraper offline.
+
+Serves search result pages (/jobs/search/?keywords=...&location=...) with
+base-card job cards and detail pages (/jobs/view/<id>) with a
+show-more-less-html__markup description, i.e. the markup parse_job_cards and
+extract_job_skills read. Content is generated deterministically from the
+query, so repeated runs see the same postings. It can inject latency and
+transient 429/503 responses to exercise the fetcher's rate limiting and
+retries.
+
+Usage:
+    python scraping/fixture_server.py --port 8765
+    python scraping/fixture_server.py --scrape "Data Scientist" "Backend Developer" --fail-every 7
+"""
+import os
+import sys
+import time
+import zlib
+import html
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, quote
+
+FIXTURE_SKILLS = ["Python", "Java", "JavaScript", "SQL", "React", "Node.js", "Django", "Flask",
+                  "AWS", "Azure", "Docker", "Kubernetes", "Git", "Machine Learning", "Data Analysis",
+                  "REST API", "GraphQL", "Agile"]
+FIXTURE_COMPANIES = ["Acme Labs", "Globex", "Initech", "Umbrella Analytics", "Hooli", "Stark Digital"]
+FIXTURE_CITIES = ["Bengaluru, Karnataka, India", "Pune, Maharashtra, India", "Hyderabad, Telangana, India",
+                  "Chennai, Tamil Nadu, India", "Gurugram, Haryana, India"]
+
+
+def _seed(text):
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def render_search_page(base_url, keywords, location, jobs_per_search):
+    rng = random.Random(_seed(f"{keywords}|{location}"))
+    cards = []
+    for n in range(jobs_per_search):
+        job_id = f"{_seed(keywords) % 100000}{n:03d}"
+        title = f"{keywords} {['', 'II', 'Senior', 'Lead'][n % 4]}".strip()
+        cards.append(f"""
+  <div class="base-card">
+    <a class="base-card__full-link" href="{base_url}/jobs/view/{quote(keywords.lower().replace(' ', '-'))}-{job_id}"></a>
+    <h3 class="base-search-card__title">{html.escape(title)}</h3>
+    <h4 class="base-search-card__subtitle">{html.escape(rng.choice(FIXTURE_COMPANIES))}</h4>
+    <span class="job-search-card__location">{html.escape(rng.choice(FIXTURE_CITIES))}</span>
+  </div>""")
+    return f"<html><body><h1>{html.escape(keywords)} jobs in {html.escape(location)}</h1>{''.join(cards)}</body></html>"
+
+
+def render_detail_page(path):
+    rng = random.Random(_seed(path))
+    skills = rng.sample(FIXTURE_SKILLS, 5)
+    description = (f"We are hiring an engineer to build data products. You will work with {skills[0]}, "
+                   f"{skills[1]} and {skills[2]}. Experience with {skills[3]} or {skills[4]} is a plus.")
+    return (f"<html><body><div class=\"show-more-less-html__markup\">{html.escape(description)}</div>"
+            f"</body></html>")
+
+
+class FixtureServer:
+    """
+    Threaded HTTP server generating LinkedIn-shaped pages. Every fail_every-th
+    request answers 503 (or 429 with Retry-After when it is even-numbered).
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, jobs_per_search=8, latency=0.0, fail_every=0):
+        self.jobs_per_search = jobs_per_search
+        self.latency = latency
+        self.fail_every = fail_every
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body, headers=None):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                    number = server.requests
+                if server.latency:
+                    time.sleep(server.latency)
+                if server.fail_every and number % server.fail_every == 0:
+                    if number % 2 == 0:
+                        return self._send(429, "Too Many Requests", {"Retry-After": "1"})
+                    return self._send(503, "Service Unavailable")
+
+                url = urlsplit(self.path)
+                if url.path.rstrip("/") == "/jobs/search":
+                    query = parse_qs(url.query)
+                    keywords = query.get("keywords", [""])[0]
+                    location = query.get("location", [""])[0]
+                    return self._send(200, render_search_page(server.base_url, keywords, location,
+                                                              server.jobs_per_search))
+                if url.path.startswith("/jobs/view/"):
+                    return self._send(200, render_detail_page(url.path))
+                return self._send(404, "Not Found")
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--jobs-per-search", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to every response")
+    parser.add_argument("--fail-every", type=int, default=0, help="Fail every n-th request with 429/503")
+    parser.add_argument("--scrape", nargs="*", help="Run the concurrent scraper against the server for these titles")
+    parser.add_argument("--rate", type=float, default=20.0, help="Scraper requests per second")
+    parser.add_argument("--output", default=None, help="CSV written by --scrape (default: a temporary file)")
+    args = parser.parse_args()
+
+    server = FixtureServer(port=args.port, jobs_per_search=args.jobs_per_search,
+                           latency=args.latency, fail_every=args.fail_every)
+    if args.scrape is None:
+        print(f"Serving fixture job pages on {server.base_url} (Ctrl+C to stop)")
+        try:
+            server._httpd.serve_forever()
+        except KeyboardInterrupt:
+            server.stop()
+        return
+
+    import tempfile
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from scraping.linkedin_scraper import scrape_linkedin_jobs_concurrent
+    from scraping.http_fetcher import HttpFetcher
+    from scraping.job_store import JobStore
+
+    titles = args.scrape or ["Data Scientist", "Backend Developer", "DevOps Engineer", "AI Engineer"]
+    with tempfile.TemporaryDirectory() as tmp_dir, server:
+        output = args.output or os.path.join(tmp_dir, "linkedin_jobs_india.csv")
+        job_store = JobStore(os.path.join(tmp_dir, "jobs.db"))
+        # The second run finds every posting in the job store and skips its detail page
+        for run in (1, 2):
+            served_before = server.requests
+            fetcher = HttpFetcher(requests_per_second=args.rate, backoff=0.1)
+            listings = scrape_linkedin_jobs_concurrent(titles, jobs_per_title=args.jobs_per_search,
+                                                       base_url=server.base_url, fetcher=fetcher,
+                                                       output_path=output, job_store=job_store)
+            with_skills = sum(1 for listing in listings if listing["job_skills"] != "Not available")
+            print(f"Run {run}: {len(listings)} listings, {with_skills} with skills, "
+                  f"{server.requests - served_before} requests served")
+        print(job_store.stats())
+        job_store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import time
+import random
+import threading
+import urllib.error
+import urllib.request
+from urllib.parse import urlsplit
+
+DEFAULT_USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                      "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    """Raised when a page could not be fetched after all retries"""
+
+    def __init__(self, url, message, status=None):
+        super().__init__(f"{url}: {message}")
+        self.url = url
+        self.status = status
+
+
+class HostRateLimiter:
+    """
+    Spaces requests to the same host at least 1 / requests_per_second apart,
+    across all threads. Different hosts do not wait for each other.
+    """
+
+    def __init__(self, requests_per_second=2.0):
+        self.min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host):
+        if not self.min_interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def penalize(self, host, seconds):
+        """Push back the next slot for host, e.g. after a 429 with Retry-After"""
+        with self._lock:
+            self._next_slot[host] = max(self._next_slot.get(host, 0.0), time.monotonic() + seconds)
+
+
+class HttpFetcher:
+    """
+    Thread-safe fetcher for public HTML pages: per-host rate limiting and
+    retries with exponential backoff (plus jitter) on network errors, 429
+    and 5xx responses. Retry-After headers are honoured.
+    """
+
+    def __init__(self, requests_per_second=2.0, retries=3, backoff=1.0, timeout=15,
+                 user_agent=DEFAULT_USER_AGENT):
+        self.rate_limiter = HostRateLimiter(requests_per_second)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self._stats = {"requests": 0, "retries": 0, "failures": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name):
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def stats(self):
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _delay(self, attempt, retry_after=None):
+        if retry_after is not None:
+            return retry_after
+        return self.backoff * (2 ** attempt) * (0.5 + random.random())
+
+    def fetch(self, url):
+        """Return the decoded body of url, raising FetchError once retries are exhausted"""
+        host = urlsplit(url).netloc
+        request = urllib.request.Request(url, headers={"User-Agent": self.user_agent,
+                                                       "Accept-Language": "en-US,en;q=0.9"})
+        last_error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._count("retries")
+            self.rate_limiter.wait(host)
+            self._count("requests")
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    charset = response.headers.get_content_charset() or "utf-8"
+                    return response.read().decode(charset, errors="replace")
+            except urllib.error.HTTPError as e:
+                last_error = FetchError(url, f"HTTP {e.code}", status=e.code)
+                if e.code not in RETRY_STATUSES:
+                    break
+                retry_after = e.headers.get("Retry-After")
+                delay = self._delay(attempt, float(retry_after) if retry_after and retry_after.isdigit() else None)
+                if e.code == 429:
+                    # Hold every request to the host, this retry included, in
+                    # the rate limiter rather than sleeping here as well
+                    self.rate_limiter.penalize(host, delay)
+                    delay = 0
+            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+                last_error = FetchError(url, str(getattr(e, "reason", e)))
+                delay = self._delay(attempt)
+            if attempt < self.retries and delay:
+                time.sleep(delay)
+
+        self._count("failures")
+        raise last_error
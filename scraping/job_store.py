@@ -0,0 +1,203 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from urllib.parse import urlsplit, urlunsplit
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOB_STORE_PATH = os.environ.get("READUME_JOB_STORE", os.path.join(BASE_DIR, "data", "jobs.db"))
+JOBS_CSV_PATH = os.path.join(BASE_DIR, "data", "linkedin_jobs_india.csv")
+
+# Outcomes of JobStore.upsert
+NEW = "new"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+
+
+def card_fingerprint(card):
+    """Hash of the search-card fields; a change means the posting was edited"""
+    text = "\x1f".join(str(card.get(field) or "") for field in ("title", "company", "location"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def normalize_job_link(link):
+    """
+    Drop the query string and fragment of a job link: LinkedIn adds
+    tracking parameters (refId, trackingId, ...) that differ between
+    sightings of the same posting.
+    """
+    parts = urlsplit(link)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip("/") or "/", "", ""))
+
+
+def card_key(card):
+    """Postings are keyed by their normalized job_link; cards without a link fall back to their fingerprint"""
+    link = card.get("link")
+    return normalize_job_link(link) if link else f"card:{card_fingerprint(card)}"
+
+
+class JobStore:
+    """
+    Deduplicated store of scraped job postings, persisted in SQLite.
+
+    jobs holds the latest version of every posting keyed by job_link
+    (without its tracking query string, see normalize_job_link), with
+    first-seen / last-seen timestamps; sightings is append-only and records
+    every time a posting showed up in a search, so history survives
+    re-scrapes. Detail pages only need fetching for postings that are new,
+    whose card changed, or whose skills could not be extracted last time.
+    """
+
+    def __init__(self, db_path=JOB_STORE_PATH):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_link TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    listing TEXT NOT NULL,
+                    has_details INTEGER NOT NULL,
+                    first_seen REAL NOT NULL,
+                    last_seen REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS sightings (
+                    job_link TEXT NOT NULL,
+                    seen_at REAL NOT NULL,
+                    search_title TEXT,
+                    search_location TEXT
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs (last_seen)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_sightings_link ON sightings (job_link)")
+            self._normalize_keys()
+
+    def _normalize_keys(self):
+        """Re-key rows stored under a raw link (older stores), merging sightings of the same posting"""
+        rows = self._conn.execute(
+            "SELECT * FROM jobs WHERE job_link LIKE 'http%' AND (job_link LIKE '%?%' OR job_link LIKE '%#%')"
+        ).fetchall()
+        for row in rows:
+            key = normalize_job_link(row["job_link"])
+            existing = self._conn.execute("SELECT * FROM jobs WHERE job_link = ?", (key,)).fetchone()
+            if existing is None:
+                self._conn.execute("UPDATE jobs SET job_link = ? WHERE job_link = ?", (key, row["job_link"]))
+            else:
+                # Keep the most recently seen version and the full sighting range
+                latest = max(existing, row, key=lambda r: r["last_seen"])
+                self._conn.execute(
+                    "UPDATE jobs SET fingerprint = ?, listing = ?, has_details = ?, first_seen = ?, last_seen = ?, "
+                    "updated_at = ? WHERE job_link = ?",
+                    (latest["fingerprint"], latest["listing"], latest["has_details"],
+                     min(existing["first_seen"], row["first_seen"]), latest["last_seen"],
+                     max(existing["updated_at"], row["updated_at"]), key))
+                self._conn.execute("DELETE FROM jobs WHERE job_link = ?", (row["job_link"],))
+            self._conn.execute("UPDATE sightings SET job_link = ? WHERE job_link = ?", (key, row["job_link"]))
+
+    def get(self, card):
+        """Return the stored listing for a card, or None"""
+        with self._lock:
+            row = self._conn.execute("SELECT listing FROM jobs WHERE job_link = ?", (card_key(card),)).fetchone()
+        return json.loads(row["listing"]) if row else None
+
+    def needs_detail(self, card):
+        """True unless the posting is stored with details and its card is unchanged"""
+        with self._lock:
+            row = self._conn.execute("SELECT fingerprint, has_details FROM jobs WHERE job_link = ?",
+                                     (card_key(card),)).fetchone()
+        return row is None or not row["has_details"] or row["fingerprint"] != card_fingerprint(card)
+
+    def upsert(self, card, listing, search_title=None, search_location=None, seen_at=None):
+        """Store the latest listing for a card and record the sighting; returns NEW, UPDATED or UNCHANGED"""
+        seen_at = seen_at or time.time()
+        key = card_key(card)
+        fingerprint = card_fingerprint(card)
+        payload = json.dumps(listing, ensure_ascii=False, sort_keys=True)
+        has_details = int(listing.get("job_skills", "Not available") != "Not available")
+
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT fingerprint, listing FROM jobs WHERE job_link = ?", (key,)).fetchone()
+            if row is None:
+                outcome = NEW
+                self._conn.execute(
+                    "INSERT INTO jobs (job_link, fingerprint, listing, has_details, first_seen, last_seen, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, fingerprint, payload, has_details, seen_at, seen_at, seen_at))
+            elif row["fingerprint"] == fingerprint and row["listing"] == payload:
+                outcome = UNCHANGED
+                self._conn.execute("UPDATE jobs SET last_seen = ? WHERE job_link = ?", (seen_at, key))
+            else:
+                outcome = UPDATED
+                self._conn.execute(
+                    "UPDATE jobs SET fingerprint = ?, listing = ?, has_details = ?, last_seen = ?, updated_at = ? "
+                    "WHERE job_link = ?",
+                    (fingerprint, payload, has_details, seen_at, seen_at, key))
+            self._conn.execute(
+                "INSERT INTO sightings (job_link, seen_at, search_title, search_location) VALUES (?, ?, ?, ?)",
+                (key, seen_at, search_title, search_location))
+        return outcome
+
+    def iter_listings(self, seen_since=None):
+        """Yield stored listings with first_seen/last_seen, most recently seen first"""
+        query = "SELECT listing, first_seen, last_seen FROM jobs"
+        params = ()
+        if seen_since is not None:
+            query += " WHERE last_seen >= ?"
+            params = (seen_since,)
+        query += " ORDER BY last_seen DESC, first_seen DESC"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        for row in rows:
+            listing = json.loads(row["listing"])
+            listing["first_seen"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(row["first_seen"]))
+            listing["last_seen"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(row["last_seen"]))
+            yield listing
+
+    def export_csv(self, path=JOBS_CSV_PATH, seen_since=None):
+        """
+        Write the store as the CSV the frontend's /api/jobs route reads
+        (the scraper's columns plus first_seen / last_seen). The file is
+        replaced atomically so readers never see a partial export.
+        """
+        import pandas as pd
+
+        listings = list(self.iter_listings(seen_since))
+        if not listings:
+            print("❌ No job listings in the store")
+            return None
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        pd.DataFrame(listings).to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        print(f"✅ Exported {len(listings)} job listings to {path}")
+        return path
+
+    def stats(self):
+        with self._lock:
+            jobs = self._conn.execute("SELECT COUNT(*), SUM(has_details) FROM jobs").fetchone()
+            sightings = self._conn.execute("SELECT COUNT(*) FROM sightings").fetchone()[0]
+        return {"jobs": jobs[0], "with_details": jobs[1] or 0, "sightings": sightings}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Export the scraped job store to CSV")
+    parser.add_argument("--db", default=JOB_STORE_PATH)
+    parser.add_argument("--output", default=JOBS_CSV_PATH)
+    parser.add_argument("--days", type=float, help="Only postings seen in the last n days")
+    args = parser.parse_args()
+
+    store = JobStore(args.db)
+    store.export_csv(args.output, time.time() - args.days * 86400 if args.days else None)
+    print(store.stats())
@@ -1,5 +1,7 @@
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -8,72 +10,152 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from bs4 import BeautifulSoup
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.skill_matcher import get_skill_matcher
+from processing.skill_vocabulary import load_skill_vocabulary
+from scraping.http_fetcher import HttpFetcher, FetchError
+from scraping.job_store import JobStore, JOBS_CSV_PATH, NEW, UPDATED
+
+LINKEDIN_BASE_URL = "https://www.linkedin.com"
+JOBS_PER_TITLE = 5
+
+# Fallback skills when the job descriptions dataset is not available
+FALLBACK_SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "SQL", "NoSQL",
+    "React", "Angular", "Vue", "Node.js", "Django", "Flask", "Spring", 
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Git", 
+    "Machine Learning", "Deep Learning", "AI", "Data Science", "Data Analysis",
+    "HTML", "CSS", "REST API", "GraphQL", "Agile", "Scrum"
+]
 
 def get_unique_skills_from_dataset():
-    """Extract unique skills from job descriptions dataset"""
+    """
+    Unique skills of the job descriptions dataset, from the prebuilt skill
+    vocabulary (rebuilt automatically when job_descriptions.csv changes)
+    """
     try:
-        # Path to the job descriptions CSV file
-        csv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-                               "data", "job_descriptions.csv")
-        
-        if not os.path.exists(csv_path):
-            print(f"Warning: Job descriptions file not found at {csv_path}")
+        # Offline job: rebuild the artifact here if the CSV changed, so serving never has to
+        vocabulary = load_skill_vocabulary()
+        if not len(vocabulary):
+            print("Warning: no skill vocabulary available (job_descriptions.csv not found?)")
             return []
-            
-        # Read the CSV file
-        df = pd.read_csv(csv_path)
-        
-        # Check if the dataset has a skills column
-        skills_column = None
-        possible_columns = ['Skills', 'skills', 'Required Skills', 'required_skills', 'job_skills']
-        
-        for col in possible_columns:
-            if col in df.columns:
-                skills_column = col
-                break
-        
-        if not skills_column:
-            print("No skills column found in the dataset")
-            return []
-            
-        # Extract all skills and create a unique list
-        all_skills = []
-        for skills_text in df[skills_column].dropna():
-            if isinstance(skills_text, str):
-                # Split by common delimiters
-                skills = [s.strip() for s in skills_text.replace(';', ',').split(',')]
-                all_skills.extend([s for s in skills if s])
-        
-        # Get unique skills and sort
-        unique_skills = sorted(list(set(all_skills)))
-        print(f"Extracted {len(unique_skills)} unique skills from dataset")
-        return unique_skills
+        print(f"Loaded {len(vocabulary)} unique skills from the skill vocabulary")
+        return vocabulary.skills
         
     except Exception as e:
         print(f"Error extracting skills from dataset: {str(e)}")
         return []
 
-def scrape_linkedin_jobs(job_titles, location="India"):
-    """Scrapes LinkedIn job listings for the predicted job titles."""
-    
-    # Create data directory if it doesn't exist
+def get_data_dir():
+    """Return the data directory, creating it if it doesn't exist"""
     data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
     if not os.path.exists(data_dir):
         print(f"Creating data directory at: {data_dir}")
         os.makedirs(data_dir)
+    return data_dir
+
+def get_scraping_skill_matcher():
+    """Build the skill matcher used on job descriptions (dataset skills, or a fallback list)"""
+    dataset_skills = get_unique_skills_from_dataset() or FALLBACK_SKILLS
+    return get_skill_matcher(dataset_skills)
+
+def build_search_url(job_title, location, base_url=LINKEDIN_BASE_URL):
+    return f"{base_url}/jobs/search/?keywords={quote(job_title)}&location={quote(location)}"
+
+def parse_job_cards(html, limit=JOBS_PER_TITLE):
+    """Return [{"title", "company", "location", "link"}] for the job cards of a search page"""
+    soup = BeautifulSoup(html, "html.parser")
+    cards = []
+    for job in soup.find_all("div", class_="base-card"):
+        if len(cards) >= limit:
+            break
+        title_elem = job.find("h3", class_="base-search-card__title")
+        company_elem = job.find("h4", class_="base-search-card__subtitle")
+        location_elem = job.find("span", class_="job-search-card__location")
+        if not (title_elem and company_elem and location_elem):
+            continue
+        link_elem = job.find("a", class_="base-card__full-link")
+        cards.append({
+            "title": title_elem.text.strip(),
+            "company": company_elem.text.strip(),
+            "location": location_elem.text.strip(),
+            "link": link_elem["href"] if link_elem and link_elem.has_attr("href") else None,
+        })
+    return cards
+
+def extract_job_skills(detail_html, skill_matcher):
+    """Return the matched skills of a job detail page as a comma-separated string"""
+    job_detail_soup = BeautifulSoup(detail_html, "html.parser")
+    job_description_elem = job_detail_soup.find("div", class_="show-more-less-html__markup")
+    if job_description_elem:
+        # Extract skills from job description in a single pass over the text
+        found_skills = skill_matcher.matched_skills(job_description_elem.text.strip())
+        if found_skills:
+            return ", ".join(found_skills)
+    return "Not available"
+
+def build_job_listing(card, job_skills, search_location):
+    """Row of data/linkedin_jobs_india.csv for a scraped job card"""
+    return {
+        "job_title_short": card["title"].split(" ")[0],
+        "job_title": card["title"],
+        "job_location": card["location"],
+        "job_via": "LinkedIn",
+        "job_schedule_type": "Full-Time",  # Placeholder
+        "job_work_from_home": "No",  # Placeholder
+        "search_location": search_location,
+        "job_posted_date": "Recently Posted",  # Placeholder
+        "job_no_degree_mention": "Unknown",  # Placeholder
+        "job_health_insurance": "Unknown",  # Placeholder
+        "job_country": "India",
+        "salary_rate": "Not Provided",
+        "salary_year_avg": "Not Provided",
+        "salary_hour_avg": "Not Provided",
+        "company_name": card["company"],
+        "job_skills": job_skills,  # Now using extracted skills from dataset
+        "job_type_skills": "Software, Data Science",  # Placeholder
+        "job_link": card["link"] or "Not available"  # Adding job link
+    }
+
+def save_job_listings(job_listings, output_path=None):
+    """Write scraped listings to data/linkedin_jobs_india.csv (or output_path)"""
+    if not job_listings:
+        print("❌ No job listings found")
+        return None
+    output_path = output_path or os.path.join(get_data_dir(), "linkedin_jobs_india.csv")
+    pd.DataFrame(job_listings).to_csv(output_path, index=False)
+    print(f"✅ Saved {len(job_listings)} job listings to {output_path}")
+    return output_path
+
+def store_job_listings(job_store, scraped, output_path=None):
+    """
+    Upsert a run's (card, listing, search title) triples into the job store
+    and export the whole store to the CSV served by /api/jobs.
+    """
+    outcomes = {}
+    seen_at = time.time()
+    for card, listing, search_title in scraped:
+        outcome = job_store.upsert(card, listing, search_title, listing["search_location"], seen_at)
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    print(f"Job store: {outcomes.get(NEW, 0)} new, {outcomes.get(UPDATED, 0)} updated, "
+          f"{len(scraped) - outcomes.get(NEW, 0) - outcomes.get(UPDATED, 0)} unchanged postings")
+    return job_store.export_csv(output_path or JOBS_CSV_PATH)
+
+def scrape_linkedin_jobs(job_titles, location="India", job_store=None, incremental=True):
+    """
+    Scrapes LinkedIn job listings for the predicted job titles.
+
+    With incremental=True postings are kept in the job store (data/jobs.db);
+    detail pages of stored, unchanged postings are not visited again and the
+    CSV is exported from the store instead of being overwritten by this run.
+    """
     
-    # Get unique skills from dataset
-    dataset_skills = get_unique_skills_from_dataset()
-    
-    # Fallback to common skills if dataset skills are not available
-    if not dataset_skills:
-        dataset_skills = [
-            "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "SQL", "NoSQL",
-            "React", "Angular", "Vue", "Node.js", "Django", "Flask", "Spring", 
-            "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Git", 
-            "Machine Learning", "Deep Learning", "AI", "Data Science", "Data Analysis",
-            "HTML", "CSS", "REST API", "GraphQL", "Agile", "Scrum"
-        ]
+    # Build the skill matcher once for all job descriptions
+    skill_matcher = get_scraping_skill_matcher()
+    if incremental and job_store is None:
+        job_store = JobStore()
+    scraped = []
     
     # 📌 Setup Selenium WebDriver with improved options
     chrome_options = Options()
@@ -97,7 +179,7 @@ def scrape_linkedin_jobs(job_titles, location="India"):
         for job_title in job_titles:
             print(f"Searching for: {job_title} in {location}")
             # Updated search URL to include location parameter for India
-            search_url = f"https://www.linkedin.com/jobs/search/?keywords={job_title.replace(' ', '%20')}&location={location.replace(' ', '%20')}"
+            search_url = build_search_url(job_title, location)
             
             try:
                 driver.get(search_url)
@@ -114,84 +196,43 @@ def scrape_linkedin_jobs(job_titles, location="India"):
                     continue
                 
                 # Extract job listings
-                soup = BeautifulSoup(driver.page_source, "html.parser")
-                jobs = soup.find_all("div", class_="base-card")
+                cards = parse_job_cards(driver.page_source)
+                print(f"Found {len(cards)} job listings for {job_title} in {location}")
                 
-                print(f"Found {len(jobs)} job listings for {job_title} in {location}")
-                
-                for job in jobs[:5]:  # Limit to first 5 jobs per job title
+                for card in cards:
                     try:
-                        title_elem = job.find("h3", class_="base-search-card__title")
-                        company_elem = job.find("h4", class_="base-search-card__subtitle")
-                        location_elem = job.find("span", class_="job-search-card__location")
+                        # Postings already stored with details keep them
+                        if job_store is not None and not job_store.needs_detail(card):
+                            listing = job_store.get(card)
+                            job_listings.append(listing)
+                            scraped.append((card, listing, job_title))
+                            print(f"Unchanged job: {card['title']} at {card['company']}")
+                            continue
                         
-                        # Extract job link
-                        job_link = None
-                        link_elem = job.find("a", class_="base-card__full-link")
-                        if link_elem and 'href' in link_elem.attrs:
-                            job_link = link_elem['href']
+                        # Extract skills by visiting the job detail page if we have a link
+                        job_skills = "Not available"
+                        if card["link"]:
+                            try:
+                                # Visit the job detail page
+                                driver.get(card["link"])
+                                # Wait for job details to load
+                                WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CLASS_NAME, "show-more-less-html__markup")))
+                                job_skills = extract_job_skills(driver.page_source, skill_matcher)
+                                
+                                # Go back to search results
+                                driver.back()
+                                # Wait for search results to reload
+                                WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CLASS_NAME, "base-card")))
+                            except Exception as e:
+                                print(f"Error extracting job details: {str(e)}")
+                                # Try to go back to search results
+                                driver.get(search_url)
+                                time.sleep(2)
                         
-                        if title_elem and company_elem and location_elem:
-                            title = title_elem.text.strip()
-                            company = company_elem.text.strip()
-                            location = location_elem.text.strip()
-                            
-                            # Extract skills by visiting the job detail page if we have a link
-                            job_skills = "Not available"
-                            if job_link:
-                                try:
-                                    # Visit the job detail page
-                                    driver.get(job_link)
-                                    # Wait for job details to load
-                                    WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CLASS_NAME, "show-more-less-html__markup")))
-                                    
-                                    # Get job description
-                                    job_detail_soup = BeautifulSoup(driver.page_source, "html.parser")
-                                    job_description_elem = job_detail_soup.find("div", class_="show-more-less-html__markup")
-                                    
-                                    if job_description_elem:
-                                        job_description = job_description_elem.text.strip()
-                                        
-                                        # Extract skills from job description using dataset skills
-                                        found_skills = []
-                                        for skill in dataset_skills:
-                                            if skill.lower() in job_description.lower():
-                                                found_skills.append(skill)
-                                        
-                                        if found_skills:
-                                            job_skills = ", ".join(found_skills)
-                                        
-                                    # Go back to search results
-                                    driver.back()
-                                    # Wait for search results to reload
-                                    WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CLASS_NAME, "base-card")))
-                                except Exception as e:
-                                    print(f"Error extracting job details: {str(e)}")
-                                    # Try to go back to search results
-                                    driver.get(search_url)
-                                    time.sleep(2)
-                            
-                            job_listings.append({
-                                "job_title_short": title.split(" ")[0],
-                                "job_title": title,
-                                "job_location": location,
-                                "job_via": "LinkedIn",
-                                "job_schedule_type": "Full-Time",  # Placeholder
-                                "job_work_from_home": "No",  # Placeholder
-                                "search_location": location,
-                                "job_posted_date": "Recently Posted",  # Placeholder
-                                "job_no_degree_mention": "Unknown",  # Placeholder
-                                "job_health_insurance": "Unknown",  # Placeholder
-                                "job_country": "India",
-                                "salary_rate": "Not Provided",
-                                "salary_year_avg": "Not Provided",
-                                "salary_hour_avg": "Not Provided",
-                                "company_name": company,
-                                "job_skills": job_skills,  # Now using extracted skills from dataset
-                                "job_type_skills": "Software, Data Science",  # Placeholder
-                                "job_link": job_link or "Not available"  # Adding job link
-                            })
-                            print(f"Added job: {title} at {company} in {location}")
+                        listing = build_job_listing(card, job_skills, location)
+                        job_listings.append(listing)
+                        scraped.append((card, listing, job_title))
+                        print(f"Added job: {card['title']} at {card['company']} in {card['location']}")
                     except Exception as e:
                         print(f"Error processing job listing: {str(e)}")
             
@@ -199,13 +240,10 @@ def scrape_linkedin_jobs(job_titles, location="India"):
                 print(f"Error searching for {job_title}: {str(e)}")
         
         # Save job listings to CSV
-        if job_listings:
-            output_path = os.path.join(data_dir, "linkedin_jobs_india.csv")
-            df = pd.DataFrame(job_listings)
-            df.to_csv(output_path, index=False)
-            print(f"✅ Saved {len(job_listings)} job listings to {output_path}")
+        if job_store is not None:
+            store_job_listings(job_store, scraped)
         else:
-            print("❌ No job listings found")
+            save_job_listings(job_listings)
         
     except Exception as e:
         print(f"Error in scraping process: {str(e)}")
@@ -220,6 +258,101 @@ def scrape_linkedin_jobs(job_titles, location="India"):
     
     return job_listings
 
+def scrape_linkedin_jobs_concurrent(job_titles, location="India", title_workers=4, detail_workers=8,
+                                    requests_per_second=2.0, base_url=LINKEDIN_BASE_URL,
+                                    jobs_per_title=JOBS_PER_TITLE, fetcher=None, output_path=None,
+                                    job_store=None, incremental=True):
+    """
+    Scrape LinkedIn's public (logged-out) search and job pages over plain HTTP
+    instead of driving a browser. Search pages for different titles are
+    fetched in parallel and every job card's detail page is queued on a
+    shared pool as soon as its search page is parsed. All requests go
+    through one HttpFetcher, so the per-host rate limit holds across threads.
+
+    Returns the listings in the same order as scrape_linkedin_jobs (by title,
+    then by card) and saves them like it does, skipping the detail pages of
+    unchanged stored postings when incremental.
+    """
+    fetcher = fetcher or HttpFetcher(requests_per_second=requests_per_second)
+    skill_matcher = get_scraping_skill_matcher()
+    if incremental and job_store is None:
+        job_store = JobStore()
+    start_time = time.time()
+    reused = 0
+
+    def search(job_title):
+        return parse_job_cards(fetcher.fetch(build_search_url(job_title, location, base_url)), jobs_per_title)
+
+    def detail(card):
+        if not card["link"]:
+            return "Not available"
+        try:
+            return extract_job_skills(fetcher.fetch(card["link"]), skill_matcher)
+        except Exception as e:
+            print(f"Error extracting job details: {str(e)}")
+            return "Not available"
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, title_workers)) as title_pool, \
+            ThreadPoolExecutor(max_workers=max(1, detail_workers)) as detail_pool:
+        searches = {title_pool.submit(search, job_title): position
+                    for position, job_title in enumerate(job_titles)}
+        details = {}
+        for future in as_completed(searches):
+            position = searches[future]
+            try:
+                cards = future.result()
+            except FetchError as e:
+                print(f"Error searching for {job_titles[position]}: {str(e)}")
+                continue
+            except Exception as e:
+                # e.g. a search page the parser does not understand; other titles carry on
+                print(f"Unexpected error searching for {job_titles[position]}: {str(e)}")
+                continue
+            print(f"Found {len(cards)} job listings for {job_titles[position]} in {location}")
+            for index, card in enumerate(cards):
+                if job_store is not None and not job_store.needs_detail(card):
+                    results[(position, index)] = (card, job_store.get(card), job_titles[position])
+                    reused += 1
+                    continue
+                details[detail_pool.submit(detail, card)] = (position, index, card)
+
+        for future in as_completed(details):
+            position, index, card = details[future]
+            results[(position, index)] = (card, build_job_listing(card, future.result(), location),
+                                          job_titles[position])
+
+    scraped = [results[key] for key in sorted(results)]
+    job_listings = [listing for _, listing, _ in scraped]
+    stats = fetcher.stats()
+    print(f"Scraped {len(job_listings)} jobs for {len(job_titles)} titles in {time.time() - start_time:.2f} seconds "
+          f"({stats['requests']} requests, {stats['retries']} retries, {stats['failures']} failures, "
+          f"{reused} unchanged postings not re-fetched)")
+    if job_store is not None:
+        store_job_listings(job_store, scraped, output_path)
+    else:
+        save_job_listings(job_listings, output_path)
+    return job_listings
+
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Scrape LinkedIn job listings into data/linkedin_jobs_india.csv")
     # You can specify more job titles here
-    scrape_linkedin_jobs(["Blockchain Developer", "Software Developer", "AI Engineer"])
+    parser.add_argument("titles", nargs="*", default=["Blockchain Developer", "Software Developer", "AI Engineer"])
+    parser.add_argument("--location", default="India")
+    parser.add_argument("--concurrent", action="store_true", help="Use the HTTP fetcher instead of Selenium")
+    parser.add_argument("--base-url", default=LINKEDIN_BASE_URL, help="e.g. a local fixture server")
+    parser.add_argument("--rate", type=float, default=2.0, help="Requests per second per host")
+    parser.add_argument("--output", help="CSV path (default: data/linkedin_jobs_india.csv)")
+    parser.add_argument("--job-store", help="SQLite job store (default: data/jobs.db)")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignore the job store: re-fetch every posting and overwrite the CSV with this run")
+    args = parser.parse_args()
+
+    job_store = JobStore(args.job_store) if args.job_store and not args.full else None
+    if args.concurrent:
+        scrape_linkedin_jobs_concurrent(args.titles, args.location, requests_per_second=args.rate,
+                                        base_url=args.base_url, output_path=args.output,
+                                        job_store=job_store, incremental=not args.full)
+    else:
+        scrape_linkedin_jobs(args.titles, args.location, job_store=job_store, incremental=not args.full)
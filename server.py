@@ -1,20 +1,55 @@
 import os
 import json
-import tempfile
-from flask import Flask, request, jsonify
+import hashlib
+import threading
+import time
+import zipfile
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from flask import Flask, Request, Response, request, jsonify, stream_with_context, g
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
-from analyze_resume import analyze_resume
-from processing.skill_extractor import extract_text_from_pdf, get_skills
+from analyze_resume import analyze_resume, analyze_resume_batch
+from analysis_queue import AnalysisQueue, QueueFullError, STATUS_QUEUED
+from processing.skill_extractor import (extract_text_with_sources, get_skills, get_skills_batch, chunk_cache_stats,
+                                        skill_model_fingerprint)
+from processing.pdf_text import OcrMemoryLimitError, text_extraction_settings
+from processing.result_cache import ResultCache, hash_bytes, file_signature
+from processing.model_registry import get_model, model_stats, start_background_loading, MODELS_DIR, SERVING_MODEL
+from processing.skill_vocabulary import SKILL_VOCABULARY_PATH
+from processing.compact_model import SERVING_MODEL_DIR
+from processing.metrics import registry as metrics_registry, Counter, Gauge, time_stage
+import processing.job_index  # registers the "job_index" model
+from processing.semantic_index import get_semantic_index
+from processing.job_catalog import get_job_catalog, unsearchable_filters, FILTERS as JOB_FILTERS, CursorError
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
-import joblib
 import random
 import google.generativeai as genai
 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
+# Batch uploads (folders of resumes or a zip) get a larger request size limit
+BATCH_ROUTE = '/api/analyze-resumes/batch'
+BATCH_MAX_CONTENT_LENGTH = int(os.environ.get('READUME_BATCH_MAX_MB', 256)) * 1024 * 1024
+
+class ReadumeRequest(Request):
+    @property
+    def max_content_length(self):
+        if self.path == BATCH_ROUTE:
+            return BATCH_MAX_CONTENT_LENGTH
+        return super().max_content_length
+
+class TimedJSONProvider(DefaultJSONProvider):
+    # jsonify goes through dumps, so response serialisation shows up as its own stage
+    def dumps(self, obj, **kwargs):
+        with time_stage("json_serialize"):
+            return super().dumps(obj, **kwargs)
+
 app = Flask(__name__)
+app.request_class = ReadumeRequest
+app.json = TimedJSONProvider(app)
 CORS(app)  # Enable CORS for all routes
 
 # Configure upload folder
@@ -23,10 +58,237 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload size
 
+# Bump when the shape or meaning of cached "text", "skills" or "analysis" values changes
+PIPELINE_VERSION = 2
+
+def pipeline_versions():
+    """
+    Cache version of each stage: the pipeline version plus the settings and
+    models of the stage and of every stage it builds on, so retraining a
+    model or changing OCR settings never serves results of the old ones.
+    """
+    def version(*parts):
+        return hash_bytes(json.dumps(parts, sort_keys=True).encode("utf-8"))
+    text = version(PIPELINE_VERSION, text_extraction_settings())
+    skills = version(text, skill_model_fingerprint(), file_signature(SKILL_VOCABULARY_PATH))
+    recommender = file_signature(os.path.join(MODELS_DIR, "job_recommender.pkl"), SERVING_MODEL_DIR)
+    return {"text": text, "skills": skills, "analysis": version(skills, SERVING_MODEL, recommender)}
+
+# Content-addressed cache for OCR text, skills and analysis results
+result_cache = ResultCache(versions=pipeline_versions())
+
+def get_cached_text(cache_key, file_bytes, pdf_path=None):
+    """
+    Return (resume_text, pages) for an upload, extracting it only on a cache miss.
+    pages records whether each page came from the embedded text layer or OCR.
+    """
+    cached = result_cache.get(cache_key, "text")
+    # Entries written before pages were recorded hold a bare string: treat them as a miss
+    if isinstance(cached, dict) and "text" in cached and "pages" in cached:
+        return cached["text"], cached["pages"]
+
+    # Uploads are extracted from memory; only very large ones spool to a temp file
+    resume_text, pages = extract_text_with_sources(pdf_path or file_bytes)
+
+    result_cache.set(cache_key, "text", {"text": resume_text, "pages": pages})
+    return resume_text, pages
+
+def get_cached_analysis(cache_key, started):
+    """
+    Return the cached analysis of an upload (None on a miss), with its
+    processing_time set to the time this request took since started
+    (a time.perf_counter() value) rather than the run that produced it.
+    """
+    results = result_cache.get(cache_key, "analysis")
+    if results is not None:
+        results['processing_time'] = f"{time.perf_counter() - started:.2f} seconds"
+    return results
+
+def cache_analysis(cache_key, results):
+    """Cache an analysis without its processing_time, which only describes the run that produced it"""
+    result_cache.set(cache_key, "analysis", {key: value for key, value in results.items() if key != 'processing_time'})
+
+def get_cached_skills(cache_key, resume_text):
+    """Return the skills for an upload, running the skill extractor only on a cache miss"""
+    skills = result_cache.get(cache_key, "skills")
+    if skills is None:
+        skills = get_skills(resume_text)
+        result_cache.set(cache_key, "skills", skills)
+    return skills
+
+# 📌 Request metrics, exported with everything else on /metrics
+http_requests = metrics_registry.counter(
+    "readume_http_requests_total", "HTTP requests by route, method and status", ["route", "method", "status"])
+http_errors = metrics_registry.counter(
+    "readume_http_errors_total", "HTTP requests answered with a 5xx status or an unhandled exception", ["route"])
+http_in_flight = metrics_registry.gauge(
+    "readume_http_requests_in_flight", "HTTP requests currently being handled", ["route"])
+http_duration = metrics_registry.histogram(
+    "readume_http_request_duration_seconds", "Time to produce a response, per route", ["route"])
+
+def request_route():
+    # The URL rule (not the raw path) keeps label cardinality bounded
+    return request.url_rule.rule if request.url_rule is not None else "unmatched"
+
+@app.before_request
+def start_request_metrics():
+    g.metrics_route = request_route()
+    g.metrics_start = time.perf_counter()
+    http_in_flight.inc(route=g.metrics_route)
+
+@app.after_request
+def record_request_metrics(response):
+    route = g.get("metrics_route", "unmatched")
+    http_requests.inc(route=route, method=request.method, status=response.status_code)
+    if response.status_code >= 500:
+        http_errors.inc(route=route)
+    if "metrics_start" in g:
+        http_duration.observe(time.perf_counter() - g.metrics_start, route=route)
+    g.metrics_recorded = True
+    return response
+
+@app.teardown_request
+def finish_request_metrics(error=None):
+    if "metrics_route" not in g:
+        return
+    # Exceptions propagated without a response (debug mode) never reach after_request
+    if error is not None and not g.get("metrics_recorded"):
+        http_errors.inc(route=g.metrics_route)
+    http_in_flight.dec(route=g.pop("metrics_route"))
+
+def collect_cache_metrics():
+    caches = {"results": result_cache.stats(), "chunks": chunk_cache_stats()}
+    lookups = Counter("readume_cache_lookups_total", "Cache lookups by stage and outcome",
+                      ["cache", "stage", "result"])
+    hit_rate = Gauge("readume_cache_hit_rate", "Cache hit rate by stage", ["cache", "stage"])
+    size = Gauge("readume_cache_bytes", "Cache size by tier", ["cache", "tier"])
+    evictions = Counter("readume_cache_evictions_total", "Cache evictions by tier", ["cache", "tier"])
+    for cache, stats in caches.items():
+        if stats is None:
+            continue
+        for stage, counters in stats["stages"].items():
+            for result in ("memory_hits", "disk_hits", "misses"):
+                lookups.inc(counters.get(result, 0), cache=cache, stage=stage, result=result)
+            hit_rate.set(counters["hit_rate"], cache=cache, stage=stage)
+        for tier in ("memory", "disk"):
+            size.set(stats[tier]["bytes"], cache=cache, tier=tier)
+            evictions.inc(stats[tier]["evictions"], cache=cache, tier=tier)
+    return [lookups, hit_rate, size, evictions]
+
+def collect_model_metrics():
+    loaded = Gauge("readume_model_loaded", "1 once a model is loaded in this process", ["model"])
+    load_time = Gauge("readume_model_load_seconds", "Time taken to load each model", ["model"])
+    resident = Gauge("readume_model_resident_bytes", "Resident memory added by loading each model", ["model"])
+    warmup = Gauge("readume_model_warmup_seconds", "Time taken by each model's warmup inference", ["model"])
+    for name, info in model_stats().items():
+        loaded.set(int(info["loaded"]), model=name)
+        if info["loaded"]:
+            load_time.set(info["load_time_seconds"], model=name)
+            resident.set(info["resident_bytes"], model=name)
+        if "warmup_seconds" in info:
+            warmup.set(info["warmup_seconds"], model=name)
+    return [loaded, load_time, resident, warmup]
+
+metrics_registry.register_collector(collect_cache_metrics)
+metrics_registry.register_collector(collect_model_metrics)
+
+# Heavy models are loaded on first use, or in the background at startup
+PRELOAD_MODELS = os.environ.get('READUME_PRELOAD_MODELS', '1') == '1'
+WARMUP_MODELS = os.environ.get('READUME_WARMUP', '0') == '1'
+
+# Stages reported as progress by run_analysis
+ANALYSIS_STAGES = ("extract_text", "extract_skills", "recommend_jobs")
+
+def run_analysis(file_bytes, filename, pdf_path=None, progress=None):
+    """
+    Run the full analysis for an uploaded PDF, reusing cached stages.
+    progress(stage, state) is called as each stage starts and finishes.
+    """
+    report = progress or (lambda stage, state: None)
+    started = time.perf_counter()
+    cache_key = hash_bytes(file_bytes)
+    
+    # Reuse a previous analysis of the same PDF bytes
+    results = get_cached_analysis(cache_key, started)
+    if results is not None:
+        for stage in ANALYSIS_STAGES:
+            report(stage, "cached")
+        return results
+    
+    report("extract_text", "running")
+    resume_text, pages = get_cached_text(cache_key, file_bytes, pdf_path)
+    report("extract_text", "done")
+    
+    report("extract_skills", "running")
+    resume_skills = get_cached_skills(cache_key, resume_text)
+    report("extract_skills", "done")
+    
+    report("recommend_jobs", "running")
+    results = analyze_resume(filename, resume_text=resume_text, extracted_skills=resume_skills)
+    results['text_extraction'] = pages
+    report("recommend_jobs", "done")
+    
+    if 'error' not in results:
+        cache_analysis(cache_key, results)
+    return results
+
+# 📌 Asynchronous analysis queue (SQLite-backed, local worker threads)
+ASYNC_ANALYSIS = os.environ.get('READUME_ASYNC_ANALYSIS', '0') == '1'
+ANALYSIS_WORKERS = int(os.environ.get('READUME_ANALYSIS_WORKERS', 2))
+ANALYSIS_MAX_QUEUED = int(os.environ.get('READUME_ANALYSIS_MAX_QUEUED', 32))
+ANALYSIS_RETENTION_HOURS = float(os.environ.get('READUME_ANALYSIS_RETENTION_HOURS', 7 * 24))
+
+_analysis_queue = None
+_analysis_queue_lock = threading.Lock()
+
+def analysis_task(file_path, progress):
+    with open(file_path, 'rb') as f:
+        file_bytes = f.read()
+    try:
+        return run_analysis(file_bytes, os.path.basename(file_path), file_path, progress)
+    except OcrMemoryLimitError as e:
+        # Same status the synchronous endpoint answers with, so clients can tell it from a crash
+        return {"error": str(e), "status_code": 413}
+
+def get_analysis_queue():
+    """Return the analysis queue, starting its workers on first use"""
+    global _analysis_queue
+    with _analysis_queue_lock:
+        if _analysis_queue is None:
+            _analysis_queue = AnalysisQueue(
+                db_path=os.path.join(UPLOAD_FOLDER, "jobs", "analysis_jobs.db"),
+                upload_dir=os.path.join(UPLOAD_FOLDER, "jobs"),
+                task=analysis_task,
+                workers=ANALYSIS_WORKERS,
+                max_queued=ANALYSIS_MAX_QUEUED,
+                retention=ANALYSIS_RETENTION_HOURS * 3600
+            )
+            _analysis_queue.start()
+        return _analysis_queue
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
+    # Liveness only: answers as soon as the server is up, even while models load
     return jsonify({"status": "ok", "message": "Flask server is running"})
 
+@app.route('/api/ready', methods=['GET'])
+def readiness_check():
+    # Readiness: every registered model is loaded
+    models = model_stats()
+    ready = all(info["loaded"] for info in models.values())
+    return jsonify({"ready": ready, "models": models}), (200 if ready else 503)
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    # Prometheus text exposition format
+    return Response(metrics_registry.render(), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/api/cache-stats', methods=['GET'])
+def cache_stats():
+    stats = result_cache.stats()
+    stats["chunks"] = chunk_cache_stats()
+    return jsonify(stats)
+
 @app.route('/api/analyze-resume', methods=['POST'])
 def api_analyze_resume():
     if 'resume' not in request.files:
@@ -41,19 +303,199 @@ def api_analyze_resume():
         return jsonify({"error": "File must be a PDF"}), 400
     
     try:
-        # Save the uploaded file
+        file_bytes = file.read()
         filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(file_path)
         
-        # Analyze the resume
-        results = analyze_resume(file_path)
+        # Job-queue mode: enqueue the analysis and return a job id straight away
+        if ASYNC_ANALYSIS or request.values.get('async', '').lower() in ('1', 'true', 'yes'):
+            try:
+                job_id = get_analysis_queue().submit(file_bytes, filename)
+            except QueueFullError as e:
+                return jsonify({"error": str(e)}), 503
+            return jsonify({
+                "job_id": job_id,
+                "status": STATUS_QUEUED,
+                "status_url": f"/api/analyze-resume/{job_id}"
+            }), 202
         
+        results = run_analysis(file_bytes, filename)
         return jsonify(results)
     
+    except OcrMemoryLimitError as e:
+        return jsonify({"error": str(e)}), 413
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/analyze-resume/<job_id>', methods=['GET'])
+def api_analysis_status(job_id):
+    job = get_analysis_queue().get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown analysis job"}), 404
+    return jsonify(job)
+
+# 📌 Bulk analysis: text extraction runs on a thread pool (each PDF's OCR pages
+# go to the shared OCR process pool); resumes are then scored in micro-batches
+BATCH_EXTRACT_WORKERS = int(os.environ.get('READUME_BATCH_EXTRACT_WORKERS', 4))
+BATCH_SCORE_SIZE = int(os.environ.get('READUME_BATCH_SCORE_SIZE', 16))
+BATCH_MAX_FILES = int(os.environ.get('READUME_BATCH_MAX_FILES', 1000))
+# Ceiling on the total uncompressed size of the PDFs inside uploaded zip archives
+BATCH_MAX_UNCOMPRESSED_BYTES = int(os.environ.get('READUME_BATCH_MAX_UNCOMPRESSED_MB', 1024)) * 1024 * 1024
+
+class BatchUploadError(ValueError):
+    """Raised when a batch upload is over the file-count or uncompressed-size limit"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+def collect_batch_uploads(files, archives):
+    """
+    Return [(filename, read)] for every PDF in the upload, expanding zip
+    archives; read() returns the file's bytes, or is None for a file over
+    the per-file limit. Nothing is decompressed here: archives are checked
+    against the file-count and total-size limits from their directory, and
+    opened archives are appended to archives for the caller to close once
+    the members have been read.
+    """
+    uploads = []
+    uncompressed = 0
+    for file in files:
+        name = file.filename or ''
+        if name.lower().endswith('.zip'):
+            archive = zipfile.ZipFile(file.stream)
+            archives.append(archive)
+            for member in archive.infolist():
+                if member.is_dir() or not member.filename.lower().endswith('.pdf'):
+                    continue
+                if member.file_size > app.config['MAX_CONTENT_LENGTH']:
+                    uploads.append((member.filename, None))
+                else:
+                    # zipfile stops decompressing at the declared size, so this total is a hard bound
+                    uncompressed += member.file_size
+                    uploads.append((member.filename, functools.partial(archive.read, member)))
+                if uncompressed > BATCH_MAX_UNCOMPRESSED_BYTES:
+                    raise BatchUploadError(
+                        f"Archives expand to more than {BATCH_MAX_UNCOMPRESSED_BYTES // (1024 * 1024)} MB", 413)
+                if len(uploads) > BATCH_MAX_FILES:
+                    raise BatchUploadError(f"Too many resumes, the limit is {BATCH_MAX_FILES}")
+        elif name.lower().endswith('.pdf'):
+            uploads.append((name, file.read))
+            if len(uploads) > BATCH_MAX_FILES:
+                raise BatchUploadError(f"Too many resumes, the limit is {BATCH_MAX_FILES}")
+    return uploads
+
+def extract_for_batch(index, filename, read, started):
+    """
+    Extraction stage of the batch pipeline; the upload is only read here, on
+    the pool. started is when the batch started (time.perf_counter()).
+    """
+    file_bytes = read()
+    cache_key = hash_bytes(file_bytes)
+    cached = get_cached_analysis(cache_key, started)
+    if cached is not None:
+        return {"index": index, "filename": filename, "cache_key": cache_key, "analysis": cached}
+    resume_text, pages = get_cached_text(cache_key, file_bytes)
+    return {"index": index, "filename": filename, "cache_key": cache_key,
+            "text": resume_text, "pages": pages}
+
+def score_batch(items):
+    """Skill extraction and classification stage for a micro-batch; yields finished rows"""
+    skills_lists = [result_cache.get(item["cache_key"], "skills") for item in items]
+    missing = [i for i, skills in enumerate(skills_lists) if skills is None]
+    if missing:
+        extracted = get_skills_batch([items[i]["text"] for i in missing])
+        for i, skills in zip(missing, extracted):
+            skills_lists[i] = skills
+            result_cache.set(items[i]["cache_key"], "skills", skills)
+    
+    analyses = analyze_resume_batch([item["text"] for item in items], skills_lists)
+    for item, analysis in zip(items, analyses):
+        analysis['text_extraction'] = item["pages"]
+        cache_analysis(item["cache_key"], analysis)
+        yield {"index": item["index"], "filename": item["filename"], "result": analysis}
+
+def ndjson_line(record):
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+@app.route(BATCH_ROUTE, methods=['POST'])
+def api_analyze_resumes_batch():
+    files = request.files.getlist('resumes') + request.files.getlist('resume')
+    if not files:
+        return jsonify({"error": "No resume files provided"}), 400
+    
+    archives = []
+    
+    def close_archives():
+        for archive in archives:
+            archive.close()
+    
+    try:
+        uploads = collect_batch_uploads(files, archives)
+    except zipfile.BadZipFile:
+        close_archives()
+        return jsonify({"error": "Invalid zip archive"}), 400
+    except BatchUploadError as e:
+        close_archives()
+        return jsonify({"error": str(e)}), e.status
+    
+    if not uploads:
+        close_archives()
+        return jsonify({"error": "No PDF files found in the upload"}), 400
+    
+    def generate():
+        try:
+            yield from generate_rows()
+        finally:
+            close_archives()
+    
+    def generate_rows():
+        pending = []
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=BATCH_EXTRACT_WORKERS) as pool:
+            futures = {}
+            for index, (filename, read) in enumerate(uploads):
+                if read is None:
+                    yield ndjson_line({"index": index, "filename": filename, "error": "File too large"})
+                    continue
+                futures[pool.submit(extract_for_batch, index, filename, read, started)] = (index, filename)
+            
+            # Rows are streamed as soon as they finish, not in upload order
+            for future in as_completed(futures):
+                index, filename = futures[future]
+                try:
+                    item = future.result()
+                except OcrMemoryLimitError as e:
+                    yield ndjson_line({"index": index, "filename": filename, "error": str(e), "status_code": 413})
+                    continue
+                except Exception as e:
+                    yield ndjson_line({"index": index, "filename": filename, "error": str(e)})
+                    continue
+                
+                if "analysis" in item:
+                    yield ndjson_line({"index": index, "filename": filename, "result": item["analysis"]})
+                    continue
+                
+                pending.append(item)
+                if len(pending) >= BATCH_SCORE_SIZE:
+                    batch, pending = pending, []
+                    yield from score_batch_lines(batch)
+        
+        if pending:
+            yield from score_batch_lines(pending)
+    
+    def score_batch_lines(batch):
+        done = set()
+        try:
+            for row in score_batch(batch):
+                done.add(row["index"])
+                yield ndjson_line(row)
+        except Exception as e:
+            for item in batch:
+                if item["index"] not in done:
+                    yield ndjson_line({"index": item["index"], "filename": item["filename"], "error": str(e)})
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 @app.route('/api/extract-skills', methods=['POST'])
 def api_extract_skills():
     if 'resume' not in request.files:
@@ -68,22 +510,17 @@ def api_extract_skills():
         return jsonify({"error": "File must be a PDF"}), 400
     
     try:
-        # Save the uploaded file to a temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp:
-            file.save(temp.name)
-            temp_path = temp.name
+        file_bytes = file.read()
+        cache_key = hash_bytes(file_bytes)
         
-        # Extract text from PDF
-        resume_text = extract_text_from_pdf(temp_path)
+        # Extract text and skills (cached by content hash)
+        resume_text, pages = get_cached_text(cache_key, file_bytes)
+        skills = get_cached_skills(cache_key, resume_text)
         
-        # Extract skills
-        skills = get_skills(resume_text)
-        
-        # Clean up the temporary file
-        os.unlink(temp_path)
-        
-        return jsonify({"skills": skills})
+        return jsonify({"skills": skills, "text_extraction": pages})
     
+    except OcrMemoryLimitError as e:
+        return jsonify({"error": str(e)}), 413
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -105,28 +542,28 @@ def analyze_resume_skills():
         return jsonify({"error": "File must be a PDF"}), 400
     
     try:
-        # Save the uploaded file to a temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp:
-            file.save(temp.name)
-            temp_path = temp.name
+        file_bytes = file.read()
+        cache_key = hash_bytes(file_bytes)
         
-        # Extract text and skills from resume
-        resume_text = extract_text_from_pdf(temp_path)
-        resume_skills = get_skills(resume_text)
+        # Extract text and skills from resume (cached by content hash)
+        resume_text, _ = get_cached_text(cache_key, file_bytes)
+        resume_skills = get_cached_skills(cache_key, resume_text)
         
-        # Load the trained model
-        model_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "job_recommender.pkl")
-        model = joblib.load(model_path)
+        # Get the trained model (loaded once per process)
+        model = get_model("job_recommender")
         
         # Convert skills to the format expected by the model
         resume_skills_text = ", ".join(resume_skills)
         job_skills_list = [skill.strip() for skill in job_skills.split(',')]
         
-        # Use TF-IDF vectorizer (same as in training)
-        vectorizer = TfidfVectorizer(stop_words='english')
-        
-        # Calculate similarity between resume skills and job skills
-        skills_matrix = vectorizer.fit_transform([resume_skills_text, job_skills])
+        # Calculate similarity between resume skills and job skills, using the
+        # IDF weights of the persistent posting index when it has been built
+        job_index = get_model("job_index")
+        if len(job_index):
+            skills_matrix = job_index.vectorize([resume_skills_text, job_skills])
+        else:
+            vectorizer = TfidfVectorizer(stop_words='english')
+            skills_matrix = vectorizer.fit_transform([resume_skills_text, job_skills])
         similarity_score = cosine_similarity(skills_matrix[0:1], skills_matrix[1:2])[0][0]
         
         # Get model prediction score
@@ -151,9 +588,6 @@ def analyze_resume_skills():
                                   skill.lower() in res_skill.lower() 
                                   for res_skill in resume_skills)]
         
-        # Clean up temporary file
-        os.unlink(temp_path)
-        
         return jsonify({
             'analysis': {
                 'matchScore': round(match_score, 2),
@@ -164,9 +598,141 @@ def analyze_resume_skills():
             }
         })
         
+    except OcrMemoryLimitError as e:
+        return jsonify({"error": str(e)}), 413
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+# Maximum number of postings /api/match-jobs returns
+MATCH_JOBS_MAX_K = 100
+
+@app.route('/api/match-jobs', methods=['POST'])
+def api_match_jobs():
+    """Return the top-k indexed postings for a resume upload, a skills list or raw text"""
+    try:
+        if 'resume' in request.files:
+            file = request.files['resume']
+            if not file.filename.lower().endswith('.pdf'):
+                return jsonify({"error": "File must be a PDF"}), 400
+            file_bytes = file.read()
+            cache_key = hash_bytes(file_bytes)
+            resume_text, _ = get_cached_text(cache_key, file_bytes)
+            skills = get_cached_skills(cache_key, resume_text)
+            query_text = ", ".join(skills) + "\n" + resume_text
+            params = request.form
+        else:
+            data = request.get_json(silent=True)
+            if data is None:
+                data = {}
+            if not isinstance(data, dict):
+                return jsonify({"error": "Request body must be a JSON object"}), 400
+            skills = data.get('skills') or []
+            if not isinstance(skills, list):
+                return jsonify({"error": "Skills must be a list"}), 400
+            query_text = ", ".join(skills) + "\n" + (data.get('text') or '')
+            params = data
+        
+        if not query_text.strip():
+            return jsonify({"error": "No resume, skills or text provided"}), 400
+        
+        try:
+            k = min(max(int(params.get('k', 10)), 1), MATCH_JOBS_MAX_K)
+        except (TypeError, ValueError):
+            return jsonify({"error": "k must be an integer"}), 400
+        
+        # "lexical" = sparse TF-IDF index, "semantic" = dense LSA + IVF index
+        mode = params.get('mode', 'lexical')
+        if mode == 'semantic':
+            index = get_semantic_index()
+            if index is None or not len(index):
+                return jsonify({"error": "Semantic index has not been built (run training/build_semantic_index.py)"}), 503
+        elif mode == 'lexical':
+            index = get_model("job_index")
+            if not len(index):
+                return jsonify({"error": "Job index has not been built (run training/build_job_index.py)"}), 503
+        else:
+            return jsonify({"error": "mode must be 'lexical' or 'semantic'"}), 400
+        
+        start = time.perf_counter()
+        top = index.top_k(query_text, k)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        
+        matches = [dict(index.posting(row), score=round(score, 4)) for row, score in top]
+        return jsonify({"matches": matches, "mode": mode, "indexed_postings": len(index),
+                        "query_time_ms": round(elapsed_ms, 2)})
+    
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+# 📌 Jobs feed: the scraped CSV held as an indexed, column-oriented catalog
+JOBS_DEFAULT_LIMIT = 50
+JOBS_MAX_LIMIT = int(os.environ.get('READUME_JOBS_MAX_LIMIT', 500))
+
+def jobs_etag(catalog, *parts):
+    digest = hashlib.sha1("\x1f".join([catalog.version, *map(str, parts)]).encode("utf-8")).hexdigest()
+    return digest[:24]
+
+def not_modified_or(etag, build_response):
+    """Answer 304 when the client already has this version, otherwise build the response"""
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = build_response()
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/api/jobs', methods=['GET'])
+def api_jobs():
+    """
+    Page through scraped jobs.
+
+    Query parameters: title, location, company, skill (comma-separated, all
+    required) filters; fields (comma-separated columns to return); limit;
+    cursor (next_cursor of the previous page).
+    """
+    catalog = get_job_catalog()
+    if catalog is None:
+        return jsonify({"jobs": [], "total": 0, "next_cursor": None})
+    
+    try:
+        limit = min(max(int(request.args.get('limit', JOBS_DEFAULT_LIMIT)), 1), JOBS_MAX_LIMIT)
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    
+    fields = [f.strip() for f in request.args.get('fields', '').split(',') if f.strip()] or None
+    unknown = [f for f in fields or [] if f not in catalog.values]
+    if unknown:
+        return jsonify({"error": f"Unknown fields: {', '.join(unknown)}"}), 400
+    
+    filters = {name: request.args.get(name, '').strip() for name in JOB_FILTERS}
+    unsearchable = unsearchable_filters(filters)
+    if unsearchable:
+        return jsonify({"error": f"Filter values must contain letters or digits: {', '.join(unsearchable)}"}), 400
+    cursor = request.args.get('cursor')
+    try:
+        after = catalog.decode_cursor(cursor) if cursor else -1
+    except CursorError as e:
+        return jsonify({"error": str(e)}), 410
+    
+    etag = jobs_etag(catalog, sorted(filters.items()), fields, limit, after)
+    
+    def build_response():
+        rows, total, has_more = catalog.query(filters, after, limit)
+        return jsonify({
+            "jobs": [catalog.row(row, fields) for row in rows],
+            "total": total,
+            "next_cursor": catalog.encode_cursor(rows[-1]) if has_more else None,
+        })
+    return not_modified_or(etag, build_response)
+
+@app.route('/api/jobs/<int:job_id>', methods=['GET'])
+def api_job(job_id):
+    catalog = get_job_catalog()
+    if catalog is None or not 0 <= job_id < len(catalog):
+        return jsonify({"error": "Job not found"}), 404
+    return not_modified_or(jobs_etag(catalog, job_id), lambda: jsonify(catalog.row(job_id)))
+
 @app.route('/api/job-recommendations', methods=['POST'])
 def api_job_recommendations():
     data = request.json
@@ -183,16 +749,8 @@ def api_job_recommendations():
         # Create a mock resume text with the provided skills
         mock_resume_text = "Skills: " + ", ".join(skills)
         
-        # Use the analyze_resume function but with our mock resume
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.txt') as temp:
-            temp.write(mock_resume_text.encode('utf-8'))
-            temp_path = temp.name
-        
-        # Analyze the mock resume to get job recommendations
-        results = analyze_resume(temp_path)
-        
-        # Clean up the temporary file
-        os.unlink(temp_path)
+        # Analyze the mock resume text directly; there is no PDF to extract
+        results = analyze_resume(None, resume_text=mock_resume_text, extracted_skills=skills)
         
         # Return only the job recommendations part
         return jsonify({
@@ -202,29 +760,6 @@ def api_job_recommendations():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
-# Add this new route to your existing server.py
-from transformers import AutoModelForCausalLM, AutoTokenizer
-import torch
-
-# Initialize the model and tokenizer
-model_name = "microsoft/DialoGPT-medium"  # You can change this to other models
-tokenizer = AutoTokenizer.from_pretrained(model_name)
-model = AutoModelForCausalLM.from_pretrained(model_name)
-
-# Add this function for text generation
-def generate_response(prompt):
-    inputs = tokenizer.encode(prompt + tokenizer.eos_token, return_tensors='pt')
-    outputs = model.generate(
-        inputs, 
-        max_length=1000,
-        pad_token_id=tokenizer.eos_token_id,
-        temperature=0.7,
-        num_return_sequences=1
-    )
-    response = tokenizer.decode(outputs[0], skip_special_tokens=True)
-    print(response)
-    return response
-
 # Update your chat route
 genai.configure(api_key='YOUR_API_KEY')
 model = genai.GenerativeModel('gemini-2.0-flash')
@@ -284,4 +819,7 @@ def gemini_recommendations():
  
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
+    # With the debug reloader only the child process (WERKZEUG_RUN_MAIN) serves requests
+    if PRELOAD_MODELS and os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_background_loading(warmup=WARMUP_MODELS)
     app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Tests import the application modules the same way the scripts do, from the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
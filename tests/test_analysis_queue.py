@@ -0,0 +1,63 @@
+import os
+import time
+import sqlite3
+import threading
+
+from analysis_queue import AnalysisQueue, STATUS_COMPLETED, STATUS_QUEUED, STATUS_RUNNING
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_second_queue_leaves_live_jobs_alone(tmp_path):
+    db_path, upload_dir = str(tmp_path / "jobs.db"), str(tmp_path / "uploads")
+    release = threading.Event()
+
+    def blocked(file_path, progress):
+        release.wait(5)
+        return {"ok": True}
+
+    first = AnalysisQueue(db_path, upload_dir, blocked, workers=1, max_queued=4)
+    first.start()
+    job_ids = [first.submit(b"%PDF-1.4", f"{i}.pdf") for i in range(3)]
+    assert wait_for(lambda: first.get(job_ids[0])["status"] == STATUS_RUNNING)
+
+    # A sibling process starting on the same database, with no room to spare
+    second = AnalysisQueue(db_path, upload_dir, lambda *args: {"ok": True}, workers=1, max_queued=1)
+    second.start()
+    time.sleep(0.2)
+
+    assert [first.get(job_id)["status"] for job_id in job_ids] == [STATUS_RUNNING, STATUS_QUEUED, STATUS_QUEUED]
+    assert len(os.listdir(upload_dir)) == 3
+    assert second.stats()["recovery_backlog"] == 0
+
+    release.set()
+    assert wait_for(lambda: all(first.get(job_id)["status"] == STATUS_COMPLETED for job_id in job_ids))
+
+
+def test_jobs_of_a_dead_owner_run_once_even_when_the_queue_is_full(tmp_path):
+    db_path, upload_dir = str(tmp_path / "jobs.db"), str(tmp_path / "uploads")
+    stopped = AnalysisQueue(db_path, upload_dir, None, max_queued=8)
+    job_ids = [stopped.submit(b"%PDF-1.4", f"{i}.pdf") for i in range(4)]
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE analysis_jobs SET owner = 'gone/1/1'")
+        conn.execute("UPDATE analysis_jobs SET status = ? WHERE id = ?", (STATUS_RUNNING, job_ids[0]))
+
+    runs = []
+
+    def task(file_path, progress):
+        runs.append(file_path)
+        return {"ok": True}
+
+    recovered = AnalysisQueue(db_path, upload_dir, task, workers=1, max_queued=1)
+    recovered.start()
+
+    assert wait_for(lambda: all(recovered.get(job_id)["status"] == STATUS_COMPLETED for job_id in job_ids))
+    assert len(runs) == len(set(runs)) == 4
+    assert os.listdir(upload_dir) == []
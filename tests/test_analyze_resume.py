@@ -0,0 +1,15 @@
+import pytest
+
+# analyze_resume pulls in the OCR and model stack at import time
+analyze_resume = pytest.importorskip("analyze_resume")
+
+
+@pytest.mark.parametrize("skill", ["MySQL", "PostgreSQL", "NoSQL", "Python3", "ReactJS", "NodeJS",
+                                   "Dockerfile", "SQLAlchemy"])
+def test_keywords_inside_a_skill_make_it_technical(skill):
+    assert analyze_resume.categorize_skills([skill]) == {"technical": [skill], "soft": [], "domain": []}
+
+
+def test_categories():
+    categories = analyze_resume.categorize_skills(["Python", "Team Leadership", "Accounting"])
+    assert categories == {"technical": ["Python"], "soft": ["Team Leadership"], "domain": ["Accounting"]}
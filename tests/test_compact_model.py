@@ -0,0 +1,49 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+
+from sklearn.pipeline import Pipeline
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from processing.compact_model import export_compact_model, load_compact_model
+
+SKILLS = {
+    "Data Scientist": ["python, pandas, machine learning", "python, statistics, sql", "deep learning, python"],
+    "Backend Developer": ["java, spring, sql", "python, django, postgresql", "node.js, express, mongodb"],
+    "DevOps Engineer": ["docker, kubernetes, aws", "terraform, aws, linux", "jenkins, docker, git"],
+    "Frontend Developer": ["react, javascript, css", "angular, typescript, html", "vue, javascript, css"],
+}
+QUERIES = ["python, sql", "docker, aws, python", "react, css", "rust", "", "java spring docker kubernetes"]
+
+
+def train(classes, **classifier_args):
+    texts = [text for title in classes for text in SKILLS[title]]
+    labels = [title for title in classes for _ in SKILLS[title]]
+    pipeline = Pipeline([
+        ("tfidf", TfidfVectorizer(ngram_range=(1, 2), sublinear_tf=True)),
+        ("clf", LogisticRegression(max_iter=1000, **classifier_args)),
+    ])
+    return pipeline.fit(texts, labels)
+
+
+@pytest.mark.parametrize("classes", [list(SKILLS), ["Data Scientist", "DevOps Engineer"]],
+                         ids=["multiclass", "binary"])
+def test_predict_proba_matches_pipeline(tmp_path, classes):
+    pipeline = train(classes)
+    export_compact_model(pipeline, str(tmp_path))
+    scorer = load_compact_model(str(tmp_path))
+
+    assert list(scorer.classes_) == list(pipeline.classes_)
+    np.testing.assert_allclose(scorer.predict_proba(QUERIES), pipeline.predict_proba(QUERIES), atol=1e-5)
+
+
+def test_top_k_is_sorted_by_probability(tmp_path):
+    pipeline = train(list(SKILLS))
+    export_compact_model(pipeline, str(tmp_path))
+    scorer = load_compact_model(str(tmp_path))
+
+    top = scorer.top_k("docker, kubernetes, aws", k=2)
+    assert top[0][0] == "DevOps Engineer"
+    assert top[0][1] >= top[1][1]
@@ -0,0 +1,40 @@
+import sqlite3
+
+from scraping.job_store import JobStore, NEW, UNCHANGED, card_key
+
+LINK = "https://in.linkedin.com/jobs/view/data-scientist-at-acme-3912345678"
+
+
+def card(link):
+    return {"title": "Data Scientist", "company": "Acme", "location": "Bengaluru", "link": link}
+
+
+def listing(link, skills="Python, SQL"):
+    return {"job_title": "Data Scientist", "company_name": "Acme", "job_skills": skills, "job_link": link}
+
+
+def test_tracking_parameters_do_not_split_a_posting(tmp_path):
+    first = card(f"{LINK}?refId=abc%3D%3D&trackingId=xyz&position=1&pageNum=0")
+    second = card(f"{LINK}/?refId=def&trackingId=uvw&position=7&pageNum=0#top")
+    assert card_key(first) == card_key(second) == LINK
+
+    store = JobStore(str(tmp_path / "jobs.db"))
+    assert store.upsert(first, listing(first["link"]), seen_at=1.0) == NEW
+    assert not store.needs_detail(second)
+    assert store.get(second) == listing(first["link"])
+    assert store.upsert(second, listing(first["link"]), seen_at=2.0) == UNCHANGED
+    assert store.stats() == {"jobs": 1, "with_details": 1, "sightings": 2}
+
+
+def test_rows_keyed_by_raw_links_are_merged_on_open(tmp_path):
+    db_path = str(tmp_path / "jobs.db")
+    JobStore(db_path).close()
+    with sqlite3.connect(db_path) as conn:
+        for seen_at, query in ((1.0, "?trackingId=a"), (5.0, "?trackingId=b")):
+            conn.execute("INSERT INTO jobs VALUES (?, 'f', '{}', 1, ?, ?, ?)", (LINK + query, seen_at, seen_at, seen_at))
+            conn.execute("INSERT INTO sightings VALUES (?, ?, NULL, NULL)", (LINK + query, seen_at))
+
+    store = JobStore(db_path)
+    assert store.stats() == {"jobs": 1, "with_details": 1, "sightings": 2}
+    row = store._conn.execute("SELECT job_link, first_seen, last_seen FROM jobs").fetchone()
+    assert tuple(row) == (LINK, 1.0, 5.0)
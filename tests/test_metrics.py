@@ -0,0 +1,61 @@
+from processing.metrics import MetricsRegistry, Counter
+
+
+def test_counter_and_gauge_render_with_escaped_labels():
+    registry = MetricsRegistry()
+    requests = registry.counter("app_requests_total", "Requests served", ["path"])
+    requests.inc(path="/api")
+    requests.inc(2, path="/api")
+    requests.inc(path='say "hi"\n')
+    registry.gauge("app_queue_depth", "Jobs waiting").set(3)
+
+    assert registry.render().splitlines() == [
+        "# HELP app_requests_total Requests served",
+        "# TYPE app_requests_total counter",
+        'app_requests_total{path="/api"} 3',
+        'app_requests_total{path="say \\"hi\\"\\n"} 1',
+        "# HELP app_queue_depth Jobs waiting",
+        "# TYPE app_queue_depth gauge",
+        "app_queue_depth 3",
+    ]
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    latency = registry.histogram("app_latency_seconds", "Latency", ["stage"], buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        latency.observe(value, stage="ocr")
+
+    assert registry.render().splitlines()[2:] == [
+        'app_latency_seconds_bucket{stage="ocr",le="0.1"} 2',
+        'app_latency_seconds_bucket{stage="ocr",le="1.0"} 3',
+        'app_latency_seconds_bucket{stage="ocr",le="+Inf"} 4',
+        'app_latency_seconds_sum{stage="ocr"} 2.65',
+        'app_latency_seconds_count{stage="ocr"} 4',
+    ]
+
+
+def test_same_name_returns_the_same_metric():
+    registry = MetricsRegistry()
+    assert registry.counter("app_total", "Total") is registry.counter("app_total", "Total")
+
+
+def test_collector_errors_do_not_break_the_scrape():
+    registry = MetricsRegistry()
+
+    def collect():
+        counter = Counter("app_cache_hits_total", "Cache hits")
+        counter.inc(5)
+        return [counter]
+
+    def broken():
+        raise RuntimeError("cache unavailable")
+
+    registry.register_collector(collect)
+    registry.register_collector(broken)
+    assert registry.render().splitlines() == [
+        "# HELP app_cache_hits_total Cache hits",
+        "# TYPE app_cache_hits_total counter",
+        "app_cache_hits_total 5",
+        "# collector error: cache unavailable",
+    ]
@@ -0,0 +1,52 @@
+import os
+import sys
+import shutil
+import subprocess
+import textwrap
+
+import pytest
+
+pdf_text = pytest.importorskip("processing.pdf_text")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BLANK_PAGE_PDF = (
+    b"%PDF-1.4\n"
+    b"1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n"
+    b"2 0 obj << /Type /Pages /Kids [3 0 R] /Count 1 >> endobj\n"
+    b"3 0 obj << /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >> endobj\n"
+    b"trailer << /Root 1 0 R >>\n%%EOF\n"
+)
+
+
+@pytest.mark.parametrize("error, expected", [
+    (subprocess.CalledProcessError(1, ["pdftoppm"], stderr=b"Out of memory"), True),
+    (subprocess.CalledProcessError(-6, ["pdftoppm"], stderr=b""), True),
+    (subprocess.CalledProcessError(1, ["pdftoppm"], stderr=b"Syntax Error: Couldn't read xref table"), False),
+    (pdf_text.pytesseract.TesseractError(1, "Error in pixCreateNoInit: pix_malloc fail for data"), True),
+    (pdf_text.pytesseract.TesseractError(1, "Error opening data file eng.traineddata"), False),
+])
+def test_out_of_memory_failures_are_recognised(error, expected):
+    assert pdf_text._is_out_of_memory(error) is expected
+
+
+@pytest.mark.skipif(pdf_text.resource is None or not sys.platform.startswith("linux"),
+                    reason="needs RLIMIT_AS and /proc")
+@pytest.mark.skipif(shutil.which("pdftoppm") is None, reason="needs poppler's pdftoppm")
+def test_render_over_a_low_memory_limit_raises_ocr_memory_limit_error(tmp_path):
+    pdf_path = tmp_path / "page.pdf"
+    pdf_path.write_bytes(BLANK_PAGE_PDF)
+    # A letter page at 3000 DPI is an ~840 MB image; the cap is set in a child
+    # process, as in an OCR worker, so it does not apply to the test run
+    script = textwrap.dedent(f"""
+        from processing import pdf_text
+        pdf_text._init_ocr_worker()
+        try:
+            pdf_text.ocr_page_with_stats({str(pdf_path)!r}, 1, dpi=3000)
+        except pdf_text.OcrMemoryLimitError:
+            print("limit")
+    """)
+    env = dict(os.environ, READUME_OCR_MEMORY_LIMIT_MB="16")
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env,
+                            capture_output=True, text=True, timeout=300)
+    assert result.stdout.strip() == "limit", result.stderr
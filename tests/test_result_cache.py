@@ -0,0 +1,70 @@
+import os
+
+from processing.result_cache import ResultCache, DISK_LOW_WATER_RATIO, hash_bytes
+
+
+def key(n):
+    return hash_bytes(str(n).encode("utf-8"))
+
+
+def test_memory_tier_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path), memory_max_bytes=30, disk_max_bytes=0)
+    cache.set(key(1), "text", "a" * 8)   # 10 bytes as JSON
+    cache.set(key(2), "text", "b" * 8)
+    cache.set(key(3), "text", "c" * 8)
+    assert cache.get(key(1), "text") == "a" * 8  # now the most recently used
+
+    cache.set(key(4), "text", "d" * 8)
+    assert cache.get(key(2), "text") is None
+    assert cache.get(key(1), "text") == "a" * 8
+    stats = cache.stats()
+    assert stats["memory"]["evictions"] == 1
+    assert stats["memory"]["bytes"] <= 30
+
+
+def test_memory_tier_is_sized_in_utf8_bytes(tmp_path):
+    cache = ResultCache(str(tmp_path), memory_max_bytes=30, disk_max_bytes=0)
+    cache.set(key(1), "text", "é" * 8)   # 10 characters, 18 bytes as JSON
+    cache.set(key(2), "text", "é" * 8)
+    assert cache.stats()["memory"]["bytes"] == 18
+    assert cache.get(key(1), "text") is None
+    assert cache.get(key(2), "text") == "é" * 8
+
+
+def test_disk_hit_is_promoted_to_memory(tmp_path):
+    cache = ResultCache(str(tmp_path), memory_max_bytes=1024, disk_max_bytes=1024)
+    cache.set(key(1), "skills", {"skills": ["Python"]})
+
+    reopened = ResultCache(str(tmp_path), memory_max_bytes=1024, disk_max_bytes=1024)
+    assert reopened.get(key(1), "skills") == {"skills": ["Python"]}
+    assert reopened.get(key(1), "skills") == {"skills": ["Python"]}
+    counters = reopened.stats()["stages"]["skills"]
+    assert (counters["disk_hits"], counters["memory_hits"]) == (1, 1)
+
+
+def test_disk_tier_evicts_oldest_access_down_to_low_water_mark(tmp_path):
+    entry = "x" * 98  # 100 bytes as JSON
+    cache = ResultCache(str(tmp_path), memory_max_bytes=0, disk_max_bytes=1000)
+    for n in range(10):
+        cache.set(key(n), "text", entry)
+        # Distinct access times, oldest first
+        os.utime(cache._disk_path(key(n), "text"), (1000 + n, 1000 + n))
+    assert cache.stats()["disk"]["evictions"] == 0
+
+    cache.set(key(10), "text", entry)
+    stats = cache.stats()
+    assert stats["disk"]["bytes"] <= 1000 * DISK_LOW_WATER_RATIO
+    assert stats["disk"]["evictions"] == 2
+    assert cache.get(key(0), "text") is None
+    assert cache.get(key(1), "text") is None
+    assert cache.get(key(2), "text") == entry
+    assert cache.get(key(10), "text") == entry
+
+
+def test_entries_are_isolated_by_stage_version(tmp_path):
+    old = ResultCache(str(tmp_path), versions={"skills": "v1"})
+    old.set(key(1), "skills", ["Python"])
+
+    new = ResultCache(str(tmp_path), versions={"skills": "v2"})
+    assert new.get(key(1), "skills") is None
+    assert ResultCache(str(tmp_path), versions={"skills": "v1"}).get(key(1), "skills") == ["Python"]
@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from processing.semantic_index import build_semantic_index, load_semantic_index, index_version
+
+TITLES = ["Data Scientist", "Backend Developer", "DevOps Engineer", "Frontend Developer"]
+SKILLS = ["python pandas machine learning statistics", "java spring sql microservices",
+          "docker kubernetes aws terraform", "react javascript css typescript"]
+
+
+def build(tmp_path):
+    documents = [f"{TITLES[i % 4]} {SKILLS[i % 4]} posting{i}" for i in range(40)]
+    vectorizer = TfidfVectorizer()
+    payload = {
+        "matrix": vectorizer.fit_transform(documents),
+        "vectorizer": vectorizer,
+        "meta": {"title": [TITLES[i % 4] for i in range(40)], "link": [f"https://jobs/{i}" for i in range(40)]},
+    }
+    index = build_semantic_index(payload, dimensions=8, lists=4)
+    index.save(str(tmp_path))
+    return index
+
+
+def test_appended_postings_are_written_in_place_and_visible_on_reload(tmp_path):
+    build(tmp_path)
+    serving = load_semantic_index(str(tmp_path))
+    embeddings_path = os.path.join(str(tmp_path), "embeddings.npy")
+    size_before, version_before = os.path.getsize(embeddings_path), serving.version
+
+    appender = load_semantic_index(str(tmp_path))
+    appender.add_postings(["DevOps Engineer docker kubernetes helm"] * 2,
+                          [{"title": "Platform Engineer", "link": "https://jobs/new1"},
+                           {"title": "Platform Engineer", "link": "https://jobs/new2"}])
+    appender.save_appended(str(tmp_path))
+
+    # Only two rows were added to the existing file, and the index the
+    # server had mapped before keeps answering with its own postings
+    assert os.path.getsize(embeddings_path) == size_before + 2 * serving.embeddings.shape[1] * 4
+    assert len(serving) == 40 and serving.top_k("docker kubernetes", 3)
+    assert index_version(str(tmp_path)) != version_before
+
+    reloaded = load_semantic_index(str(tmp_path))
+    assert len(reloaded) == 42
+    np.testing.assert_allclose(reloaded.embeddings[:40], serving.embeddings)
+    assert {reloaded.posting(row)["title"] for row, _ in reloaded.top_k("docker kubernetes helm", 2)} \
+        == {"Platform Engineer"}
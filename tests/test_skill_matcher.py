@@ -0,0 +1,45 @@
+import pytest
+
+from processing.skill_matcher import SkillMatcher
+
+SKILLS = ["Java", "JavaScript", "C", "C++", "C#", "Node.js", "Machine Learning", "Go"]
+
+
+@pytest.fixture
+def matcher():
+    return SkillMatcher(SKILLS)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("JavaScript developer", ["JavaScript"]),
+    ("Java and JavaScript", ["Java", "JavaScript"]),
+    ("Java8, JavaEE", []),
+    # "+" and "#" are not word characters, so the overlapping "C" counts too
+    ("C++ and C# experience", ["C", "C++", "C#"]),
+    ("Objective-C", ["C"]),
+    ("Built APIs in node.js", ["Node.js"]),
+    ("machine learning engineer", ["Machine Learning"]),
+    ("Google, Golang", []),
+    ("Go/Java", ["Java", "Go"]),
+])
+def test_matches_respect_word_boundaries(matcher, text, expected):
+    assert matcher.matched_skills(text) == [skill for skill in SKILLS if skill in expected]
+
+
+def test_find_all_reports_offsets_and_canonical_names(matcher):
+    assert matcher.find_all("Skills: JAVA, c++") == [(8, 12, "Java"), (14, 15, "C"), (14, 17, "C++")]
+
+
+def test_duplicate_and_blank_skills_are_ignored():
+    matcher = SkillMatcher(["Python", "python ", "", None, "SQL"])
+    assert matcher.skills == ["Python", "SQL"]
+    assert matcher.contains_any("PYTHON")
+    assert not matcher.contains_any("pythonic")
+
+
+@pytest.mark.parametrize("text", ["MySQL", "PostgreSQL", "NoSQL", "Python3", "ReactJS", "NodeJS",
+                                  "Dockerfile", "SQLAlchemy"])
+def test_substring_mode_matches_inside_words(text):
+    keywords = ["python", "react", "node", "sql", "docker"]
+    assert SkillMatcher(keywords, word_bounded=False).contains_any(text)
+    assert not SkillMatcher(keywords).contains_any(text)
@@ -0,0 +1,43 @@
+"""
+Build models/job_index.pkl, the TF-IDF index over scraped and dataset postings
+used by /api/match-jobs.
+
+Usage (from the training directory, like train_model.py):
+    python build_job_index.py
+    python build_job_index.py --csv ../data/linkedin_jobs_india.csv
+"""
+import os
+import sys
+import time
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.job_index import build_job_index, save_job_index, load_job_index
+
+DEFAULT_SOURCES = ["../data/linkedin_jobs_india.csv", "../data/job_descriptions.csv"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", nargs="+", default=DEFAULT_SOURCES, help="Posting CSV files to index")
+    parser.add_argument("--output", default="../models/job_index.pkl")
+    parser.add_argument("--max-features", type=int, default=2 ** 18)
+    parser.add_argument("--min-df", type=int, default=1)
+    args = parser.parse_args()
+
+    start_time = time.time()
+    index = build_job_index(args.csv, max_features=args.max_features, min_df=args.min_df)
+    print(f"✅ Index built in {time.time() - start_time:.2f} seconds")
+    save_job_index(index, args.output)
+
+    # Quick latency check against the saved index
+    job_index = load_job_index(args.output)
+    query = "Python, Machine Learning, SQL, Docker"
+    job_index.top_k(query, 10)
+    start = time.perf_counter()
+    for _ in range(20):
+        job_index.top_k(query, 10)
+    print(f"⚡ top-10 query over {len(job_index)} postings: {(time.perf_counter() - start) / 20 * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Build models/job_skill_index.pkl without retraining the job recommender.
+
+Usage (from the training directory, like train_model.py):
+    python build_job_skill_index.py                 # from ../data/job_descriptions.csv
+    python build_job_skill_index.py --from-model    # from ../models/job_recommender.pkl coefficients
+"""
+import os
+import sys
+import time
+import argparse
+import joblib
+import pandas as pd
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.job_skill_index import JobSkillIndexBuilder, build_index_from_model, save_index, DEFAULT_TOP_N
+
+TITLE_COLUMNS = ["Job Title", "JobTitle", "job_title"]
+SKILL_COLUMNS = ["skills", "Skills", "JobSkills", "job_skills"]
+
+
+def find_column(columns, candidates):
+    for col in candidates:
+        if col in columns:
+            return col
+    return None
+
+
+def build_from_csv(csv_path, top_n, chunksize):
+    """Stream only the title and skills columns of the CSV in chunks"""
+    header = pd.read_csv(csv_path, nrows=0).columns.tolist()
+    title_col = find_column(header, TITLE_COLUMNS)
+    skills_col = find_column(header, SKILL_COLUMNS)
+    if not title_col or not skills_col:
+        print(f"❌ Error: could not find title/skills columns in {header}")
+        sys.exit(1)
+
+    builder = JobSkillIndexBuilder()
+    rows = 0
+    for chunk in pd.read_csv(csv_path, usecols=[title_col, skills_col], chunksize=chunksize):
+        builder.add_many(chunk[title_col].fillna(""), chunk[skills_col])
+        rows += len(chunk)
+    print(f"✅ Indexed {rows} rows")
+    return builder.build(top_n)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default="../data/job_descriptions.csv")
+    parser.add_argument("--model", default="../models/job_recommender.pkl")
+    parser.add_argument("--output", default="../models/job_skill_index.pkl")
+    parser.add_argument("--from-model", action="store_true", help="Derive skills from the classifier coefficients")
+    parser.add_argument("--top-n", type=int, default=DEFAULT_TOP_N)
+    parser.add_argument("--chunksize", type=int, default=100000)
+    args = parser.parse_args()
+
+    start_time = time.time()
+    if args.from_model:
+        index = build_index_from_model(joblib.load(args.model), args.top_n)
+    else:
+        index = build_from_csv(args.csv, args.top_n, args.chunksize)
+    save_index(index, args.output)
+    print(f"✅ Done in {time.time() - start_time:.2f} seconds")
+
+
+if __name__ == "__main__":
+    main()
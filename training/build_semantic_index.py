@@ -0,0 +1,76 @@
+"""
+Build (or extend) models/semantic_index/, the dense LSA + IVF index used by
+/api/match-jobs with mode=semantic. It is derived from the TF-IDF index built
+by build_job_index.py, so run that first.
+
+Usage (from the training directory, like train_model.py):
+    python build_semantic_index.py
+    python build_semantic_index.py --append ../data/linkedin_jobs_india.csv
+"""
+import os
+import sys
+import time
+import argparse
+import joblib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.job_index import iter_postings, POSTING_SOURCES
+from processing.semantic_index import (build_semantic_index, load_semantic_index,
+                                       DEFAULT_DIMENSIONS, DEFAULT_SVD_SAMPLE)
+
+
+def append_postings(index_dir, csv_path):
+    """Add postings from csv_path that are not yet indexed (matched by link)"""
+    index = load_semantic_index(index_dir)
+    if index is None:
+        print(f"❌ Error: no semantic index found at {index_dir}")
+        sys.exit(1)
+
+    known_links = set(index.meta["link"])
+    columns = POSTING_SOURCES.get(os.path.basename(csv_path), POSTING_SOURCES["linkedin_jobs_india.csv"])
+    documents, metas = [], []
+    for document, meta in iter_postings(csv_path, columns):
+        if meta["link"] and meta["link"] in known_links:
+            continue
+        known_links.add(meta["link"])
+        documents.append(document)
+        metas.append(meta)
+
+    index.add_postings(documents, metas)
+    print(f"✅ Appended {len(documents)} new postings")
+    # Only the new embedding rows are written; a running server picks the
+    # new postings up within READUME_SEMANTIC_INDEX_RELOAD_SECONDS
+    index.save_appended(index_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--job-index", default="../models/job_index.pkl")
+    parser.add_argument("--output", default="../models/semantic_index")
+    parser.add_argument("--dimensions", type=int, default=DEFAULT_DIMENSIONS)
+    parser.add_argument("--lists", type=int, default=None, help="Number of IVF lists (default 4*sqrt(N))")
+    parser.add_argument("--svd-sample", type=int, default=DEFAULT_SVD_SAMPLE)
+    parser.add_argument("--append", metavar="CSV", help="Append new postings from CSV instead of rebuilding")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    if args.append:
+        append_postings(args.output, args.append)
+    else:
+        payload = joblib.load(args.job_index)
+        index = build_semantic_index(payload, dimensions=args.dimensions, lists=args.lists,
+                                     svd_sample=args.svd_sample)
+        index.save(args.output)
+    print(f"✅ Done in {time.time() - start_time:.2f} seconds")
+
+    # Quick latency check against the saved index
+    index = load_semantic_index(args.output)
+    query = "deep learning, PyTorch, computer vision"
+    index.top_k(query, 10)
+    start = time.perf_counter()
+    for _ in range(20):
+        index.top_k(query, 10)
+    print(f"⚡ top-10 query over {len(index)} postings: {(time.perf_counter() - start) / 20 * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Build models/skill_vocabulary.json from the skills column of
+job_descriptions.csv. The server only loads the artifact, so run this after
+the CSV changes (the scraper also rebuilds it when it finds the CSV's size
+or modification time changed) and restart the server to pick it up.
+
+Usage (from the training directory, like train_model.py):
+    python build_skill_vocabulary.py
+    python build_skill_vocabulary.py --csv ../data/job_descriptions.csv --chunksize 200000
+"""
+import os
+import sys
+import time
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.skill_vocabulary import build_skill_vocabulary, save_skill_vocabulary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default="../data/job_descriptions.csv")
+    parser.add_argument("--output", default="../models/skill_vocabulary.json")
+    parser.add_argument("--chunksize", type=int, default=100000)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.csv):
+        print(f"❌ Error: {args.csv} not found")
+        sys.exit(1)
+
+    start_time = time.time()
+    save_skill_vocabulary(build_skill_vocabulary(args.csv, args.chunksize), args.output)
+    print(f"✅ Done in {time.time() - start_time:.2f} seconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Export models/job_recommender.pkl to the compact serving format without
+retraining (train_model.py does this automatically after training).
+
+Usage (from the training directory, like train_model.py):
+    python export_compact_model.py
+    python export_compact_model.py --prune 0.01    # drop near-zero coefficients
+"""
+import os
+import sys
+import time
+import argparse
+import joblib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.compact_model import export_compact_model
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="../models/job_recommender.pkl")
+    parser.add_argument("--output", default="../models/job_recommender_serving")
+    parser.add_argument("--prune", type=float, default=0.0,
+                        help="Store coefficients with |w| below this as zero (sparse by feature)")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    export_compact_model(joblib.load(args.model), args.output, prune_threshold=args.prune)
+    print(f"✅ Done in {time.time() - start_time:.2f} seconds")
+
+
+if __name__ == "__main__":
+    main()
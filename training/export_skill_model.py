@@ -0,0 +1,49 @@
+"""
+Save the Flan-T5 skill model to a local directory so the server loads it
+without reaching the Hugging Face hub, optionally with an ONNX export next to
+it for READUME_SKILL_BACKEND=onnx.
+
+Writes ../models/flan-t5-small (PyTorch weights + tokenizer) and, with --onnx,
+../models/flan-t5-small-onnx (encoder/decoder graphs + tokenizer).
+
+Usage (from the training directory, like train_model.py):
+    python export_skill_model.py
+    python export_skill_model.py --onnx
+"""
+import os
+import sys
+import time
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.skill_extractor import SKILL_MODEL_NAME
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=SKILL_MODEL_NAME)
+    parser.add_argument("--output", default="../models/flan-t5-small")
+    parser.add_argument("--onnx", action="store_true", help="Also export an ONNX graph to <output>-onnx")
+    args = parser.parse_args()
+
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+    start_time = time.time()
+    tokenizer = AutoTokenizer.from_pretrained(args.model)
+    model = AutoModelForSeq2SeqLM.from_pretrained(args.model)
+    tokenizer.save_pretrained(args.output)
+    model.save_pretrained(args.output)
+    print(f"✅ Saved {args.model} to {args.output}")
+
+    if args.onnx:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        onnx_dir = f"{args.output}-onnx"
+        ort_model = ORTModelForSeq2SeqLM.from_pretrained(args.output, export=True)
+        ort_model.save_pretrained(onnx_dir)
+        tokenizer.save_pretrained(onnx_dir)
+        print(f"✅ Exported ONNX graphs to {onnx_dir}")
+
+    print(f"✅ Done in {time.time() - start_time:.2f} seconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,11 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.pipeline import Pipeline
 from sklearn.metrics import accuracy_score, classification_report
 import time
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.job_skill_index import JobSkillIndexBuilder, save_index
+from processing.compact_model import export_compact_model
 
 # Start timing
 start_time = time.time()
@@ -138,6 +143,15 @@ print(f"✅ Evaluation completed in {evaluation_end - evaluation_start:.2f} seco
 # Save the Model
 joblib.dump(model_pipeline, "../models/job_recommender.pkl")
 
+# 📦 Export the compact serving format (memory-mappable, no scikit-learn unpickling)
+export_compact_model(model_pipeline, "../models/job_recommender_serving")
+
+# 📌 Build the job title -> weighted skills index used for skills_matched
+print("\n🗂️ Building job-skill index...")
+index_builder = JobSkillIndexBuilder()
+index_builder.add_many(df["JobTitle"], df["JobSkills"])
+save_index(index_builder.build(), "../models/job_skill_index.pkl")
+
 # Total time
 end_time = time.time()
 print(f"✅ Model trained, evaluated, and saved successfully! Total time: {end_time - start_time:.2f} seconds")
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+Out-of-core trainer for the job recommender.
+
+Reads job_descriptions.csv in chunks (title and skills columns only), hashes
+the skills text with a stateless HashingVectorizer and trains an SGD logistic
+regression with partial_fit over several epochs, so memory stays flat however
+large the dataset is. Every holdout_every-th row is kept out of training and
+used to report accuracy after each epoch.
+
+The saved Pipeline exposes classes_ and predict_proba like the TF-IDF one, so
+it is a drop-in replacement for models/job_recommender.pkl. Hashed features
+cannot be exported to the compact serving format, so an existing export
+(from train_model.py) is removed rather than left serving the old model.
+
+Usage (from the training directory, like train_model.py):
+    python train_streaming.py --epochs 3 --chunksize 50000
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import numpy as np
+import pandas as pd
+import joblib
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processing.job_skill_index import JobSkillIndexBuilder, save_index
+
+TITLE_COLUMNS = ["Job Title", "JobTitle", "job_title"]
+SKILL_COLUMNS = ["skills", "Skills", "JobSkills", "job_skills"]
+
+
+def find_columns(csv_path):
+    header = pd.read_csv(csv_path, nrows=0).columns.tolist()
+    title_col = next((c for c in TITLE_COLUMNS if c in header), None)
+    skills_col = next((c for c in SKILL_COLUMNS if c in header),
+                      next((c for c in header if 'skill' in c.lower()), None))
+    if not title_col or not skills_col:
+        print(f"❌ Error: could not find title/skills columns in {header}")
+        sys.exit(1)
+    return title_col, skills_col
+
+
+def iter_chunks(csv_path, title_col, skills_col, chunksize):
+    """Yield cleaned (titles, skills, row offset) chunks"""
+    offset = 0
+    for chunk in pd.read_csv(csv_path, usecols=[title_col, skills_col], chunksize=chunksize, dtype=str):
+        rows = len(chunk)
+        titles = chunk[title_col].fillna("").str.strip()
+        skills = chunk[skills_col].fillna("").astype(str)
+        keep = (titles != "") & (skills.str.strip() != "")
+        row_ids = np.arange(offset, offset + rows)[keep.to_numpy()]
+        offset += rows
+        yield titles[keep].to_numpy(), skills[keep].to_numpy(), row_ids
+
+
+def collect_classes(csv_path, title_col, skills_col, chunksize):
+    """First pass: the set of job titles (partial_fit needs all classes up front)"""
+    classes = set()
+    for titles, _, _ in iter_chunks(csv_path, title_col, skills_col, chunksize):
+        classes.update(titles)
+    return np.array(sorted(classes), dtype=object)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default="../data/job_descriptions.csv")
+    parser.add_argument("--output", default="../models/job_recommender.pkl")
+    parser.add_argument("--skill-index-output", default="../models/job_skill_index.pkl")
+    parser.add_argument("--serving-output", default="../models/job_recommender_serving",
+                        help="Compact export of the previous model, removed after training")
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--chunksize", type=int, default=50000)
+    parser.add_argument("--n-features", type=int, default=2 ** 17,
+                        help="Hashed feature space (coef_ is classes x n_features)")
+    parser.add_argument("--alpha", type=float, default=1e-6)
+    parser.add_argument("--holdout-every", type=int, default=5,
+                        help="Keep every n-th row for evaluation (0 disables)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.csv):
+        print(f"❌ Error: {args.csv} not found")
+        sys.exit(1)
+
+    start_time = time.time()
+    title_col, skills_col = find_columns(args.csv)
+    classes = collect_classes(args.csv, title_col, skills_col, args.chunksize)
+    print(f"✅ Found {len(classes)} job titles in {time.time() - start_time:.2f} seconds")
+
+    # Same n-gram range as the TF-IDF pipeline, but stateless
+    vectorizer = HashingVectorizer(
+        n_features=args.n_features,
+        ngram_range=(1, 3),
+        alternate_sign=False,
+        norm="l2",
+        dtype=np.float32
+    )
+    classifier = SGDClassifier(loss="log_loss", alpha=args.alpha, random_state=42)
+    skill_index = JobSkillIndexBuilder()
+    rng = np.random.default_rng(42)
+
+    for epoch in range(1, args.epochs + 1):
+        epoch_start = time.time()
+        trained_rows = 0
+        correct = evaluated = 0
+
+        for titles, skills, row_ids in iter_chunks(args.csv, title_col, skills_col, args.chunksize):
+            if args.holdout_every > 0:
+                holdout = row_ids % args.holdout_every == 0
+            else:
+                holdout = np.zeros(len(row_ids), dtype=bool)
+
+            # Evaluate on held-out rows with the model from before this chunk
+            if holdout.any() and hasattr(classifier, "coef_"):
+                predictions = classifier.predict(vectorizer.transform(skills[holdout]))
+                correct += int((predictions == titles[holdout]).sum())
+                evaluated += int(holdout.sum())
+
+            train = ~holdout
+            if not train.any():
+                continue
+            order = rng.permutation(np.flatnonzero(train))
+            classifier.partial_fit(vectorizer.transform(skills[order]), titles[order], classes=classes)
+            trained_rows += len(order)
+
+            if epoch == 1:
+                skill_index.add_many(titles, skills)
+
+        elapsed = time.time() - epoch_start
+        rate = trained_rows / elapsed if elapsed else 0.0
+        accuracy = f"{correct / evaluated:.4f}" if evaluated else "n/a"
+        print(f"Epoch {epoch}/{args.epochs}: {trained_rows} rows in {elapsed:.2f}s "
+              f"({rate:,.0f} rows/s), holdout accuracy {accuracy}")
+
+    model_pipeline = Pipeline([
+        ("hashing", vectorizer),
+        ("classifier", classifier)
+    ])
+    joblib.dump(model_pipeline, args.output)
+    print(f"✅ Saved streaming model to {args.output}")
+    if os.path.isdir(args.serving_output):
+        shutil.rmtree(args.serving_output)
+        print(f"✅ Removed the stale compact export at {args.serving_output} "
+              f"(READUME_SERVING_MODEL=compact falls back to the pickle)")
+
+    save_index(skill_index.build(), args.skill_index_output)
+    print(f"✅ Total time: {time.time() - start_time:.2f} seconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+WSGI entry point for production serving.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+With preload_app (set in gunicorn.conf.py) this module is imported once in
+the gunicorn master: every registered model is loaded there, the heap is
+frozen, and the workers forked afterwards share the weights copy-on-write
+instead of each loading their own copy.
+"""
+import os
+import gc
+
+# Math libraries size their thread pools when first imported, so the
+# per-worker thread budget has to be in the environment before server.py
+# pulls in numpy, scikit-learn and torch.
+WORKERS = int(os.environ.get("READUME_WORKERS", 2))
+WORKER_THREADS = int(os.environ.get("READUME_WORKER_THREADS", max(1, (os.cpu_count() or 1) // max(WORKERS, 1))))
+
+os.environ.setdefault("READUME_WORKER_THREADS", str(WORKER_THREADS))
+for _name in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMEXPR_NUM_THREADS"):
+    os.environ.setdefault(_name, str(WORKER_THREADS))
+os.environ.setdefault("READUME_SKILL_THREADS", str(WORKER_THREADS))
+os.environ.setdefault("READUME_OCR_WORKERS", str(WORKER_THREADS))
+# Tokenizers' own thread pool does not survive fork
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+from processing.model_registry import preload_models  # noqa: E402
+from server import app, PRELOAD_MODELS  # noqa: E402
+
+if PRELOAD_MODELS:
+    # Load synchronously: a background loading thread would not be carried over by fork
+    preload_models()
+
+# Objects allocated so far (models included) move to a permanent generation
+# the collector never scans, so garbage collection in a worker does not
+# write to their headers and un-share the pages.
+gc.collect()
+gc.freeze()